@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for framework hot paths (run with python -m benchmarks.<name>).
+"""
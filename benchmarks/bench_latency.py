@@ -0,0 +1,215 @@
+"""
+Benchmark: end-to-end read latency of PokemonAPIClient (NFR-01).
+
+Drives the client against a base URL (an in-process stub server by default,
+so no network is needed), with warmup requests followed by a fixed number of
+timed iterations per operation:
+
+    by-id      get_pokemon_by_id over the first --pool Pokémon
+    by-name    get_pokemon_by_name over the same Pokémon
+    list-page  list_pokemon pages of --page-size entries
+
+Per operation it reports p50/p95/p99/max latency and sequential throughput.
+Results are compared with a baseline JSON file: a gated latency percentile
+(--gate, p50 and p95 by default) that grows by more than --tolerance and by
+more than --min-delta-ms, or a throughput that drops by more than
+--tolerance, fails the run with exit status 1. When no baseline exists, or
+with --update-baseline, the results are saved as the new baseline.
+
+    python -m benchmarks.bench_latency --iterations 300
+    python -m benchmarks.bench_latency --base-url http://localhost:8000/api/v2 --update-baseline
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+from playwright.sync_api import sync_playwright
+from src.api.pokemon_client import PokemonAPIClient
+from src.core.metrics import LatencyHistogram
+from src.server.snapshot import Snapshot
+from src.server.stub_server import run_stub_server
+
+DEFAULT_BASELINE = Path("benchmarks/baselines/latency.json")
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+# p99 of a few hundred samples is a handful of requests, too noisy to gate on by default
+DEFAULT_GATED = ("p50_ms", "p95_ms")
+
+
+@dataclass
+class OperationResult:
+    """Latency percentiles (milliseconds) and throughput of one operation."""
+
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    mean_ms: float
+    throughput_rps: float
+
+
+def build_operations(client: PokemonAPIClient, pool: int, page_size: int) -> Dict[str, Callable[[int], object]]:
+    """
+    Map operation names to callables taking the iteration number.
+
+    Args:
+        client: Client under test
+        pool: Number of distinct Pokémon cycled through by the by-id/by-name operations
+        page_size: Entries per list page
+
+    Returns:
+        Operations in reporting order
+    """
+    resources = client.list_pokemon(limit=pool)["results"]
+    names = [resource["name"] for resource in resources]
+    ids = [int(resource["url"].rstrip('/').rsplit('/', 1)[-1]) for resource in resources]
+    pages = max(1, len(resources) // page_size)
+    return {
+        "by-id": lambda i: client.get_pokemon_by_id(ids[i % len(ids)]),
+        "by-name": lambda i: client.get_pokemon_by_name(names[i % len(names)]),
+        "list-page": lambda i: client.list_pokemon(limit=page_size, offset=(i % pages) * page_size),
+    }
+
+
+def run_operation(operation: Callable[[int], object], warmup: int, iterations: int) -> OperationResult:
+    """
+    Run warmup calls, then time `iterations` sequential calls.
+
+    Args:
+        operation: Callable taking the iteration number
+        warmup: Untimed calls made first (connection setup, server caches)
+        iterations: Timed calls
+
+    Returns:
+        Percentiles and throughput of the timed calls
+    """
+    for i in range(warmup):
+        operation(i)
+
+    histogram = LatencyHistogram()
+    started = time.perf_counter()
+    for i in range(iterations):
+        call_started = time.perf_counter()
+        operation(i)
+        histogram.record(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    return OperationResult(
+        iterations=iterations,
+        p50_ms=round(histogram.percentile(50) * 1000, 3),
+        p95_ms=round(histogram.percentile(95) * 1000, 3),
+        p99_ms=round(histogram.percentile(99) * 1000, 3),
+        max_ms=round(histogram.max * 1000, 3),
+        mean_ms=round(histogram.sum / iterations * 1000, 3),
+        throughput_rps=round(iterations / elapsed, 1),
+    )
+
+
+def find_regressions(current: Dict[str, OperationResult], baseline: Dict[str, dict], tolerance: float, min_delta_ms: float, metrics: Sequence[str] = DEFAULT_GATED) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    A latency metric regresses when it exceeds the baseline by more than
+    `tolerance` (relative) and by more than `min_delta_ms` (absolute), so
+    sub-millisecond jitter on a fast stub does not fail the run. Throughput
+    regresses when it drops by more than `tolerance`.
+
+    Args:
+        current: Results of this run by operation
+        baseline: Baseline "operations" mapping
+        tolerance: Allowed relative change (0.2 allows 20%)
+        min_delta_ms: Allowed absolute latency increase in milliseconds
+        metrics: Latency fields to gate on
+
+    Returns:
+        Human-readable regression descriptions (empty when the run passes)
+    """
+    regressions = []
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in metrics:
+            before, after = reference[metric], getattr(result, metric)
+            if after > before * (1 + tolerance) and after - before > min_delta_ms:
+                regressions.append(f"{name} {metric}: {before:.3f} -> {after:.3f} ms")
+        before, after = reference["throughput_rps"], result.throughput_rps
+        if after < before * (1 - tolerance):
+            regressions.append(f"{name} throughput_rps: {before:.1f} -> {after:.1f} ({after / before - 1:.0%})")
+    return regressions
+
+
+def save_baseline(path: Path, results: Dict[str, OperationResult], base_url: str, args: argparse.Namespace) -> None:
+    """Write results and run parameters as a baseline file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": base_url,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"warmup": args.warmup, "iterations": args.iterations, "pool": args.pool, "page_size": args.page_size},
+        "operations": {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=None, help="API base URL (default: an in-process stub server)")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per operation (default: 20)")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed requests per operation (default: 200)")
+    parser.add_argument("--pool", type=int, default=100, help="Distinct Pokémon cycled through (default: 100)")
+    parser.add_argument("--page-size", type=int, default=20, help="Entries per list page (default: 20)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help=f"Baseline JSON file (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--update-baseline", action="store_true", help="Save this run as the baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression (default: 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Allowed absolute latency increase (default: 0.5)")
+    parser.add_argument("--gate", nargs="+", choices=LATENCY_METRICS, default=list(DEFAULT_GATED), help="Latency percentiles that fail the run (default: p50_ms p95_ms)")
+    parser.add_argument("--output", type=Path, default=None, help="Also write this run's results as JSON")
+    args = parser.parse_args(argv)
+
+    with ExitStack() as stack:
+        base_url = args.base_url
+        if base_url is None:
+            base_url = stack.enter_context(run_stub_server(Snapshot.synthetic(pokemon_count=max(args.pool, args.page_size)))).base_url
+        playwright = stack.enter_context(sync_playwright())
+        context = playwright.request.new_context(timeout=30000)
+        stack.callback(context.dispose)
+        client = PokemonAPIClient(context, base_url=base_url)
+
+        results = {}
+        print(f"{'operation':<12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'req/s':>9}")
+        for name, operation in build_operations(client, args.pool, args.page_size).items():
+            result = results[name] = run_operation(operation, args.warmup, args.iterations)
+            print(f"{name:<12} {result.p50_ms:>9.3f} {result.p95_ms:>9.3f} {result.p99_ms:>9.3f} {result.max_ms:>9.3f} {result.throughput_rps:>9.1f}")
+
+    if args.output is not None:
+        save_baseline(args.output, results, base_url, args)
+
+    if args.update_baseline or not args.baseline.exists():
+        save_baseline(args.baseline, results, base_url, args)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline["base_url"] != base_url and args.base_url is not None:
+        print(f"Note: baseline was recorded against {baseline['base_url']}")
+    regressions = find_regressions(results, baseline["operations"], args.tolerance, args.min_delta_ms, args.gate)
+    if regressions:
+        print(f"Latency regressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
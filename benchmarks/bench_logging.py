@@ -0,0 +1,109 @@
+"""
+Benchmark: per-request logging cost of BaseAPIClient.get().
+
+Runs get() against an in-memory transport (no network) with the client
+logger writing to a file, under several logging setups, and reports the
+per-request overhead relative to a run with INFO disabled. The "eager
+f-strings" row replays the pre-change logging statements (four INFO lines
+built with f-strings) for comparison. The "blocking sink" rows use a handler whose
+writes block for 50us, like a slow terminal under pytest's log_cli; that is
+where the queue listener pays off, since the wait moves to its thread.
+
+    python -m benchmarks.bench_logging --requests 20000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+from src.core.base_api_client import BaseAPIClient
+from src.core.cassette import RecordedResponse
+from src.utils.logger import setup_logger, stop_log_listeners
+
+LOGGER_NAME = "bench.client"
+BODY = b'{"id": 25, "name": "pikachu"}'
+BLOCKING_WRITE_SECONDS = 0.00005
+
+
+class InMemoryContext:
+    """Minimal request context returning the same small JSON body for every GET."""
+
+    def get(self, url, params=None, headers=None):
+        return RecordedResponse(200, url, {"content-type": "application/json"}, BODY)
+
+
+class BlockingFileHandler(logging.FileHandler):
+    """File handler whose writes block like a slow terminal or network sink."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        time.sleep(BLOCKING_WRITE_SECONDS)
+
+
+def reset_logger(log_path: Path, level: str, use_queue: bool = False, sample_every: Optional[int] = None, blocking: bool = False) -> logging.Logger:
+    """Point the benchmark logger at a fresh file handler with the given setup."""
+    stop_log_listeners()
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.propagate = False
+    logger.addHandler((BlockingFileHandler if blocking else logging.FileHandler)(log_path, mode="w"))
+    return setup_logger(LOGGER_NAME, level=level, use_queue=use_queue, sample_every=sample_every).logger
+
+
+def legacy_logging(logger: logging.Logger, full_url: str, params, status: int) -> None:
+    """The four INFO statements get() used to emit, with eager f-strings."""
+    logger.info(f"Making GET request to {full_url} with params: {params}")
+    logger.info(f"Response status: {status}")
+    logger.info(f"Response URL: {full_url}")
+    logger.info(f"Successfully retrieved data from {full_url}")
+
+
+def time_per_call(func: Callable[[], object], count: int) -> float:
+    """Microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per scenario")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = Path(directory) / "bench.log"
+        logger = reset_logger(log_path, "WARNING")
+        client = BaseAPIClient(InMemoryContext(), base_url="http://bench.local/api/v2", logger=logger)
+
+        def get() -> object:
+            return client.get("/pokemon/25")
+
+        baseline = time_per_call(get, args.requests)
+        print(f"{'get() with INFO disabled (baseline)':<42} {baseline:>8.2f} us/request")
+
+        reset_logger(log_path, "INFO")
+        legacy = time_per_call(lambda: legacy_logging(logger, "http://bench.local/api/v2/pokemon/25", None, 200), args.requests)
+        print(f"{'eager f-strings, sync handler':<42} {legacy:>8.2f} us/request logging")
+
+        scenarios = [
+            ("lazy %-style, sync handler", dict()),
+            ("lazy %-style, queue listener", dict(use_queue=True)),
+            ("lazy %-style, queue + 1/100 sampling", dict(use_queue=True, sample_every=100)),
+            ("blocking sink, sync handler", dict(blocking=True)),
+            ("blocking sink, queue listener", dict(blocking=True, use_queue=True)),
+        ]
+        for name, options in scenarios:
+            reset_logger(log_path, "INFO", **options)
+            overhead = time_per_call(get, args.requests) - baseline
+            stop_log_listeners()  # drain the queue before the next scenario
+            print(f"{name:<42} {overhead:>8.2f} us/request logging")
+        stop_log_listeners()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: response bytes -> Pokemon model.
+
+Compares the current path (json.loads, then model_validate) with every
+registered codec, including the direct bytes path (TypeAdapter.validate_json),
+on the largest /pokemon payloads of a snapshot. Payloads come from the synthetic stub snapshot by default, or from
+a captured snapshot file (``--snapshot``), which gives realistic sizes such
+as Mew's several hundred moves.
+
+    python -m benchmarks.bench_model_validation --top 10 --repeat 7
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+from src.core.codecs import available_codecs, get_codec
+from src.models.pokemon import LazyPokemon, Pokemon
+from src.server.snapshot import Snapshot
+
+
+def largest_pokemon_bodies(snapshot: Snapshot, top: int) -> List[bytes]:
+    """Serialize every /pokemon/{id} resource and keep the `top` largest bodies."""
+    bodies = [
+        json.dumps(payload).encode('utf-8')
+        for path, payload in snapshot.resources.items()
+        if path.startswith("pokemon/") and path.count('/') == 1
+    ]
+    return sorted(bodies, key=len, reverse=True)[:top]
+
+
+def time_per_payload(func: Callable[[bytes], object], bodies: List[bytes], repeat: int) -> float:
+    """Median microseconds per payload over `repeat` passes."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            func(body)
+        samples.append((time.perf_counter() - start) / len(bodies) * 1e6)
+    return statistics.median(samples)
+
+
+def build_cases() -> Dict[str, Callable[[bytes], object]]:
+    """Decode-and-validate strategies to compare."""
+    cases: Dict[str, Callable[[bytes], object]] = {}
+    cases["json.loads + Pokemon.model_validate (current)"] = lambda body: Pokemon.model_validate(json.loads(body))
+    for name in available_codecs():
+        codec = get_codec(name)
+        cases[f"codec {name}: Pokemon"] = lambda body, codec=codec: codec.validate(body, Pokemon)
+    for name in ("pydantic", "validate-json"):
+        codec = get_codec(name)
+        cases[f"codec {name}: LazyPokemon"] = lambda body, codec=codec: codec.validate(body, LazyPokemon)
+    return cases
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--snapshot", help="Snapshot file (.json or .json.gz); defaults to the synthetic snapshot")
+    parser.add_argument("--top", type=int, default=10, help="Number of largest /pokemon payloads to use")
+    parser.add_argument("--repeat", type=int, default=7, help="Timing passes per case (median reported)")
+    args = parser.parse_args(argv)
+
+    snapshot = Snapshot.load(args.snapshot) if args.snapshot else Snapshot.synthetic()
+    bodies = largest_pokemon_bodies(snapshot, args.top)
+    print(f"{len(bodies)} payloads, {min(map(len, bodies))}-{max(map(len, bodies))} bytes")
+
+    baseline = None
+    for name, func in build_cases().items():
+        micros = time_per_payload(func, bodies, args.repeat)
+        baseline = baseline or micros
+        print(f"{name:<50} {micros:>10.1f} us/payload  {baseline / micros:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Async Pokémon API client for PokéAPI v2.
+"""
+
+from typing import Dict, Any, Optional
+from ..core.async_base_api_client import AsyncBaseAPIClient
+
+
+class AsyncPokemonAPIClient(AsyncBaseAPIClient):
+    """Async API client for Pokémon endpoints."""
+
+    async def get_pokemon_by_id(self, pokemon_id: int) -> Dict[str, Any]:
+        """
+        Retrieve a Pokémon by its ID.
+
+        Args:
+            pokemon_id: The Pokémon ID (e.g., 1 for Bulbasaur)
+
+        Returns:
+            Pokémon data as dictionary
+
+        Raises:
+            Exception: If the request fails
+        """
+        endpoint = f"/pokemon/{pokemon_id}"
+        return await self.get(endpoint)
+
+    async def get_pokemon_by_name(self, pokemon_name: str) -> Dict[str, Any]:
+        """
+        Retrieve a Pokémon by its name.
+
+        Args:
+            pokemon_name: The Pokémon name (e.g., 'bulbasaur')
+
+        Returns:
+            Pokémon data as dictionary
+
+        Raises:
+            Exception: If the request fails
+        """
+        endpoint = f"/pokemon/{pokemon_name}"
+        return await self.get(endpoint)
+
+    async def list_pokemon(self, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+        """
+        List Pokémon with optional pagination.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of Pokémon resources as dictionary
+
+        Raises:
+            Exception: If the request fails
+        """
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+
+        return await self.get("/pokemon", params=params)
@@ -2,8 +2,17 @@
 Pokémon API client for PokéAPI v2.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
+from playwright.sync_api import APIRequestContext
+from ..config.settings import test_settings
 from ..core.base_api_client import BaseAPIClient
+from ..core.context_pool import APIRequestContextPool, BulkResult
+from ..models.base import NamedAPIResource
+from ..utils.urls import split_api_url
+
+
+class ListingConsistencyError(Exception):
+    """Raised when sharded list pages do not add up to the advertised index."""
 
 
 class PokemonAPIClient(BaseAPIClient):
@@ -41,6 +50,29 @@ class PokemonAPIClient(BaseAPIClient):
         endpoint = f"/pokemon/{pokemon_name}"
         return self.get(endpoint)
     
+    def get_pokemon_many(self, identifiers: Sequence[Union[int, str]], workers: Optional[int] = None) -> List[BulkResult]:
+        """
+        Retrieve several Pokémon in parallel, one request context per worker thread.
+        
+        Uses the client's shared context pool when one was provided and no explicit
+        worker count is requested; otherwise a temporary pool is created.
+        
+        Args:
+            identifiers: Pokémon IDs or names
+            workers: Number of worker threads (defaults to TestSettings.parallel_workers)
+            
+        Returns:
+            One BulkResult per identifier, in input order; per-item errors are captured
+        """
+        def fetch(context: APIRequestContext, identifier: Union[int, str]) -> Dict[str, Any]:
+            return self.with_context(context).get(f"/pokemon/{identifier}")
+        
+        if self.context_pool is not None and workers is None:
+            return self.context_pool.map(fetch, identifiers)
+        
+        with APIRequestContextPool(workers or test_settings.parallel_workers, logger=self.logger) as pool:
+            return pool.map(fetch, identifiers)
+    
     def list_pokemon(self, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
         """
         List Pokémon with optional pagination.
@@ -63,6 +95,117 @@ class PokemonAPIClient(BaseAPIClient):
             
         return self.get("/pokemon", params=params)
     
+    def iter_pokemon(self, page_size: int = 100, prefetch: bool = True) -> Iterator[NamedAPIResource]:
+        """
+        Iterate over every Pokémon in the index, following the 'next' links.
+        
+        While the caller consumes one page, the next page is fetched on a pool
+        worker, so only two pages are held in memory at any time.
+        
+        Args:
+            page_size: Number of entries requested per page
+            prefetch: Fetch the next page in the background
+            
+        Yields:
+            One NamedAPIResource per Pokémon, in API order
+            
+        Raises:
+            Exception: If a page request fails
+        """
+        def fetch_page(context: APIRequestContext, url: str) -> Dict[str, Any]:
+            endpoint, params = split_api_url(url, self.base_url)
+            return self.with_context(context).get(endpoint, params=params)
+        
+        pool = None
+        owns_pool = False
+        if prefetch:
+            pool = self.context_pool
+            if pool is None:
+                pool = APIRequestContextPool(1, logger=self.logger)
+                owns_pool = True
+        
+        pending = None
+        try:
+            page = self.list_pokemon(limit=page_size)
+            while True:
+                next_url = page.get("next")
+                if next_url and pool is not None:
+                    pending = pool.submit(fetch_page, next_url)
+                
+                for entry in page["results"]:
+                    yield NamedAPIResource.model_validate(entry)
+                
+                if not next_url:
+                    return
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    endpoint, params = split_api_url(next_url, self.base_url)
+                    page = self.get(endpoint, params=params)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if owns_pool:
+                pool.close()
+    
+    def list_all_pokemon(self, page_size: int = 100, concurrency: Optional[int] = None) -> List[NamedAPIResource]:
+        """
+        Fetch the complete Pokémon index by requesting every page window in parallel.
+        
+        The first page reports the total 'count', from which all remaining
+        (limit, offset) windows are computed up front and fetched concurrently
+        on the context pool. The merged result is checked for gaps, duplicates
+        and count drift between shards.
+        
+        Args:
+            page_size: Number of entries per window
+            concurrency: Number of worker threads (defaults to the shared pool,
+                or TestSettings.parallel_workers when there is none)
+            
+        Returns:
+            Every Pokémon entry, in API order
+            
+        Raises:
+            ListingConsistencyError: If shards are missing, overlap or disagree on count
+            Exception: If a page request fails
+        """
+        first_page = self.list_pokemon(limit=page_size, offset=0)
+        count = first_page["count"]
+        offsets = list(range(page_size, count, page_size))
+        
+        def fetch_window(context: APIRequestContext, offset: int) -> Dict[str, Any]:
+            return self.with_context(context).list_pokemon(limit=page_size, offset=offset)
+        
+        if offsets and self.context_pool is not None and concurrency is None:
+            results = self.context_pool.map(fetch_window, offsets)
+        elif offsets:
+            with APIRequestContextPool(concurrency or test_settings.parallel_workers, logger=self.logger) as pool:
+                results = pool.map(fetch_window, offsets)
+        else:
+            results = []
+        
+        pages = [first_page]
+        for result in results:
+            if not result.ok:
+                raise result.error
+            pages.append(result.data)
+        
+        entries = []
+        for offset, page in zip([0] + offsets, pages):
+            expected = min(page_size, count - offset)
+            if page["count"] != count:
+                raise ListingConsistencyError(f"Count changed from {count} to {page['count']} at offset {offset}")
+            if len(page["results"]) != expected:
+                raise ListingConsistencyError(f"Expected {expected} entries at offset {offset}, got {len(page['results'])}")
+            entries.extend(NamedAPIResource.model_validate(entry) for entry in page["results"])
+        
+        unique_urls = {entry.url for entry in entries}
+        if len(entries) != count or len(unique_urls) != count:
+            raise ListingConsistencyError(f"Expected {count} unique entries, got {len(unique_urls)} unique of {len(entries)}")
+        
+        self.logger.info("Listed %d Pokémon in %d parallel windows", count, len(pages))
+        return entries
+    
     def test_http_method(self, method: str, pokemon_id: int = 1) -> Dict[str, Any]:
         """
         Test different HTTP methods on Pokémon endpoints.
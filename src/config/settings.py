@@ -22,6 +22,62 @@ class Settings(BaseModel):
         default=os.getenv('POKEAPI_LOG_LEVEL', 'INFO'),
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
+    log_queue: bool = Field(
+        default=os.getenv('POKEAPI_LOG_QUEUE', 'false').lower() in ('1', 'true', 'yes'),
+        description="Format and write the clients' request logs on a background listener thread"
+    )
+    log_sample_every: int = Field(
+        default=int(os.getenv('POKEAPI_LOG_SAMPLE_EVERY', '1')),
+        description="Log one request in this many through the clients' loggers (warnings and errors are always logged)"
+    )
+    max_concurrency: int = Field(
+        default=int(os.getenv('POKEAPI_MAX_CONCURRENCY', '10')),
+        description="Maximum number of in-flight requests for async bulk reads"
+    )
+    strict_models: bool = Field(
+        default=os.getenv('POKEAPI_STRICT_MODELS', 'false').lower() in ('1', 'true', 'yes'),
+        description="Validate lazy models (e.g. LazyPokemon) eagerly and in full"
+    )
+    intern_models: bool = Field(
+        default=os.getenv('POKEAPI_INTERN_MODELS', 'true').lower() in ('1', 'true', 'yes'),
+        description="Share equal NamedAPIResource/APIResource instances during validation"
+    )
+    json_codec: str = Field(
+        default=os.getenv('POKEAPI_JSON_CODEC', 'pydantic'),
+        description="JSON codec for response bodies (pydantic, validate-json, json, orjson)"
+    )
+    max_retries: int = Field(
+        default=int(os.getenv('POKEAPI_MAX_RETRIES', '2')),
+        description="Retries of a GET after a connection error, 429 or 5xx (0 disables retries)"
+    )
+    retry_budget_ratio: float = Field(
+        default=float(os.getenv('POKEAPI_RETRY_BUDGET_RATIO', '0.1')),
+        description="Retries allowed per request once the retry budget's reserve is spent"
+    )
+    circuit_failure_threshold: int = Field(
+        default=int(os.getenv('POKEAPI_CIRCUIT_FAILURE_THRESHOLD', '5')),
+        description="Consecutive requests failing with connection errors/5xx (after their retries) that open the circuit breaker"
+    )
+    circuit_reset_timeout: float = Field(
+        default=float(os.getenv('POKEAPI_CIRCUIT_RESET_TIMEOUT', '30')),
+        description="Seconds an open circuit fails fast before a probe request is allowed"
+    )
+    rate_limit: float = Field(
+        default=float(os.getenv('POKEAPI_RATE_LIMIT', '0')),
+        description="Host-wide requests per second shared by all processes (0 disables the limiter)"
+    )
+    rate_limit_burst: int = Field(
+        default=int(os.getenv('POKEAPI_RATE_LIMIT_BURST', '10')),
+        description="Burst size of the host-wide rate limit"
+    )
+    rate_limits: str = Field(
+        default=os.getenv('POKEAPI_RATE_LIMITS', ''),
+        description="Per-family limits as family=rate[:burst] pairs, e.g. 'pokemon=10:5,berry=2'"
+    )
+    rate_limit_file: Optional[str] = Field(
+        default=os.getenv('POKEAPI_RATE_LIMIT_FILE'),
+        description="Lock file holding the shared rate limiter state (defaults to a private per-run file in the temp directory)"
+    )
     
     # Add other global settings here
 
@@ -56,6 +112,30 @@ def validate_config():
     if settings.timeout <= 0:
         raise ValueError(f"Invalid timeout: {settings.timeout}. Must be positive")
     
+    if settings.log_sample_every <= 0:
+        raise ValueError(f"Invalid log sampling rate: {settings.log_sample_every}. Must be positive")
+    
+    if settings.max_concurrency <= 0:
+        raise ValueError(f"Invalid max concurrency: {settings.max_concurrency}. Must be positive")
+    
+    if settings.max_retries < 0:
+        raise ValueError(f"Invalid max retries: {settings.max_retries}. Must not be negative")
+    
+    if settings.retry_budget_ratio < 0:
+        raise ValueError(f"Invalid retry budget ratio: {settings.retry_budget_ratio}. Must not be negative")
+    
+    if settings.circuit_failure_threshold <= 0:
+        raise ValueError(f"Invalid circuit failure threshold: {settings.circuit_failure_threshold}. Must be positive")
+    
+    if settings.circuit_reset_timeout < 0:
+        raise ValueError(f"Invalid circuit reset timeout: {settings.circuit_reset_timeout}. Must not be negative")
+    
+    if settings.rate_limit < 0:
+        raise ValueError(f"Invalid rate limit: {settings.rate_limit}. Must not be negative")
+    
+    if settings.rate_limit_burst < 1:
+        raise ValueError(f"Invalid rate limit burst: {settings.rate_limit_burst}. Must be at least 1")
+    
     if test_settings.timeout <= 0:
         raise ValueError(f"Invalid test timeout: {test_settings.timeout}. Must be positive")
     
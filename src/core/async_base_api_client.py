@@ -0,0 +1,306 @@
+"""
+Async base API client for PokéAPI v2 endpoints.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+from playwright.async_api import APIRequestContext, async_playwright
+from ..config.settings import settings
+from ..utils.logger import request_log_enabled
+from ..utils.urls import canonicalize_url, endpoint_template
+from .codecs import JSONCodec, get_codec, type_adapter
+from .metrics import RequestObserver, RequestTiming
+from .hedging import HedgePolicy
+from .rate_limiter import SharedRateLimiter, endpoint_family
+from .resilience import HTTPError, Resilience
+from .response_cache import ResponseCache
+from .single_flight import AsyncSingleFlight
+
+
+T = TypeVar("T")
+
+
+class AsyncBaseAPIClient:
+    """Base class for asyncio API clients with bounded-concurrency bulk reads."""
+
+    def __init__(self, api_request_context: APIRequestContext, base_url: Optional[str] = None, logger: Optional[logging.Logger] = None, concurrency: Optional[int] = None, cache: Optional[ResponseCache] = None, codec: Optional[JSONCodec] = None, observers: Optional[List[RequestObserver]] = None, resilience: Optional[Resilience] = None, hedging: Optional[HedgePolicy] = None, rate_limiter: Optional[SharedRateLimiter] = None, single_flight: Optional[AsyncSingleFlight] = None):
+        """
+        Initialize the async API client.
+
+        Args:
+            api_request_context: Playwright async API request context
+            base_url: Optional base URL override (takes precedence over settings)
+            logger: Optional logger instance
+            concurrency: Maximum number of in-flight requests for bulk reads
+            cache: Optional in-process response cache, shareable with sync clients
+            codec: JSON codec for response bodies (defaults to settings.json_codec)
+            observers: Callables receiving a RequestTiming after every GET
+            resilience: Retry/circuit breaker policies for GETs; share one instance
+                between clients of the same API (defaults to a per-client instance
+                configured from settings)
+            hedging: Optional hedging policy; slow GETs are duplicated and the first
+                response wins
+            rate_limiter: Optional limiter shared with other clients and processes;
+                every GET attempt (including retries) waits for a slot
+            single_flight: Coalesces concurrent identical GETs (defaults to a
+                per-client instance, shared with clones)
+        """
+        self.api_request_context = api_request_context
+        self.logger = logger or logging.getLogger(__name__)
+        self.concurrency = concurrency or settings.max_concurrency
+        self.cache = cache
+        self.codec = codec or get_codec()
+        self.observers: List[RequestObserver] = list(observers or [])
+        self.resilience = resilience or Resilience(logger=self.logger)
+        self.hedging = hedging
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight or AsyncSingleFlight()
+
+        # Priority: 1. Explicit base_url parameter, 2. Environment variable, 3. Default settings
+        if base_url:
+            self.base_url = base_url
+        else:
+            env_base_url = os.getenv('POKEAPI_BASE_URL') or os.getenv('TEST_BASE_URL')
+            self.base_url = env_base_url or settings.base_url
+
+        self.logger.info("AsyncBaseAPIClient initialized with base_url: %s", self.base_url)
+
+    @classmethod
+    @asynccontextmanager
+    async def open(cls, base_url: Optional[str] = None, timeout: Optional[int] = None, **client_kwargs) -> AsyncIterator["AsyncBaseAPIClient"]:
+        """
+        Start Playwright, create a request context and yield a client bound to it.
+
+        Args:
+            base_url: Optional base URL override
+            timeout: Request timeout in milliseconds (defaults to settings.timeout)
+            **client_kwargs: Extra keyword arguments for the client constructor
+
+        Yields:
+            Client instance; the context is disposed on exit
+        """
+        async with async_playwright() as playwright:
+            context = await playwright.request.new_context(timeout=timeout or settings.timeout)
+            try:
+                yield cls(context, base_url=base_url, **client_kwargs)
+            finally:
+                await context.dispose()
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make a GET request to the specified endpoint.
+
+        Cached payloads (when a cache is configured) are shared between callers
+        and must be treated as read-only.
+        Concurrent calls for the same URL share one request and its decoded
+        payload.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/pokemon/1')
+            params: Optional query parameters
+            headers: Optional request headers
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            Exception: If the request fails
+        """
+        if headers:
+            # Requests with their own headers may get different answers; never coalesce them
+            return await self._get_decoded(endpoint, params, headers)
+        
+        full_url = f"{self.base_url.rstrip('/')}{endpoint}"
+        started = time.perf_counter()
+        led = []
+        
+        async def lead():
+            led.append(True)
+            return await self._get_decoded(endpoint, params, headers)
+        
+        try:
+            data = await self.single_flight.do(canonicalize_url(full_url, params), lead)
+        except Exception as e:
+            if not led:
+                self._notify_coalesced(endpoint, full_url, started, e)
+            raise
+        if not led:
+            self._notify_coalesced(endpoint, full_url, started, None)
+        return data
+    
+    async def _get_decoded(self, endpoint: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Fetch and decode a GET response through the caches (get() without coalescing)."""
+        cache_key, status, body, data, timing = await self._get_body(endpoint, params, headers)
+        if data is None:
+            started = time.perf_counter()
+            data = self.codec.loads(body)
+            if timing is not None:
+                timing.decode = time.perf_counter() - started
+            if self.cache is not None:
+                self.cache.put(cache_key, status, body, data)
+        if timing is not None:
+            self._notify(timing)
+        return data
+
+    async def get_model(self, endpoint: str, model_type: Type[T], params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> T:
+        """
+        Make a GET request and validate the response body directly as a model.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/pokemon/1')
+            model_type: Pydantic model (or any TypeAdapter-compatible type) to validate as
+            params: Optional query parameters
+            headers: Optional request headers
+
+        Returns:
+            Validated model instance
+
+        Raises:
+            Exception: If the request fails
+            ValidationError: If the body does not match model_type
+        """
+        cache_key, status, body, data, timing = await self._get_body(endpoint, params, headers)
+        if data is None and self.cache is not None:
+            self.cache.put(cache_key, status, body, None)
+        if timing is None:
+            return self.codec.validate(body, model_type)
+
+        try:
+            started = time.perf_counter()
+            if self.codec.single_pass:
+                model = self.codec.validate(body, model_type)
+            else:
+                data = self.codec.loads(body)
+                timing.decode = time.perf_counter() - started
+                started = time.perf_counter()
+                model = type_adapter(model_type).validate_python(data)
+            timing.validate = time.perf_counter() - started
+            return model
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            self._notify(timing)
+
+    async def _get_body(self, endpoint: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Tuple[Optional[str], int, bytes, Any, Optional[RequestTiming]]:
+        """Fetch a GET response body, returning (cache key, status, body, cached data or None, timing or None)."""
+        full_url = f"{self.base_url.rstrip('/')}{endpoint}"
+        started = time.perf_counter()
+        timing = RequestTiming("GET", endpoint_template(endpoint), full_url, started=started) if self.observers else None
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = canonicalize_url(full_url, params)
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                self.logger.debug("Cache hit for %s", cache_key)
+                if timing is not None:
+                    timing.source, timing.status, timing.response_bytes = "memory", entry.status, len(entry.body)
+                if entry.status == 404:
+                    if timing is not None:
+                        timing.error = "HTTP 404"
+                        self._notify(timing)
+                    raise HTTPError(404, full_url)
+                return cache_key, entry.status, entry.body, entry.data, timing
+
+        # One level/sampling decision per request; arguments are formatted lazily
+        family = endpoint_family(endpoint)
+        log_info = request_log_enabled(self.logger)
+        if log_info:
+            self.logger.info("Making async GET request to %s with params: %s", full_url, params)
+
+        try:
+            response = await self.resilience.execute_async(lambda: self._send(full_url, params, headers, timing, family), full_url)
+            sent = time.perf_counter()
+
+            if log_info:
+                self.logger.info("Response status: %s", response.status)
+
+            if not response.ok:
+                self.logger.error("HTTP %s error for %s", response.status, full_url)
+                if cache_key is not None:
+                    self.cache.put(cache_key, response.status, b"", None)
+                if timing is not None:
+                    timing.status, timing.error = response.status, f"HTTP {response.status}"
+                raise HTTPError(response.status, full_url)
+
+            body = await response.body()
+            if timing is not None:
+                timing.status, timing.response_bytes = response.status, len(body)
+                timing.send, timing.read = sent - started - (timing.throttle or 0.0), time.perf_counter() - sent
+            return cache_key, response.status, body, None, timing
+
+        except Exception as e:
+            self.logger.error("Failed to make async GET request to %s: %s", full_url, e)
+            if timing is not None:
+                timing.error = timing.error or type(e).__name__
+                self._notify(timing)
+            raise
+
+    async def _send(self, full_url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], timing: Optional[RequestTiming], family: str) -> Any:
+        """Send one GET attempt after any rate-limit wait, hedged when a hedging policy is configured."""
+        if self.rate_limiter is not None:
+            wait = await self.rate_limiter.acquire_async(family)
+            if timing is not None:
+                timing.throttle = (timing.throttle or 0.0) + wait
+        if self.hedging is None:
+            return await self.api_request_context.get(full_url, params=params, headers=headers)
+        response, hedged, won = await self.hedging.run_async(lambda: self.api_request_context.get(full_url, params=params, headers=headers))
+        if hedged and timing is not None:
+            timing.hedged, timing.hedge_won = True, timing.hedge_won or won
+        return response
+
+    def _notify(self, timing: RequestTiming) -> None:
+        """Stamp the total duration on a timing and hand it to every observer."""
+        timing.total = time.perf_counter() - timing.started
+        for observer in self.observers:
+            try:
+                observer(timing)
+            except Exception as e:
+                self.logger.error("Request observer %r failed: %s", observer, e)
+
+    def _notify_coalesced(self, endpoint: str, full_url: str, started: float, error: Optional[BaseException]) -> None:
+        """Report a get() that joined another caller's in-flight request (source 'coalesced')."""
+        if not self.observers:
+            return
+        timing = RequestTiming("GET", endpoint_template(endpoint), full_url, source="coalesced", status=200, started=started)
+        if error is not None:
+            timing.status = error.status if isinstance(error, HTTPError) else 0
+            timing.error = f"HTTP {error.status}" if isinstance(error, HTTPError) else type(error).__name__
+        self._notify(timing)
+
+    async def get_many(self, endpoints: Sequence[str], concurrency: Optional[int] = None, return_exceptions: bool = False) -> List[Any]:
+        """
+        Fetch several endpoints concurrently, bounded by a semaphore.
+
+        Args:
+            endpoints: API endpoint paths to fetch
+            concurrency: Override for the maximum number of in-flight requests
+            return_exceptions: Return failures in place of results instead of raising
+
+        Returns:
+            Response data for each endpoint, in input order
+
+        Raises:
+            Exception: If any request fails and return_exceptions is False; the
+                remaining requests are cancelled before it is raised
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def fetch(endpoint: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get(endpoint)
+
+        self.logger.info("Fetching %d endpoints with concurrency %d", len(endpoints), concurrency or self.concurrency)
+        tasks = [asyncio.ensure_future(fetch(endpoint)) for endpoint in endpoints]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -2,17 +2,35 @@
 Base API client for PokéAPI v2 endpoints.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 from playwright.sync_api import APIRequestContext
+import copy
 import logging
 import os
+import time
 from ..config.settings import settings
+from ..utils.logger import request_log_enabled
+from ..utils.urls import canonicalize_url, endpoint_template
+from .cassette import Cassette, RecordedResponse
+from .codecs import JSONCodec, get_codec, type_adapter
+from .context_pool import APIRequestContextPool
+from .disk_cache import DiskHTTPCache
+from .metrics import RequestObserver, RequestTiming
+from .hedging import HedgePolicy
+from .rate_limiter import SharedRateLimiter, endpoint_family
+from .resilience import HTTPError, Resilience
+from .response_cache import ResponseCache
+from .shared_store import SharedResponseStore
+from .single_flight import SingleFlight
+
+
+T = TypeVar("T")
 
 
 class BaseAPIClient:
     """Base class for all API clients with common functionality."""
     
-    def __init__(self, api_request_context: APIRequestContext, base_url: Optional[str] = None, logger: Optional[logging.Logger] = None):
+    def __init__(self, api_request_context: APIRequestContext, base_url: Optional[str] = None, logger: Optional[logging.Logger] = None, context_pool: Optional[APIRequestContextPool] = None, cache: Optional[ResponseCache] = None, http_cache: Optional[DiskHTTPCache] = None, cassette: Optional[Cassette] = None, codec: Optional[JSONCodec] = None, observers: Optional[List[RequestObserver]] = None, resilience: Optional[Resilience] = None, hedging: Optional[HedgePolicy] = None, rate_limiter: Optional[SharedRateLimiter] = None, shared_store: Optional[SharedResponseStore] = None, single_flight: Optional[SingleFlight] = None):
         """
         Initialize the API client.
         
@@ -20,9 +38,35 @@ class BaseAPIClient:
             api_request_context: Playwright API request context
             base_url: Optional base URL override (takes precedence over settings)
             logger: Optional logger instance
+            context_pool: Optional shared pool of per-thread contexts for bulk reads
+            cache: Optional in-process response cache consulted by get()
+            http_cache: Optional persistent cache revalidated with conditional requests
+            cassette: Optional cassette; all traffic is recorded to or replayed from it
+            codec: JSON codec for response bodies (defaults to settings.json_codec)
+            observers: Callables receiving a RequestTiming after every GET
+            resilience: Retry/circuit breaker policies for GETs; share one instance
+                between clients of the same API (defaults to a per-client instance
+                configured from settings)
+            hedging: Optional hedging policy; slow GETs are duplicated and the first
+                response wins (needs context_pool, which provides the second connection)
+            rate_limiter: Optional limiter shared with other clients and processes;
+                every GET attempt (including retries) waits for a slot
+            shared_store: Optional store shared with other processes (e.g. xdist
+                workers); each missing response is fetched by one of them only
+            single_flight: Coalesces concurrent identical GETs (defaults to a
+                per-client instance, shared with clones)
         """
-        self.api_request_context = api_request_context
         self.logger = logger or logging.getLogger(__name__)
+        self.context_pool = context_pool
+        self.cache = cache
+        self.http_cache = http_cache
+        self.codec = codec or get_codec()
+        self.observers: List[RequestObserver] = list(observers or [])
+        self.resilience = resilience or Resilience(logger=self.logger)
+        self.hedging = hedging
+        self.rate_limiter = rate_limiter
+        self.shared_store = shared_store
+        self.single_flight = single_flight or SingleFlight()
         
         # Priority: 1. Explicit base_url parameter, 2. Environment variable, 3. Default settings
         if base_url:
@@ -32,12 +76,51 @@ class BaseAPIClient:
             env_base_url = os.getenv('POKEAPI_BASE_URL') or os.getenv('TEST_BASE_URL')
             self.base_url = env_base_url or settings.base_url
         
-        self.logger.info(f"BaseAPIClient initialized with base_url: {self.base_url}")
+        self.cassette = cassette
+        self.api_request_context = cassette.wrap(api_request_context, self.base_url) if cassette is not None else api_request_context
+        self.logger.info("BaseAPIClient initialized with base_url: %s", self.base_url)
+    
+    def with_context(self, api_request_context: APIRequestContext) -> "BaseAPIClient":
+        """
+        Return a shallow copy of this client bound to another request context.
+        
+        Used by worker threads, which cannot share the caller's sync context.
+        
+        Args:
+            api_request_context: Playwright API request context owned by the calling thread
+            
+        Returns:
+            Client sharing this client's configuration
+        """
+        clone = copy.copy(self)
+        clone.api_request_context = self.cassette.wrap(api_request_context, self.base_url) if self.cassette is not None else api_request_context
+        return clone
+    
+    def add_observer(self, observer: RequestObserver) -> None:
+        """
+        Register a callable that receives a RequestTiming after every GET.
+        
+        Observers run on the requesting thread and should be cheap; exceptions
+        they raise are logged and ignored.
+        
+        Args:
+            observer: Callable taking a RequestTiming
+        """
+        self.observers.append(observer)
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Make a GET request to the specified endpoint.
         
+        When a response cache is configured, cached payloads are returned without
+        a network round trip. Cached payloads are shared between callers and must
+        be treated as read-only. When a disk HTTP cache is configured, stored
+        responses are revalidated with If-None-Match/If-Modified-Since and a 304
+        reuses the stored body. Connection errors, 429 and 5xx responses are
+        retried according to the client's Resilience policies.
+        Concurrent calls for the same URL (from clones made by with_context on
+        other threads) share one request and its decoded payload.
+        
         Args:
             endpoint: API endpoint path (e.g., '/pokemon/1')
             params: Optional query parameters
@@ -47,32 +130,273 @@ class BaseAPIClient:
             Response data as dictionary
             
         Raises:
+            HTTPError: If the final response is not successful
+            CircuitOpenError: If the circuit breaker is open
             Exception: If the request fails
         """
-        # Build full URL using configured base URL
+        if headers:
+            # Requests with their own headers may get different answers; never coalesce them
+            return self._get_decoded(endpoint, params, headers)
+        
         full_url = f"{self.base_url.rstrip('/')}{endpoint}"
-        self.logger.info(f"Making GET request to {full_url} with params: {params}")
+        started = time.perf_counter()
+        led = []
+        
+        def lead():
+            led.append(True)
+            return self._get_decoded(endpoint, params, headers)
         
         try:
-            response = self.api_request_context.get(full_url, params=params, headers=headers)
-            
-            self.logger.info(f"Response status: {response.status}")
-            self.logger.info(f"Response URL: {response.url}")
+            data = self.single_flight.do(canonicalize_url(full_url, params), lead)
+        except Exception as e:
+            if not led:
+                self._notify_coalesced(endpoint, full_url, started, e)
+            raise
+        if not led:
+            self._notify_coalesced(endpoint, full_url, started, None)
+        return data
+    
+    def _get_decoded(self, endpoint: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Fetch and decode a GET response through the caches (get() without coalescing)."""
+        cache_key, status, body, data, timing = self._get_body(endpoint, params, headers)
+        if data is None:
+            started = time.perf_counter()
+            data = self.codec.loads(body)
+            if timing is not None:
+                timing.decode = time.perf_counter() - started
+            if self.cache is not None:
+                self.cache.put(cache_key, status, body, data)
+        if timing is not None:
+            self._notify(timing)
+        return data
+    
+    def get_model(self, endpoint: str, model_type: Type[T], params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> T:
+        """
+        Make a GET request and validate the response body directly as a model.
+        
+        The body bytes are handed to the client's codec. The default pydantic
+        codec parses them with pydantic-core's from_json and validates the
+        result with a cached TypeAdapter's validate_python; the validate-json
+        codec skips the intermediate data with validate_json instead. Caching
+        and revalidation behave as in get().
+        
+        Args:
+            endpoint: API endpoint path (e.g., '/pokemon/1')
+            model_type: Pydantic model (or any TypeAdapter-compatible type) to validate as
+            params: Optional query parameters
+            headers: Optional request headers
             
-            # Check if response is successful
-            if not response.ok:
-                self.logger.error(f"HTTP {response.status} error for {full_url}")
-                raise Exception(f"HTTP {response.status} error for {full_url}")
+        Returns:
+            Validated model instance
             
-            data = response.json()
+        Raises:
+            Exception: If the request fails
+            ValidationError: If the body does not match model_type
+        """
+        cache_key, status, body, data, timing = self._get_body(endpoint, params, headers)
+        if data is None and self.cache is not None:
+            # Decoded lazily by the next get() that hits this entry
+            self.cache.put(cache_key, status, body, None)
+        if timing is None:
+            return self.codec.validate(body, model_type)
+        
+        try:
+            started = time.perf_counter()
+            if self.codec.single_pass:
+                model = self.codec.validate(body, model_type)
+            else:
+                # Split decode and validation so both phases are measured
+                data = self.codec.loads(body)
+                timing.decode = time.perf_counter() - started
+                started = time.perf_counter()
+                model = type_adapter(model_type).validate_python(data)
+            timing.validate = time.perf_counter() - started
+            return model
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            self._notify(timing)
+    
+    def _get_body(self, endpoint: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Tuple[Optional[str], int, bytes, Any, Optional[RequestTiming]]:
+        """
+        Fetch a GET response body through the response and disk caches.
+        
+        Returns:
+            Tuple of (cache key, status, body, cached decoded data or None,
+            RequestTiming to complete and report, or None without observers)
             
-            self.logger.info(f"Successfully retrieved data from {full_url}")
-            return data
+        Raises:
+            Exception: If the request fails (observers are notified first)
+        """
+        # Build full URL using configured base URL
+        full_url = f"{self.base_url.rstrip('/')}{endpoint}"
+        started = time.perf_counter()
+        timing = RequestTiming("GET", endpoint_template(endpoint), full_url, started=started) if self.observers else None
+        
+        cache_key = None
+        if self.cache is not None or self.http_cache is not None or self.shared_store is not None:
+            cache_key = canonicalize_url(full_url, params)
+        
+        if self.cache is not None:
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                self.logger.debug("Cache hit for %s", cache_key)
+                if timing is not None:
+                    timing.source, timing.status, timing.response_bytes = "memory", entry.status, len(entry.body)
+                if entry.status == 404:
+                    if timing is not None:
+                        timing.error = "HTTP 404"
+                        self._notify(timing)
+                    raise HTTPError(404, full_url)
+                return cache_key, entry.status, entry.body, entry.data, timing
+        
+        try:
+            if self.shared_store is not None:
+                status, body, source = self._get_shared(endpoint, full_url, cache_key, params, headers, timing)
+            else:
+                status, body, source = self._fetch(endpoint, full_url, cache_key, params, headers, timing)
+            if timing is not None:
+                timing.source, timing.status, timing.response_bytes = source, status, len(body)
+            return cache_key, status, body, None, timing
             
         except Exception as e:
-            self.logger.error(f"Failed to make GET request to {full_url}: {str(e)}")
+            self.logger.error("Failed to make GET request to %s: %s", full_url, e)
+            if timing is not None:
+                timing.error = timing.error or type(e).__name__
+                self._notify(timing)
             raise
     
+    def _get_shared(self, endpoint: str, full_url: str, cache_key: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], timing: Optional[RequestTiming]) -> Tuple[int, bytes, str]:
+        """
+        Read a GET response through the shared store; one process fetches each missing key.
+        
+        Returns:
+            Tuple of (status, body, timing source)
+            
+        Raises:
+            HTTPError: If the (possibly shared) response is not successful
+        """
+        def fetch() -> Tuple[int, bytes]:
+            try:
+                status, body, _ = self._fetch(endpoint, full_url, cache_key, params, headers, timing)
+            except HTTPError as e:
+                if e.status != 404:
+                    raise
+                return e.status, b""
+            return status, body
+        
+        status, body, fetched = self.shared_store.fill(cache_key, fetch)
+        if status == 404:
+            if self.cache is not None:
+                self.cache.put(cache_key, status, b"", None)
+            if timing is not None:
+                timing.status, timing.error = status, f"HTTP {status}"
+            raise HTTPError(status, full_url)
+        return status, body, "network" if fetched else "shared"
+    
+    def _fetch(self, endpoint: str, full_url: str, cache_key: Optional[str], params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], timing: Optional[RequestTiming]) -> Tuple[int, bytes, str]:
+        """
+        Send a GET (revalidating a disk cache entry when there is one).
+        
+        Returns:
+            Tuple of (status, body, timing source)
+            
+        Raises:
+            HTTPError: If the final response is not successful
+            Exception: If the request fails
+        """
+        stored = None
+        if self.http_cache is not None:
+            stored = self.http_cache.lookup(cache_key)
+            if stored is not None:
+                headers = {**(headers or {}), **stored.conditional_headers()}
+        
+        # One level/sampling decision per request; arguments are formatted lazily
+        family = endpoint_family(endpoint)
+        log_info = request_log_enabled(self.logger)
+        if log_info:
+            self.logger.info("Making GET request to %s with params: %s", full_url, params)
+        
+        response = self.resilience.execute(lambda: self._send(full_url, params, headers, timing, family), full_url)
+        sent = time.perf_counter()
+        
+        if log_info:
+            self.logger.info("Response status: %s", response.status)
+            self.logger.info("Response URL: %s", response.url)
+        
+        if response.status == 304 and stored is not None:
+            # Unchanged since it was stored: reuse the persisted body
+            self.http_cache.touch(cache_key)
+            status, body = stored.status, stored.body
+            source = "revalidated"
+        else:
+            # Check if response is successful
+            if not response.ok:
+                self.logger.error("HTTP %s error for %s", response.status, full_url)
+                if self.cache is not None:
+                    self.cache.put(cache_key, response.status, b"", None)
+                if timing is not None:
+                    timing.status, timing.error = response.status, f"HTTP {response.status}"
+                raise HTTPError(response.status, full_url)
+            
+            status, body = response.status, response.body()
+            if self.http_cache is not None:
+                self.http_cache.store(cache_key, status, body, response.headers)
+            source = "network"
+        
+        if timing is not None:
+            timing.send, timing.read = sent - timing.started - (timing.throttle or 0.0), time.perf_counter() - sent
+        
+        if log_info:
+            self.logger.info("Successfully retrieved data from %s", full_url)
+        return status, body, source
+    
+    def _send(self, full_url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], timing: Optional[RequestTiming], family: str) -> Any:
+        """
+        Send one GET attempt, hedged on the context pool when hedging is enabled.
+        
+        The attempt first waits for the rate limiter, if any. Hedging is skipped
+        with a cassette and on the pool's own workers, which must not block
+        waiting for other workers.
+        """
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.acquire(family)
+            if timing is not None:
+                timing.throttle = (timing.throttle or 0.0) + wait
+        pool = self.context_pool
+        if self.hedging is None or pool is None or self.cassette is not None or pool.owns_current_thread():
+            return self.api_request_context.get(full_url, params=params, headers=headers)
+        
+        def fetch(context: APIRequestContext) -> RecordedResponse:
+            # Sync responses are bound to the worker's thread: read the body there
+            response = context.get(full_url, params=params, headers=headers)
+            return RecordedResponse(response.status, response.url, response.headers, response.body())
+        
+        response, hedged, won = self.hedging.run(pool, fetch)
+        if hedged and timing is not None:
+            timing.hedged, timing.hedge_won = True, timing.hedge_won or won
+        return response
+    
+    def _notify(self, timing: RequestTiming) -> None:
+        """Stamp the total duration on a timing and hand it to every observer."""
+        timing.total = time.perf_counter() - timing.started
+        for observer in self.observers:
+            try:
+                observer(timing)
+            except Exception as e:
+                self.logger.error("Request observer %r failed: %s", observer, e)
+    
+    def _notify_coalesced(self, endpoint: str, full_url: str, started: float, error: Optional[BaseException]) -> None:
+        """Report a get() that joined another caller's in-flight request (source 'coalesced')."""
+        if not self.observers:
+            return
+        timing = RequestTiming("GET", endpoint_template(endpoint), full_url, source="coalesced", status=200, started=started)
+        if error is not None:
+            timing.status = error.status if isinstance(error, HTTPError) else 0
+            timing.error = f"HTTP {error.status}" if isinstance(error, HTTPError) else type(error).__name__
+        self._notify(timing)
+    
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Make a POST request to the specified endpoint.
@@ -89,12 +413,12 @@ class BaseAPIClient:
             Exception: If the request fails
         """
         full_url = f"{self.base_url.rstrip('/')}{endpoint}"
-        self.logger.info(f"Making POST request to {full_url}")
+        self.logger.info("Making POST request to %s", full_url)
         
         try:
             response = self.api_request_context.post(full_url, data=data, headers=headers)
             
-            self.logger.info(f"Response status: {response.status}")
+            self.logger.info("Response status: %s", response.status)
             
             # For POST requests, we expect 4xx or 5xx errors in testing scenarios
             if response.ok:
@@ -104,7 +428,7 @@ class BaseAPIClient:
                 return {"status": response.status, "error": response.text()}
                 
         except Exception as e:
-            self.logger.error(f"Failed to make POST request to {full_url}: {str(e)}")
+            self.logger.error("Failed to make POST request to %s: %s", full_url, e)
             raise
     
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -123,12 +447,12 @@ class BaseAPIClient:
             Exception: If the request fails
         """
         full_url = f"{self.base_url.rstrip('/')}{endpoint}"
-        self.logger.info(f"Making PUT request to {full_url}")
+        self.logger.info("Making PUT request to %s", full_url)
         
         try:
             response = self.api_request_context.put(full_url, data=data, headers=headers)
             
-            self.logger.info(f"Response status: {response.status}")
+            self.logger.info("Response status: %s", response.status)
             
             if response.ok:
                 return response.json() if response.text() else {}
@@ -136,7 +460,7 @@ class BaseAPIClient:
                 return {"status": response.status, "error": response.text()}
                 
         except Exception as e:
-            self.logger.error(f"Failed to make PUT request to {full_url}: {str(e)}")
+            self.logger.error("Failed to make PUT request to %s: %s", full_url, e)
             raise
     
     def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -154,12 +478,12 @@ class BaseAPIClient:
             Exception: If the request fails
         """
         full_url = f"{self.base_url.rstrip('/')}{endpoint}"
-        self.logger.info(f"Making DELETE request to {full_url}")
+        self.logger.info("Making DELETE request to %s", full_url)
         
         try:
             response = self.api_request_context.delete(full_url, headers=headers)
             
-            self.logger.info(f"Response status: {response.status}")
+            self.logger.info("Response status: %s", response.status)
             
             if response.ok:
                 return response.json() if response.text() else {}
@@ -167,7 +491,7 @@ class BaseAPIClient:
                 return {"status": response.status, "error": response.text()}
                 
         except Exception as e:
-            self.logger.error(f"Failed to make DELETE request to {full_url}: {str(e)}")
+            self.logger.error("Failed to make DELETE request to %s: %s", full_url, e)
             raise
     
     def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -186,12 +510,12 @@ class BaseAPIClient:
             Exception: If the request fails
         """
         full_url = f"{self.base_url.rstrip('/')}{endpoint}"
-        self.logger.info(f"Making PATCH request to {full_url}")
+        self.logger.info("Making PATCH request to %s", full_url)
         
         try:
             response = self.api_request_context.patch(full_url, data=data, headers=headers)
             
-            self.logger.info(f"Response status: {response.status}")
+            self.logger.info("Response status: %s", response.status)
             
             if response.ok:
                 return response.json() if response.text() else {}
@@ -199,5 +523,5 @@ class BaseAPIClient:
                 return {"status": response.status, "error": response.text()}
                 
         except Exception as e:
-            self.logger.error(f"Failed to make PATCH request to {full_url}: {str(e)}")
+            self.logger.error("Failed to make PATCH request to %s: %s", full_url, e)
             raise
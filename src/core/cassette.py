@@ -0,0 +1,251 @@
+"""
+Record/replay cassettes for API traffic.
+
+A cassette is a gzip'd JSON Lines file holding one request/response pair per
+line, plus a small JSON index mapping each request key to its line. Recording
+wraps a live APIRequestContext; replaying serves every request from the
+cassette without touching the network. Requests are keyed by their path and
+query below the client's base URL, so a cassette recorded against one host
+(e.g. the stand-in server on a random port) replays against any other.
+"""
+
+import base64
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+from ..utils.urls import canonicalize_url
+
+API_MODES = ("live", "record", "replay")
+
+# Only headers that influence client behaviour are kept, to keep cassettes compact
+_RECORDED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "retry-after")
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class RecordedResponse:
+    """Response object exposing the subset of Playwright's APIResponse used by the clients."""
+
+    def __init__(self, status: int, url: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.url = url
+        self.headers = headers
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status is in the 2xx range."""
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode('utf-8')
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+
+class Cassette:
+    """A set of recorded responses keyed by method and canonical URL."""
+
+    def __init__(self, path: Union[str, Path], mode: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cassette.
+
+        Args:
+            path: Cassette path without extension; '.jsonl.gz' and '.index.json' are appended
+            mode: 'record' or 'replay'
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If the mode is not 'record' or 'replay'
+            FileNotFoundError: If replaying a cassette that does not exist
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode: {mode}. Use 'record' or 'replay'")
+
+        base = Path(path)
+        self.data_path = base.with_name(base.name + ".jsonl.gz")
+        self.index_path = base.with_name(base.name + ".index.json")
+        self.mode = mode
+        self.logger = logger or logging.getLogger(__name__)
+        self.replayed = 0
+        self._lines: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._decoded: Dict[str, RecordedResponse] = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay":
+            self._load()
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None) -> str:
+        """
+        Build the lookup key for a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Optional query parameters sent alongside the URL
+            base_url: Client base URL; its path is stripped from the key when the URL is below it
+
+        Returns:
+            Method plus canonical path and query, without scheme and host
+        """
+        parts = urlsplit(canonicalize_url(url, params))
+        path = parts.path
+        root = urlsplit(base_url).path.rstrip('/') if base_url else ''
+        if root and (path == root or path.startswith(root + '/')):
+            path = path[len(root):] or '/'
+        return f"{method.upper()} {path}" + (f"?{parts.query}" if parts.query else "")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def wrap(self, api_request_context: Any, base_url: Optional[str] = None) -> "CassetteTransport":
+        """Wrap a request context so its traffic is recorded or replayed, keyed below base_url."""
+        return CassetteTransport(api_request_context, self, base_url)
+
+    def record(self, key: str, response: Any) -> RecordedResponse:
+        """
+        Store a live response under a key, replacing any earlier recording of it.
+
+        Keeping the latest response means a retried 429/5xx is replaced by the
+        response the retry finally got.
+
+        Args:
+            key: Request key from make_key()
+            response: Playwright APIResponse
+
+        Returns:
+            An in-memory copy of the response, safe to read after disposal
+        """
+        body = response.body()
+        headers = {name: value for name, value in response.headers.items() if name in _RECORDED_HEADERS}
+        recorded = RecordedResponse(response.status, response.url, headers, body)
+
+        line: Dict[str, Any] = {"key": key, "status": response.status, "url": response.url, "headers": headers}
+        try:
+            line["body"] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            line["body_b64"] = base64.b64encode(body).decode('ascii')
+
+        encoded = json.dumps(line, separators=(',', ':'), ensure_ascii=False)
+        with self._lock:
+            if key in self._index:
+                self._lines[self._index[key]] = encoded
+                self._decoded.pop(key, None)
+            else:
+                self._index[key] = len(self._lines)
+                self._lines.append(encoded)
+        return recorded
+
+    def replay(self, key: str) -> RecordedResponse:
+        """
+        Return the recorded response for a key, decoding its line on first use.
+
+        Raises:
+            CassetteMissError: If the key was never recorded
+        """
+        with self._lock:
+            recorded = self._decoded.get(key)
+            if recorded is None:
+                line_number = self._index.get(key)
+                if line_number is None:
+                    raise CassetteMissError(f"No recorded response for {key} in {self.data_path}")
+                line = json.loads(self._lines[line_number])
+                if "body_b64" in line:
+                    body = base64.b64decode(line["body_b64"])
+                else:
+                    body = line["body"].encode('utf-8')
+                recorded = RecordedResponse(line["status"], line["url"], line["headers"], body)
+                self._decoded[key] = recorded
+            self.replayed += 1
+            return recorded
+
+    def save(self) -> None:
+        """
+        Write the recorded lines and index to disk (record mode only).
+
+        A cassette that recorded nothing is not written, so a process that sent
+        no requests (e.g. the pytest-xdist controller) leaves the file alone.
+        """
+        if self.mode != "record":
+            return
+        if not self._lines:
+            self.logger.info("Nothing recorded, keeping %s as is", self.data_path)
+            return
+
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = "\n".join(self._lines).encode('utf-8')
+            index = {"version": 1, "entries": self._index}
+        with gzip.open(self.data_path, 'wb', compresslevel=6) as f:
+            f.write(payload)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        self.logger.info("Saved cassette with %d responses to %s", len(self._index), self.data_path)
+
+    def _load(self) -> None:
+        """Read the cassette lines and index for replay."""
+        if not self.data_path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.data_path}")
+
+        with gzip.open(self.data_path, 'rb') as f:
+            self._lines = f.read().decode('utf-8').split("\n")
+
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)["entries"]
+        else:
+            # Rebuild the index from the data file when it is missing
+            self._index = {json.loads(line)["key"]: number for number, line in enumerate(self._lines) if line}
+
+        self.logger.info("Loaded cassette with %d responses from %s", len(self._index), self.data_path)
+
+
+class CassetteTransport:
+    """Drop-in stand-in for APIRequestContext that records or replays through a cassette."""
+
+    def __init__(self, api_request_context: Any, cassette: Cassette, base_url: Optional[str] = None):
+        """
+        Args:
+            api_request_context: Live Playwright context (may be None in replay mode)
+            cassette: Cassette to record into or replay from
+            base_url: Client base URL the request keys are relative to
+        """
+        self.api_request_context = api_request_context
+        self.cassette = cassette
+        self.base_url = base_url
+
+    def fetch(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """Issue (or replay) a request with the given method."""
+        key = self.cassette.make_key(method, url, params, self.base_url)
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(key)
+
+        response = getattr(self.api_request_context, method.lower())(url, params=params, **kwargs)
+        return self.cassette.record(key, response)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        return self.fetch("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.fetch("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Any:
+        return self.fetch("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Any:
+        return self.fetch("DELETE", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Any:
+        return self.fetch("PATCH", url, **kwargs)
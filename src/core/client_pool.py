@@ -0,0 +1,162 @@
+"""
+Session-wide API client with pre-warmed request contexts.
+
+A test session builds one client and keeps it for every test instead of
+constructing a client per test. ``ClientPool.warm_up`` then sends a couple of
+cheap requests on the client's own context, which opens its connection before
+the first test runs. The workers of its ``APIRequestContextPool`` each start a
+Playwright instance, so they start on first use unless ``warm_pool`` asks for
+them to be started and warmed too. The returned ``WarmupReport`` compares each
+context's first (cold) request with a repeat (warm) request, which is what
+later requests save.
+
+Under pytest-xdist every worker process builds its own pool; ``name`` labels
+the reports so the controller can show them per worker.
+"""
+
+import logging
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+from playwright.sync_api import APIRequestContext
+from .base_api_client import BaseAPIClient
+from .context_pool import APIRequestContextPool
+
+
+WARMUP_PATH = "/"
+
+
+@dataclass
+class ContextWarmup:
+    """Latency of the first and a repeated request on one request context."""
+
+    context: str
+    cold: float
+    warm: float
+
+    @property
+    def saved(self) -> float:
+        """Seconds the warm request saved over the cold one."""
+        return self.cold - self.warm
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of warming up a ClientPool."""
+
+    name: str
+    contexts: List[ContextWarmup] = field(default_factory=list)
+    pool_start: float = 0.0
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+    reuses: int = 0
+
+    @property
+    def cold_p50(self) -> float:
+        """Median first-request latency across contexts."""
+        return statistics.median(c.cold for c in self.contexts) if self.contexts else 0.0
+
+    @property
+    def warm_p50(self) -> float:
+        """Median repeat-request latency across contexts."""
+        return statistics.median(c.warm for c in self.contexts) if self.contexts else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data form, e.g. for sending from an xdist worker to the controller."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WarmupReport":
+        """Inverse of to_dict."""
+        data = dict(data)
+        data["contexts"] = [ContextWarmup(**c) for c in data.get("contexts", [])]
+        return cls(**data)
+
+
+class ClientPool:
+    """One long-lived client plus its context pool, warmed up before use."""
+
+    def __init__(self, client: BaseAPIClient, context_pool: Optional[APIRequestContextPool] = None, name: str = "main", logger: Optional[logging.Logger] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            client: Client shared by every test of the session
+            context_pool: Worker contexts used by the client's bulk reads and hedges
+            name: Label of this pool in reports (the xdist worker id under xdist)
+            logger: Optional logger instance
+        """
+        self.client = client
+        self.context_pool = context_pool
+        self.name = name
+        self.logger = logger or logging.getLogger(__name__)
+        self.report = WarmupReport(name)
+
+    def acquire(self) -> BaseAPIClient:
+        """Return the shared client, counting the reuse."""
+        self.report.reuses += 1
+        return self.client
+
+    def warm_up(self, path: str = WARMUP_PATH, warm_pool: bool = False) -> WarmupReport:
+        """
+        Send two requests on the session context, and optionally on every pool worker.
+
+        Warm-up requests bypass the client's caches and observers, so they don't
+        show up in metrics, but they do respect its rate limiter. Clients with a
+        cassette are not warmed up. Failures are recorded in the report rather
+        than raised.
+
+        Args:
+            path: Endpoint requested on each context (the API root by default)
+            warm_pool: Also start the context pool and warm each of its workers
+
+        Returns:
+            The pool's WarmupReport
+        """
+        started = time.perf_counter()
+        url = f"{self.client.base_url.rstrip('/')}/{path.lstrip('/')}"
+        report = self.report
+        if self.client.cassette is not None:
+            return report
+
+        if self.client.api_request_context is not None:
+            try:
+                self._record("session", self._probe(self.client.api_request_context, url), None)
+            except Exception as e:
+                self._record("session", None, e)
+
+        if warm_pool and self.context_pool is not None:
+            pool_started = time.perf_counter()
+            self.context_pool.start()
+            results = self.context_pool.broadcast(self._probe, url)
+            report.pool_start = time.perf_counter() - pool_started
+            for result in results:
+                self._record(result.key or "pool", result.data, result.error)
+
+        report.elapsed = time.perf_counter() - started
+        self.logger.info(
+            "ClientPool %s warmed %d contexts in %.0fms (cold p50 %.1fms, warm p50 %.1fms)",
+            self.name, len(report.contexts), report.elapsed * 1000, report.cold_p50 * 1000, report.warm_p50 * 1000,
+        )
+        return report
+
+    def _probe(self, context: APIRequestContext, url: str) -> tuple:
+        """Send the cold and the warm request on one context; returns their latencies."""
+        latencies = []
+        for _ in range(2):
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire()
+            started = time.perf_counter()
+            response = context.get(url)
+            response.body()
+            latencies.append(time.perf_counter() - started)
+            response.dispose()
+        return tuple(latencies)
+
+    def _record(self, context: str, latencies: Optional[tuple], error: Optional[BaseException]) -> None:
+        if error is not None:
+            self.logger.warning("Warm-up of context %s failed: %s", context, error)
+            self.report.errors.append(f"{context}: {str(error)}")
+            return
+        self.report.contexts.append(ContextWarmup(context, *latencies))
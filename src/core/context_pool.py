@@ -0,0 +1,194 @@
+"""
+Thread-backed pool of Playwright API request contexts.
+
+The sync ``APIRequestContext`` is bound to the thread that created it, so the
+pool owns its worker threads and gives each one a private Playwright instance
+and request context for its whole lifetime.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+from playwright.sync_api import sync_playwright
+from ..config.settings import settings
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a single item in a bulk operation."""
+
+    key: Any
+    data: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item completed without an error."""
+        return self.error is None
+
+
+class APIRequestContextPool:
+    """Fixed-size pool of worker threads, each owning one APIRequestContext."""
+
+    def __init__(self, size: int, timeout: Optional[int] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the pool. Worker threads are started lazily on first use.
+
+        Args:
+            size: Number of worker threads (and request contexts)
+            timeout: Request timeout in milliseconds (defaults to settings.timeout)
+            logger: Optional logger instance
+        """
+        if size <= 0:
+            raise ValueError(f"Invalid pool size: {size}. Must be positive")
+
+        self.size = size
+        self.timeout = timeout or settings.timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self._tasks: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "APIRequestContextPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the worker threads if they are not running yet."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("APIRequestContextPool is closed")
+            if self._threads:
+                return
+            for index in range(self.size):
+                thread = threading.Thread(target=self._worker, name=f"api-context-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self.logger.info("APIRequestContextPool started with %d workers", self.size)
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """
+        Schedule ``func(context, *args)`` on the next free worker.
+
+        Args:
+            func: Callable receiving the worker's APIRequestContext first
+            *args: Extra positional arguments for func
+
+        Returns:
+            Future resolving to the callable's return value
+        """
+        self.start()
+        future: Future = Future()
+        self._tasks.put((future, func, args))
+        return future
+
+    def broadcast(self, func: Callable[..., Any], *args: Any, timeout: float = 30.0) -> List[BulkResult]:
+        """
+        Run ``func(context, *args)`` once on every worker, e.g. to warm up connections.
+
+        Each task waits at a barrier until all workers have picked one up, so no
+        worker runs two of them.
+
+        Args:
+            func: Callable receiving the worker's APIRequestContext first
+            *args: Extra positional arguments for func
+            timeout: Seconds to wait for all workers to arrive before running anyway
+
+        Returns:
+            One BulkResult per worker keyed by the worker thread name
+        """
+        barrier = threading.Barrier(self.size)
+
+        def run(context: Any) -> Any:
+            try:
+                barrier.wait(timeout)
+            except threading.BrokenBarrierError:
+                pass  # a worker failed to start; run on the ones that did
+            return threading.current_thread().name, func(context, *args)
+
+        results = []
+        for future in [self.submit(run) for _ in range(self.size)]:
+            try:
+                name, data = future.result()
+                results.append(BulkResult(key=name, data=data))
+            except Exception as e:
+                results.append(BulkResult(key=None, error=e))
+        return results
+
+    def owns_current_thread(self) -> bool:
+        """Whether the caller runs on one of the pool's workers (and must not block on the pool)."""
+        return threading.current_thread() in self._threads
+
+    def map(self, func: Callable[..., Any], items: Iterable[Any]) -> List[BulkResult]:
+        """
+        Apply ``func(context, item)`` to every item across the pool.
+
+        Args:
+            func: Callable receiving the worker's APIRequestContext and an item
+            items: Items to process
+
+        Returns:
+            One BulkResult per item, in input order; failures are captured, not raised
+        """
+        items = list(items)
+        futures = [self.submit(func, item) for item in items]
+
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(BulkResult(key=item, data=future.result()))
+            except Exception as e:
+                results.append(BulkResult(key=item, error=e))
+        return results
+
+    def close(self) -> None:
+        """Stop the workers and dispose of their request contexts."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads, self._threads = self._threads, []
+
+        for _ in threads:
+            self._tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+    def _worker(self) -> None:
+        """Worker loop: own one Playwright instance and context, run tasks until stopped."""
+        playwright = context = None
+        startup_error: Optional[BaseException] = None
+        try:
+            playwright = sync_playwright().start()
+            context = playwright.request.new_context(timeout=self.timeout)
+        except Exception as e:
+            self.logger.error("Failed to start APIRequestContext worker: %s", e)
+            startup_error = e
+
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    break
+                future, func, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if startup_error is not None:
+                    future.set_exception(startup_error)
+                    continue
+                try:
+                    future.set_result(func(context, *args))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            if context is not None:
+                context.dispose()
+            if playwright is not None:
+                playwright.stop()
@@ -0,0 +1,248 @@
+"""
+Breadth-first crawler over the PokéAPI resource graph.
+
+Starting from the API root, every API link found in a response (resource
+``url`` fields, pagination ``next`` links, ``location_area_encounters`` and
+so on) is queued once, keyed by its canonical URL. Fetched payloads are
+streamed to a sink instead of being kept, so the crawler only holds the
+frontier and the visited keys in memory. Progress can be checkpointed to a
+JSON file and resumed after an interruption.
+"""
+
+import gzip
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Union
+from playwright.sync_api import APIRequestContext
+from ..config.settings import test_settings
+from ..utils.urls import canonicalize_url, split_api_url
+from .base_api_client import BaseAPIClient
+from .context_pool import APIRequestContextPool
+
+
+Sink = Callable[[str, Any], None]
+
+
+@dataclass
+class CrawlStats:
+    """Counters for a crawl (cumulative across resumes)."""
+
+    fetched: int = 0
+    failed: int = 0
+    discovered: int = 0
+    max_frontier: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def extract_api_links(payload: Any) -> Iterator[str]:
+    """
+    Yield every absolute http(s) URL found anywhere in a JSON payload.
+
+    Args:
+        payload: Decoded JSON value
+
+    Yields:
+        URL strings in document order; non-API URLs are filtered by the crawler
+    """
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item.startswith(("http://", "https://")):
+                yield item
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+
+class JsonlSink:
+    """Appends fetched resources to a JSON Lines file (gzip-compressed for .gz paths)."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open the sink for appending, so resumed crawls extend the same file.
+
+        Args:
+            path: Output file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.suffix == ".gz":
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+        else:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self.written = 0
+
+    def __call__(self, url: str, data: Any) -> None:
+        self._file.write(json.dumps({"url": url, "data": data}, separators=(',', ':')))
+        self._file.write("\n")
+        self.written += 1
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self._file.close()
+
+
+class APICrawler:
+    """Crawls every API resource reachable from the seeds with bounded concurrency."""
+
+    def __init__(self, client: BaseAPIClient, sink: Optional[Sink] = None, concurrency: Optional[int] = None, checkpoint_path: Optional[Union[str, Path]] = None, checkpoint_every: int = 500, families: Optional[Iterable[str]] = None, max_resources: Optional[int] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the crawler.
+
+        Args:
+            client: Client whose base URL and caches are used; its context pool is
+                reused when it has one, otherwise a temporary pool is created
+            sink: Called as ``sink(canonical_url, data)`` for every fetched resource
+            concurrency: Maximum in-flight requests (defaults to the pool size or
+                TestSettings.parallel_workers)
+            checkpoint_path: JSON file for checkpoint/resume; None disables checkpoints
+            checkpoint_every: Number of fetched resources between checkpoints
+            families: Restrict the crawl to these resource families (the root index
+                is always fetched)
+            max_resources: Stop scheduling new requests after this many fetches
+            logger: Optional logger instance
+        """
+        self.client = client
+        self.sink = sink
+        self.concurrency = concurrency or (client.context_pool.size if client.context_pool is not None else test_settings.parallel_workers)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.checkpoint_every = checkpoint_every
+        self.families = set(families) if families else None
+        self.max_resources = max_resources
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.stats = CrawlStats()
+        self.visited: Set[str] = set()
+        self.frontier: Deque[str] = deque()
+        self._in_flight: Dict[Future, str] = {}
+
+    def crawl(self, seeds: Iterable[str] = ("/",), resume: bool = True) -> CrawlStats:
+        """
+        Run the crawl until the frontier is exhausted or max_resources is reached.
+
+        Args:
+            seeds: Endpoints or absolute URLs to start from; ignored when resuming
+            resume: Continue from the checkpoint file if one exists
+
+        Returns:
+            Crawl statistics, including per-URL error messages
+        """
+        if resume and self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self._load_checkpoint()
+        else:
+            for seed in seeds:
+                self._enqueue(seed if "://" in seed else f"{self.client.base_url.rstrip('/')}{seed}")
+
+        if self.client.context_pool is not None:
+            self._run(self.client.context_pool)
+        else:
+            with APIRequestContextPool(self.concurrency, logger=self.logger) as pool:
+                self._run(pool)
+        return self.stats
+
+    def _run(self, pool: APIRequestContextPool) -> None:
+        """Main loop: keep the pool busy, drain completions, expand the frontier."""
+        def fetch(context: APIRequestContext, endpoint: str, params: Dict[str, str]) -> Any:
+            return self.client.with_context(context).get(endpoint, params=params or None)
+
+        since_checkpoint = 0
+        try:
+            while self.frontier or self._in_flight:
+                while self.frontier and len(self._in_flight) < self.concurrency and not self._limit_reached():
+                    key = self.frontier.popleft()
+                    endpoint, params = split_api_url(key, self.client.base_url)
+                    self._in_flight[pool.submit(fetch, endpoint, params)] = key
+                if not self._in_flight:
+                    break
+
+                done, _ = wait(list(self._in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = self._in_flight.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        self.stats.failed += 1
+                        self.stats.errors[key] = str(e)
+                        continue
+
+                    self.stats.fetched += 1
+                    since_checkpoint += 1
+                    if self.sink is not None:
+                        self.sink(key, data)
+                    for link in extract_api_links(data):
+                        self._enqueue(link)
+
+                self.stats.max_frontier = max(self.stats.max_frontier, len(self.frontier))
+                if self.checkpoint_path is not None and since_checkpoint >= self.checkpoint_every:
+                    self._save_checkpoint()
+                    since_checkpoint = 0
+        finally:
+            # Requests still running are put back so a resumed crawl re-fetches them
+            for future in list(self._in_flight):
+                future.cancel()
+                self.frontier.appendleft(self._in_flight.pop(future))
+            if self.checkpoint_path is not None:
+                self._save_checkpoint()
+
+        self.logger.info("Crawl finished: %d fetched, %d failed, %d left in frontier", self.stats.fetched, self.stats.failed, len(self.frontier))
+
+    def _limit_reached(self) -> bool:
+        return self.max_resources is not None and self.stats.fetched + len(self._in_flight) >= self.max_resources
+
+    def _enqueue(self, url: str) -> None:
+        """Queue a link once, rebased onto the client's base URL."""
+        try:
+            endpoint, params = split_api_url(url, self.client.base_url)
+        except ValueError:
+            return  # not an API link (e.g. sprite images)
+
+        family = endpoint.strip('/').split('/')[0]
+        if self.families is not None and family and family not in self.families:
+            return
+
+        key = canonicalize_url(f"{self.client.base_url.rstrip('/')}{endpoint}", params)
+        if key in self.visited:
+            return
+        self.visited.add(key)
+        self.frontier.append(key)
+        self.stats.discovered += 1
+
+    def _save_checkpoint(self) -> None:
+        """Atomically write visited keys, frontier and stats to the checkpoint file."""
+        state = {
+            "base_url": self.client.base_url,
+            "visited": sorted(self.visited),
+            "frontier": list(self.frontier),
+            "stats": asdict(self.stats),
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.replace(temp_path, self.checkpoint_path)
+        self.logger.info("Crawl checkpoint: %d fetched, %d queued", self.stats.fetched, len(self.frontier))
+
+    def _load_checkpoint(self) -> None:
+        """Restore crawl state from the checkpoint file."""
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state["base_url"].rstrip('/') != self.client.base_url.rstrip('/'):
+            raise ValueError(f"Checkpoint {self.checkpoint_path} was written for {state['base_url']}, not {self.client.base_url}")
+
+        self.visited = set(state["visited"])
+        self.frontier = deque(state["frontier"])
+        self.stats = CrawlStats(**state["stats"])
+        self.logger.info("Resuming crawl with %d fetched and %d queued", self.stats.fetched, len(self.frontier))
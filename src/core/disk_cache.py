@@ -0,0 +1,175 @@
+"""
+Persistent on-disk HTTP cache with ETag / Last-Modified revalidation.
+
+Bodies are kept in a SQLite database in WAL mode, so several processes (for
+example pytest-xdist workers) can read it concurrently while one writes.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass
+class StoredResponse:
+    """A response body persisted together with its validators."""
+
+    key: str
+    status: int
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the server to revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class DiskCacheStats:
+    """Counters describing disk cache effectiveness."""
+
+    lookups: int = 0
+    revalidated: int = 0
+    stored: int = 0
+    evictions: int = 0
+
+
+class DiskHTTPCache:
+    """SQLite-backed response store bounded by total body size."""
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 256 * 1024 * 1024, filename: str = "http-cache.sqlite3", logger: Optional[logging.Logger] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            directory: Directory holding the cache database
+            max_bytes: Maximum total size of stored bodies in bytes
+            filename: Database file name inside the directory
+            logger: Optional logger instance
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Invalid max_bytes: {max_bytes}. Must be positive")
+
+        self.path = Path(directory) / filename
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats = DiskCacheStats()
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self.logger.info("DiskHTTPCache opened at %s", self.path)
+
+    def lookup(self, key: str) -> Optional[StoredResponse]:
+        """
+        Fetch a stored response.
+
+        Args:
+            key: Canonical request URL
+
+        Returns:
+            The stored response, or None if the key is unknown
+        """
+        with self._lock:
+            self.stats.lookups += 1
+            row = self._connection.execute(
+                "SELECT status, body, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, body, etag, last_modified = row
+        return StoredResponse(key=key, status=status, body=bytes(body), etag=etag, last_modified=last_modified)
+
+    def touch(self, key: str) -> None:
+        """Record that a stored response was revalidated (304) and used."""
+        with self._lock:
+            self.stats.revalidated += 1
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+    def store(self, key: str, status: int, body: bytes, headers: Mapping[str, str]) -> bool:
+        """
+        Persist a response if it carries a validator, then enforce the size bound.
+
+        Args:
+            key: Canonical request URL
+            status: HTTP status code
+            body: Raw response body
+            headers: Response headers (lower-case names, as returned by Playwright)
+
+        Returns:
+            Whether the response was stored
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not (200 <= status < 300) or not (etag or last_modified) or len(body) > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, status, etag, last_modified, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, status, etag, last_modified, body, len(body), now, now),
+            )
+            self.stats.stored += 1
+            self._evict()
+        return True
+
+    def total_bytes(self) -> int:
+        """Total size of stored bodies in bytes."""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """Drop least recently used responses until under max_bytes; caller holds the lock."""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+        self.logger.info("DiskHTTPCache evicted %d responses", len(victims))
@@ -0,0 +1,175 @@
+"""
+Hedged requests for idempotent GETs.
+
+When a response has not arrived within a percentile of recently observed
+latency, a duplicate request is sent on another connection and whichever
+answers first is used. Hedges are paid for from a token budget that refills
+by a fixed fraction of requests, so the extra load stays bounded even when
+the whole API slows down.
+
+The sync client sends both requests on its APIRequestContextPool. A sync
+Playwright request that has started cannot be aborted, so the losing request
+is cancelled if it is still queued and otherwise left to finish and dropped.
+The async client cancels the losing task.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, TimeoutError, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple
+from .context_pool import APIRequestContextPool
+from .resilience import RetryBudget
+
+
+@dataclass
+class HedgeStats:
+    """Counters describing hedging activity."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    capped: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that sent a hedge."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that answered before the original request."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class HedgePolicy:
+    """Decides when to hedge and keeps the latency window and hedge budget."""
+
+    def __init__(self, percentile: float = 95.0, max_hedge_ratio: float = 0.05, min_delay: float = 0.005, window: int = 1000, min_samples: int = 50, recompute_every: int = 32):
+        """
+        Initialize the policy. Share one instance between clients to cap hedging globally.
+
+        Args:
+            percentile: Recent-latency percentile after which a hedge is sent
+            max_hedge_ratio: Hedges allowed per request (0.05 adds at most 5% load)
+            min_delay: Lower bound on the hedge delay in seconds
+            window: Number of recent latencies kept
+            min_samples: Latencies needed before hedging starts
+            recompute_every: Samples between recomputations of the hedge delay
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(f"Invalid hedge percentile: {percentile}. Must be between 0 and 100")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self.budget = RetryBudget(ratio=max_hedge_ratio, min_retries=1)
+        self.stats = HedgeStats()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._delay: Optional[float] = None
+        self._since_recompute = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while the latency window is warming up."""
+        return self._delay
+
+    def observe(self, latency: float) -> None:
+        """Add a request latency to the window."""
+        with self._lock:
+            self._latencies.append(latency)
+            self._since_recompute += 1
+            if len(self._latencies) < self.min_samples or (self._delay is not None and self._since_recompute < self.recompute_every):
+                return
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, int(self.percentile / 100 * len(ordered)))
+            self._delay = max(self.min_delay, ordered[index])
+            self._since_recompute = 0
+
+    def run(self, pool: APIRequestContextPool, fetch: Callable[..., Any]) -> Tuple[Any, bool, bool]:
+        """
+        Run ``fetch(context)`` on the pool, hedging it on a second worker if it is slow.
+
+        Args:
+            pool: Pool providing the request contexts
+            fetch: Performs the request on a context; must return a thread-independent
+                response (body already read)
+
+        Returns:
+            Tuple of (response, hedged, hedge won)
+
+        Raises:
+            Exception: If every sent request failed
+        """
+        started = time.perf_counter()
+        self._start()
+        primary = pool.submit(fetch)
+        delay = self._delay
+        if delay is None:
+            return self._finish(started, primary.result(), False, False)
+        try:
+            return self._finish(started, primary.result(timeout=delay), False, False)
+        except TimeoutError:
+            pass
+
+        if not self._admit_hedge():
+            return self._finish(started, primary.result(), False, False)
+
+        hedge = pool.submit(fetch)
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        other = hedge if winner is primary else primary
+        if winner.exception() is not None:
+            # The first answer failed; the other request may still succeed
+            winner, other = other, winner
+        other.cancel()
+        return self._finish(started, winner.result(), True, winner is hedge)
+
+    async def run_async(self, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool, bool]:
+        """Coroutine version of run; the losing request is cancelled, and so is every request if the caller is."""
+        started = time.perf_counter()
+        self._start()
+        primary = asyncio.ensure_future(fetch())
+        tasks = [primary]
+        try:
+            delay = self._delay
+            if delay is not None:
+                done, _ = await asyncio.wait([primary], timeout=delay)
+                if not done and self._admit_hedge():
+                    hedge = asyncio.ensure_future(fetch())
+                    tasks.append(hedge)
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    winner = primary if primary in done else hedge
+                    if winner.exception() is not None:
+                        # The first answer failed; the other request may still succeed
+                        winner = hedge if winner is primary else primary
+                        await asyncio.wait([winner])
+                    return self._finish(started, winner.result(), True, winner is hedge)
+            return self._finish(started, await primary, False, False)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _start(self) -> None:
+        with self._lock:
+            self.stats.requests += 1
+        self.budget.deposit()
+
+    def _admit_hedge(self) -> bool:
+        if not self.budget.withdraw():
+            with self._lock:
+                self.stats.capped += 1
+            return False
+        with self._lock:
+            self.stats.hedged += 1
+        return True
+
+    def _finish(self, started: float, response: Any, hedged: bool, won: bool) -> Tuple[Any, bool, bool]:
+        if won:
+            with self._lock:
+                self.stats.hedge_wins += 1
+        self.observe(time.perf_counter() - started)
+        return response, hedged, won
@@ -0,0 +1,369 @@
+"""
+Open-loop load generation on top of PokemonAPIClient.
+
+Requests are issued on a fixed arrival schedule (constant or Poisson) at the
+target rate, independently of how fast earlier requests complete. Latency is
+measured from each request's scheduled start, so time spent waiting for a free
+worker counts: a stalled server shows up as growing latency instead of a
+silently lower request rate (coordinated omission). Results are reported per
+time window as latency percentiles and error rates.
+
+Usage:
+    python -m src.core.load_generator --rps 200 --duration 30 --mix by-id=6,by-name=3,list=1
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from playwright.sync_api import APIRequestContext, sync_playwright
+from ..api.pokemon_client import PokemonAPIClient
+from ..server.snapshot import Snapshot
+from ..server.stub_server import FaultProfile, run_stub_server
+from .context_pool import APIRequestContextPool
+from .metrics import LatencyHistogram
+
+
+# Operations receive the client, the Pokémon to draw from and a per-request random source
+Operation = Callable[[PokemonAPIClient, List[Dict[str, Any]], random.Random], object]
+
+ARRIVALS = ("constant", "poisson")
+DEFAULT_MIX = {"by-id": 6.0, "by-name": 3.0, "list": 1.0}
+
+
+@dataclass
+class WindowStats:
+    """Outcome of the requests scheduled within one report window."""
+
+    start: float
+    scheduled: int = 0
+    completed: int = 0
+    errors: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of completed requests that failed."""
+        return self.errors / self.completed if self.completed else 0.0
+
+
+@dataclass
+class LoadReport:
+    """Summary of a load run plus its latency and error-rate series."""
+
+    target_rps: float
+    duration: float
+    concurrency: int
+    scheduled: int
+    completed: int
+    errors: int
+    achieved_rps: float
+    max_backlog: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    windows: List[WindowStats] = field(default_factory=list)
+    error_types: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, object]:
+        """JSON-serializable form, including each window's error rate."""
+        report = asdict(self)
+        for window, data in zip(self.windows, report["windows"]):
+            data["error_rate"] = window.error_rate
+        return report
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as ``by-id=6,by-name=3,list=1``.
+
+    Args:
+        spec: Comma-separated name=weight pairs
+
+    Returns:
+        Weights by operation name
+
+    Raises:
+        ValueError: If an entry is malformed, unknown or has a non-positive weight
+    """
+    mix = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, weight = entry.partition('=')
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}. Available: {', '.join(sorted(OPERATIONS))}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight in operation mix: {entry}")
+        if mix[name] <= 0:
+            raise ValueError(f"Invalid weight in operation mix: {entry}. Must be positive")
+    if not mix:
+        raise ValueError("Operation mix is empty")
+    return mix
+
+
+def arrival_offsets(rps: float, duration: float, arrival: str = "constant", rng: Optional[random.Random] = None) -> List[float]:
+    """
+    Scheduled start times (seconds from the beginning of the run).
+
+    Args:
+        rps: Target request rate
+        duration: Run length in seconds
+        arrival: 'constant' for evenly spaced requests, 'poisson' for exponential gaps
+        rng: Random source for Poisson arrivals
+
+    Returns:
+        Increasing offsets below duration
+
+    Raises:
+        ValueError: If the rate, duration or arrival process is invalid
+    """
+    if rps <= 0 or duration <= 0:
+        raise ValueError(f"Invalid load: {rps} rps for {duration}s. Both must be positive")
+    if arrival == "constant":
+        return [index / rps for index in range(int(rps * duration))]
+    if arrival == "poisson":
+        rng = rng or random.Random()
+        offsets, offset = [], rng.expovariate(rps)
+        while offset < duration:
+            offsets.append(offset)
+            offset += rng.expovariate(rps)
+        return offsets
+    raise ValueError(f"Unknown arrival process: {arrival}. Available: {', '.join(ARRIVALS)}")
+
+
+class LoadGenerator:
+    """Drives a weighted mix of client operations at a target rate."""
+
+    def __init__(self, client: PokemonAPIClient, rps: float, duration: float, mix: Optional[Dict[str, float]] = None, concurrency: int = 16, arrival: str = "constant", window: float = 1.0, pool_size: int = 100, seed: Optional[int] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            client: Client whose base URL and caches are used; requests run on
+                a dedicated context pool of `concurrency` workers
+            rps: Target request rate
+            duration: Run length in seconds
+            mix: Operation weights (see OPERATIONS); defaults to DEFAULT_MIX
+            concurrency: Maximum in-flight requests; further requests queue and
+                their wait counts toward latency
+            arrival: Arrival process, 'constant' or 'poisson'
+            window: Report window length in seconds
+            pool_size: Number of distinct Pokémon the operations draw from
+            seed: Seed for the arrival process and operation choice
+            logger: Optional logger instance
+        """
+        if concurrency <= 0:
+            raise ValueError(f"Invalid concurrency: {concurrency}. Must be positive")
+        self.client = client
+        self.rps = rps
+        self.duration = duration
+        self.mix = mix or dict(DEFAULT_MIX)
+        self.concurrency = concurrency
+        self.arrival = arrival
+        self.window = window
+        self.pool_size = pool_size
+        self.rng = random.Random(seed)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._overall = LatencyHistogram()
+        self._windows: Dict[int, LatencyHistogram] = {}
+        self._stats: Dict[int, WindowStats] = {}
+        self._error_types: Dict[str, int] = {}
+        self._outstanding = 0
+        self._max_backlog = 0
+        self._pokemon: List[Dict[str, Any]] = []
+
+    def run(self) -> LoadReport:
+        """
+        Execute the run and wait for every scheduled request to finish.
+
+        Returns:
+            Load report with per-window latency percentiles and error counts
+        """
+        offsets = arrival_offsets(self.rps, self.duration, self.arrival, self.rng)
+        names = list(self.mix)
+        choices = self.rng.choices(names, weights=[self.mix[name] for name in names], k=len(offsets))
+        seeds = [self.rng.getrandbits(32) for _ in offsets]
+        self._pokemon = self._pokemon_pool()
+
+        with APIRequestContextPool(self.concurrency, logger=self.logger) as pool:
+            self._warm_up(pool)
+            futures: List[Future] = []
+            started = time.perf_counter()
+            for offset, name, seed in zip(offsets, choices, seeds):
+                delay = started + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                with self._lock:
+                    self._outstanding += 1
+                    self._max_backlog = max(self._max_backlog, self._outstanding)
+                    self._window_stats(offset).scheduled += 1
+                futures.append(pool.submit(self._execute, OPERATIONS[name], started + offset, offset, seed))
+            for future in futures:
+                future.result()
+            elapsed = time.perf_counter() - started
+
+        return self._report(len(offsets), elapsed)
+
+    def _pokemon_pool(self) -> List[Dict[str, Any]]:
+        """Names and ids of the Pokémon the operations draw from."""
+        results = self.client.list_pokemon(limit=self.pool_size)["results"]
+        return [{"name": item["name"], "id": int(item["url"].rstrip('/').rsplit('/', 1)[-1])} for item in results]
+
+    def _warm_up(self, pool: APIRequestContextPool) -> None:
+        """Start every worker's Playwright context before the clock starts."""
+        barrier = threading.Barrier(self.concurrency)
+
+        def ready(context: APIRequestContext) -> None:
+            barrier.wait(timeout=60)
+
+        for future in [pool.submit(ready) for _ in range(self.concurrency)]:
+            future.result()
+
+    def _execute(self, context: APIRequestContext, operation: Operation, scheduled_at: float, offset: float, seed: int) -> None:
+        """Run one operation; latency is measured from its scheduled start."""
+        error = None
+        try:
+            operation(self.client.with_context(context), self._pokemon, random.Random(seed))
+        except Exception as e:
+            error = _error_label(e)
+        latency = time.perf_counter() - scheduled_at
+
+        with self._lock:
+            self._outstanding -= 1
+            stats = self._window_stats(offset)
+            stats.completed += 1
+            if error is not None:
+                stats.errors += 1
+                self._error_types[error] = self._error_types.get(error, 0) + 1
+            self._windows.setdefault(int(offset // self.window), LatencyHistogram()).record(latency)
+        self._overall.record(latency)
+
+    def _window_stats(self, offset: float) -> WindowStats:
+        index = int(offset // self.window)
+        stats = self._stats.get(index)
+        if stats is None:
+            stats = self._stats[index] = WindowStats(start=index * self.window)
+        return stats
+
+    def _report(self, scheduled: int, elapsed: float) -> LoadReport:
+        windows = []
+        for index in sorted(self._stats):
+            stats, histogram = self._stats[index], self._windows.get(index)
+            if histogram is not None:
+                stats.p50_ms, stats.p95_ms, stats.p99_ms = (round(histogram.percentile(p) * 1000, 3) for p in (50, 95, 99))
+                stats.max_ms = round(histogram.max * 1000, 3)
+            windows.append(stats)
+
+        completed = sum(stats.completed for stats in windows)
+        return LoadReport(
+            target_rps=self.rps, duration=self.duration, concurrency=self.concurrency,
+            scheduled=scheduled, completed=completed, errors=sum(stats.errors for stats in windows),
+            achieved_rps=round(completed / elapsed, 1) if elapsed else 0.0, max_backlog=self._max_backlog,
+            p50_ms=round(self._overall.percentile(50) * 1000, 3), p95_ms=round(self._overall.percentile(95) * 1000, 3),
+            p99_ms=round(self._overall.percentile(99) * 1000, 3), max_ms=round(self._overall.max * 1000, 3),
+            windows=windows, error_types=dict(self._error_types),
+        )
+
+
+def _error_label(error: Exception) -> str:
+    """Group failures by HTTP status ('HTTP 503') or exception type."""
+    match = re.match(r"HTTP \d+", str(error))
+    return match.group(0) if match else type(error).__name__
+
+
+def _by_id(client: PokemonAPIClient, pokemon: List[Dict[str, Any]], rng: random.Random) -> object:
+    return client.get_pokemon_by_id(rng.choice(pokemon)["id"])
+
+
+def _by_name(client: PokemonAPIClient, pokemon: List[Dict[str, Any]], rng: random.Random) -> object:
+    return client.get_pokemon_by_name(rng.choice(pokemon)["name"])
+
+
+def _list(client: PokemonAPIClient, pokemon: List[Dict[str, Any]], rng: random.Random) -> object:
+    return client.list_pokemon(limit=20, offset=rng.randrange(max(1, len(pokemon) // 20)) * 20)
+
+
+OPERATIONS: Dict[str, Operation] = {
+    "by-id": _by_id,
+    "by-name": _by_name,
+    "list": _list,
+}
+
+
+def format_report(report: LoadReport) -> str:
+    """Render a load report as a latency-over-time table."""
+    lines = [
+        f"target {report.target_rps:g} rps for {report.duration:g}s, concurrency {report.concurrency}: "
+        f"{report.completed}/{report.scheduled} completed, {report.errors} errors, {report.achieved_rps:g} rps achieved, "
+        f"max backlog {report.max_backlog}",
+        f"overall p50={report.p50_ms:.1f}ms p95={report.p95_ms:.1f}ms p99={report.p99_ms:.1f}ms max={report.max_ms:.1f}ms",
+        f"{'t (s)':>7} {'sched':>6} {'done':>6} {'err %':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for window in report.windows:
+        lines.append(
+            f"{window.start:>7.1f} {window.scheduled:>6} {window.completed:>6} {window.error_rate * 100:>6.1f} "
+            f"{window.p50_ms:>9.1f} {window.p95_ms:>9.1f} {window.p99_ms:>9.1f} {window.max_ms:>9.1f}"
+        )
+    if report.error_types:
+        lines.append("errors: " + ", ".join(f"{name}={count}" for name, count in sorted(report.error_types.items())))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Open-loop load generator for PokemonAPIClient")
+    parser.add_argument("--base-url", default=None, help="API base URL (default: an in-process stub server)")
+    parser.add_argument("--rps", type=float, default=100.0, help="Target requests per second (default: 100)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Run length in seconds (default: 10)")
+    parser.add_argument("--mix", default="by-id=6,by-name=3,list=1", help="Weighted operation mix (default: by-id=6,by-name=3,list=1)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum in-flight requests (default: 16)")
+    parser.add_argument("--arrival", choices=ARRIVALS, default="constant", help="Arrival process (default: constant)")
+    parser.add_argument("--window", type=float, default=1.0, help="Report window in seconds (default: 1)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for arrivals and operation choice")
+    parser.add_argument("--stub-latency", default="none", help="Latency injected by the built-in stub, e.g. lognormal:20:0.5")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0, help="Error rate injected by the built-in stub")
+    parser.add_argument("--output", type=Path, default=None, help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s [%(levelname)8s] %(name)s: %(message)s')
+    # Failures are counted in the report; logging each one would distort the run
+    client_logger = logging.getLogger(f"{__name__}.client")
+    client_logger.setLevel(logging.CRITICAL)
+    with ExitStack() as stack:
+        base_url = args.base_url
+        if base_url is None:
+            faults = FaultProfile(latency=args.stub_latency, error_rate=args.stub_error_rate, seed=args.seed)
+            base_url = stack.enter_context(run_stub_server(Snapshot.synthetic(pokemon_count=200), faults=faults)).base_url
+        playwright = stack.enter_context(sync_playwright())
+        context = playwright.request.new_context()
+        stack.callback(context.dispose)
+
+        generator = LoadGenerator(
+            PokemonAPIClient(context, base_url=base_url, logger=client_logger), rps=args.rps, duration=args.duration, mix=parse_mix(args.mix),
+            concurrency=args.concurrency, arrival=args.arrival, window=args.window, seed=args.seed,
+        )
+        report = generator.run()
+
+    print(format_report(report))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+In-process request metrics: HDR-style latency histograms, counters and an
+OpenMetrics text export.
+
+BaseAPIClient reports one RequestTiming per request to its observers;
+MetricsObserver turns those into per-endpoint histograms (one per phase) and
+counters in a MetricsRegistry.
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+REQUEST_DURATION = "pokeapi_request_duration_seconds"
+REQUESTS = "pokeapi_requests"
+RESPONSE_BYTES = "pokeapi_response_bytes"
+HEDGES = "pokeapi_hedges"
+
+PHASES = ("throttle", "send", "read", "decode", "validate", "total")
+
+# Bucket boundaries (seconds) used for the OpenMetrics histogram export
+EXPORT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class RequestTiming:
+    """Timings and outcome of one client request (phase durations in seconds; throttle is rate-limiter wait)."""
+
+    method: str
+    endpoint: str
+    url: str
+    source: str = "network"
+    status: int = 0
+    response_bytes: int = 0
+    throttle: Optional[float] = None
+    send: Optional[float] = None
+    read: Optional[float] = None
+    decode: Optional[float] = None
+    validate: Optional[float] = None
+    total: float = 0.0
+    error: Optional[str] = None
+    hedged: bool = False
+    hedge_won: bool = False
+    started: float = field(default=0.0, repr=False, compare=False)
+
+
+RequestObserver = Callable[[RequestTiming], None]
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram in the style of HdrHistogram.
+
+    Values are recorded with microsecond resolution into buckets whose width
+    grows with magnitude, keeping the relative error below 2**-sub_bucket_bits
+    (under 1% by default) with a small, sparse set of counters.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        """
+        Initialize the histogram.
+
+        Args:
+            sub_bucket_bits: Precision; each power-of-two range is split into 2**bits buckets
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_buckets = 1 << sub_bucket_bits
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        index = self._index(max(0, int(seconds * 1_000_000)))
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.sum += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Value at the given percentile, in seconds.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Highest value equivalent to the bucket holding that rank (0.0 when empty)
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(percent / 100.0 * self.count))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(self._upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    def count_at_or_below(self, seconds: float) -> int:
+        """Number of recorded values whose bucket lies entirely at or below the bound."""
+        limit = seconds * 1_000_000
+        with self._lock:
+            return sum(count for index, count in self._counts.items() if self._upper_bound(index) <= limit)
+
+    def _index(self, value: int) -> int:
+        if value < 2 * self._sub_buckets:
+            return value
+        shift = value.bit_length() - (self.sub_bucket_bits + 1)
+        return (shift + 1) * self._sub_buckets + (value >> shift) - self._sub_buckets
+
+    def _upper_bound(self, index: int) -> int:
+        if index < 2 * self._sub_buckets:
+            return index
+        shift = index // self._sub_buckets - 1
+        mantissa = index % self._sub_buckets + self._sub_buckets
+        return ((mantissa + 1) << shift) - 1
+
+
+class Counter:
+    """Monotonic counter."""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self.value += amount
+
+
+@dataclass
+class EndpointLatency:
+    """Latency percentiles of one endpoint template."""
+
+    method: str
+    endpoint: str
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class MetricsRegistry:
+    """Named, labelled histograms and counters with OpenMetrics export."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[Labels, LatencyHistogram]] = {}
+        self._counters: Dict[str, Dict[Labels, Counter]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, **labels: str) -> LatencyHistogram:
+        """Get or create the histogram for name and labels."""
+        key = tuple(sorted(labels.items()))
+        family = self._histograms.get(name, {})
+        metric = family.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(name, {}).setdefault(key, LatencyHistogram())
+        return metric
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        """Get or create the counter for name and labels."""
+        key = tuple(sorted(labels.items()))
+        family = self._counters.get(name, {})
+        metric = family.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(name, {}).setdefault(key, Counter())
+        return metric
+
+    def histograms(self, name: str) -> Dict[Labels, LatencyHistogram]:
+        """All histograms of a metric family, keyed by sorted label pairs."""
+        with self._lock:
+            return dict(self._histograms.get(name, {}))
+
+    def latency_summary(self, phase: str = "total") -> List[EndpointLatency]:
+        """
+        Per-endpoint request latency percentiles.
+
+        Args:
+            phase: Request phase to summarize (see PHASES)
+
+        Returns:
+            One row per (method, endpoint), ordered by endpoint
+        """
+        rows = []
+        for labels, histogram in self.histograms(REQUEST_DURATION).items():
+            values = dict(labels)
+            if values.get("phase") != phase or not histogram.count:
+                continue
+            rows.append(EndpointLatency(
+                method=values.get("method", ""), endpoint=values.get("endpoint", ""), count=histogram.count,
+                p50=histogram.percentile(50), p95=histogram.percentile(95), p99=histogram.percentile(99), max=histogram.max,
+            ))
+        return sorted(rows, key=lambda row: (row.endpoint, row.method))
+
+    def to_openmetrics(self) -> str:
+        """Render every metric in the OpenMetrics text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            histograms = {name: dict(family) for name, family in self._histograms.items()}
+            counters = {name: dict(family) for name, family in self._counters.items()}
+
+        for name, family in sorted(histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# UNIT {name} seconds")
+            for labels, histogram in sorted(family.items()):
+                for bound in EXPORT_BUCKETS:
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', repr(bound)),))} {histogram.count_at_or_below(bound)}")
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+
+        for name, family in sorted(counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for labels, counter in sorted(family.items()):
+                lines.append(f"{name}_total{_format_labels(labels)} {counter.value!r}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class MetricsObserver:
+    """Request observer that feeds a MetricsRegistry."""
+
+    def __init__(self, registry: MetricsRegistry):
+        """
+        Initialize the observer.
+
+        Args:
+            registry: Registry receiving histograms and counters
+        """
+        self.registry = registry
+
+    def __call__(self, timing: RequestTiming) -> None:
+        labels = {"method": timing.method, "endpoint": timing.endpoint}
+        for phase in PHASES:
+            value = getattr(timing, phase)
+            if value is not None:
+                self.registry.histogram(REQUEST_DURATION, phase=phase, **labels).record(value)
+        self.registry.counter(REQUESTS, status=str(timing.status), source=timing.source, **labels).inc()
+        if timing.response_bytes:
+            self.registry.counter(RESPONSE_BYTES, **labels).inc(timing.response_bytes)
+        if timing.hedged:
+            self.registry.counter(HEDGES, outcome="won" if timing.hedge_won else "lost", **labels).inc()
@@ -0,0 +1,111 @@
+"""
+Bulk prefetch of GET endpoints into a client's response cache.
+
+Tests declare the endpoints they read with ``@pytest.mark.prefetch``, as
+``str.format`` templates over their parameters (``"/pokemon/{pokemon_id}"``).
+At collection time the suite expands the templates of every selected test
+into one de-duplicated set. Before the first test runs, ``prefetch`` fetches
+that set concurrently on the client's context pool. The tests are then served
+from memory.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+from playwright.sync_api import APIRequestContext
+from ..config.settings import test_settings
+from .base_api_client import BaseAPIClient
+from .context_pool import APIRequestContextPool
+from .resilience import HTTPError
+
+
+@dataclass
+class PrefetchPlan:
+    """Endpoints gathered from the collected tests."""
+
+    endpoints: Set[str] = field(default_factory=set)
+    items: int = 0
+    covered: int = 0
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of the client-using tests whose endpoints are declared."""
+        return self.covered / self.items if self.items else 0.0
+
+    def add(self, templates: Iterable[str], params: Dict[str, Any]) -> None:
+        """
+        Expand one test's endpoint templates with its parameters and add them.
+
+        Args:
+            templates: ``str.format`` templates such as ``"/pokemon?limit={limit}"``
+            params: The test's parameter values
+
+        Raises:
+            KeyError: If a template names a parameter the test does not have
+        """
+        expanded = [template.format(**params) for template in templates]
+        self.items += 1
+        if expanded:
+            self.covered += 1
+            self.endpoints.update(expanded)
+
+
+@dataclass
+class PrefetchReport:
+    """Outcome of a prefetch run."""
+
+    endpoints: int = 0
+    fetched: int = 0
+    not_found: int = 0
+    failed: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def prefetch(client: BaseAPIClient, endpoints: Iterable[str], workers: Optional[int] = None, logger: Optional[logging.Logger] = None) -> PrefetchReport:
+    """
+    Fetch endpoints concurrently into the client's response cache.
+
+    Uses the client's context pool when it has one, otherwise a temporary pool.
+    404 responses are cached too when the cache keeps them. Other failures are
+    reported, not raised: the tests that need those endpoints fetch them again.
+
+    Args:
+        client: Client whose response cache is filled
+        endpoints: Endpoint paths, optionally with a query string
+        workers: Size of the temporary pool (defaults to TestSettings.parallel_workers)
+        logger: Optional logger instance
+
+    Returns:
+        PrefetchReport with per-outcome counts
+
+    Raises:
+        ValueError: If the client has no response cache
+    """
+    if client.cache is None:
+        raise ValueError("Prefetching needs a client with a response cache")
+    logger = logger or logging.getLogger(__name__)
+    endpoints = sorted(set(endpoints))
+    report = PrefetchReport(endpoints=len(endpoints))
+    started = time.perf_counter()
+
+    def fetch(context: APIRequestContext, endpoint: str) -> Any:
+        return client.with_context(context).get(endpoint)
+
+    if client.context_pool is not None and workers is None:
+        results = client.context_pool.map(fetch, endpoints)
+    else:
+        with APIRequestContextPool(workers or test_settings.parallel_workers, logger=logger) as pool:
+            results = pool.map(fetch, endpoints)
+
+    for result in results:
+        if result.ok:
+            report.fetched += 1
+        elif isinstance(result.error, HTTPError) and result.error.status == 404:
+            report.not_found += 1
+        else:
+            report.failed.append(f"{result.key}: {str(result.error)}")
+
+    report.elapsed = time.perf_counter() - started
+    logger.info("Prefetched %d of %d endpoints in %.0fms", report.fetched, report.endpoints, report.elapsed * 1000)
+    return report
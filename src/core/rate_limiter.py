@@ -0,0 +1,246 @@
+"""
+Host-wide client-side rate limiting.
+
+``SharedRateLimiter`` is a token bucket in GCRA form (each bucket stores only
+its "theoretical arrival time"), kept in a small JSON file guarded by an
+exclusive ``flock``. Every process that points at the same file, such as the
+pytest-xdist workers of one run, draws from the same budget. Without an
+explicit path each limiter creates a private file, so unrelated runs never
+share (or lock each other out of) a budget. A request reserves its slot under
+the lock and then sleeps outside it, so waiting processes don't hold the lock
+or poll.
+
+Limits apply per endpoint family (``pokemon``, ``berry``, ...) and/or to all
+requests together. A request that has to wait for one bucket only charges the
+others once it is about to be sent, so they are debited at the real send time.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from ..config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits are shared between threads only
+    fcntl = None
+
+
+GLOBAL = "*"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained rate and burst size of one bucket."""
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError(f"Invalid rate limit: {self.rate}/s with burst {self.burst}. Rate must be positive and burst at least 1")
+
+
+def parse_rate_limits(spec: str) -> Dict[str, RateLimit]:
+    """
+    Parse limits such as ``*=20:10,pokemon=10,berry=2:1`` (family=rate[:burst]).
+
+    Args:
+        spec: Comma-separated entries; ``*`` applies to all requests together
+
+    Returns:
+        Limits by family
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        family, _, value = entry.partition('=')
+        rate, _, burst = value.partition(':')
+        try:
+            limits[family.strip()] = RateLimit(float(rate), int(burst) if burst else 1)
+        except ValueError as e:
+            raise ValueError(f"Invalid rate limit entry: {entry}. Expected family=rate[:burst] ({e})")
+    return limits
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Resource family of an endpoint path ('/pokemon/25' -> 'pokemon')."""
+    return endpoint.strip('/').split('/', 1)[0].split('?', 1)[0]
+
+
+@dataclass
+class RateLimiterStats:
+    """Per-process counters of how long requests waited for the limiter."""
+
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    by_family: Dict[str, float] = field(default_factory=dict)
+
+
+class SharedRateLimiter:
+    """GCRA token buckets whose state is shared through a lock file."""
+
+    def __init__(self, limits: Dict[str, RateLimit], path: Optional[Union[str, Path]] = None, clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: Limits by endpoint family; the GLOBAL key ('*') limits all requests
+            path: State file shared by the cooperating processes (defaults to
+                settings.rate_limit_file, else a new private file removed by close())
+            clock: Wall-clock time source (shared across processes)
+            sleep: Blocking sleep used by acquire()
+        """
+        self.limits = dict(limits)
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = RateLimiterStats()
+        self._lock = threading.Lock()
+        path = path or settings.rate_limit_file
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="pokeapi-rate-limit-", suffix=".json")
+            os.close(fd)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, path: Optional[Union[str, Path]] = None) -> Optional["SharedRateLimiter"]:
+        """Limiter configured by POKEAPI_RATE_LIMIT/POKEAPI_RATE_LIMITS, or None when unset."""
+        limits = parse_rate_limits(settings.rate_limits)
+        if settings.rate_limit:
+            limits.setdefault(GLOBAL, RateLimit(settings.rate_limit, settings.rate_limit_burst))
+        return cls(limits, path=path) if limits else None
+
+    def acquire(self, family: str = "") -> float:
+        """
+        Block until a request of the given family may be sent.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+
+        Returns:
+            Seconds waited
+        """
+        keys, waited = self._keys(family), 0.0
+        if not keys:
+            return 0.0
+        while keys:
+            wait, keys = self._reserve(keys)
+            if wait > 0:
+                self.sleep(wait)
+                waited += wait
+        self._record(family, waited)
+        return waited
+
+    async def acquire_async(self, family: str = "") -> float:
+        """Coroutine version of acquire that waits with asyncio.sleep."""
+        keys, waited = self._keys(family), 0.0
+        if not keys:
+            return 0.0
+        while keys:
+            wait, keys = self._reserve(keys)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                waited += wait
+        self._record(family, waited)
+        return waited
+
+    def reset(self) -> None:
+        """Forget all bucket state (e.g. at the start of a run)."""
+        with self._lock, self._locked_state() as state:
+            state.clear()
+
+    def close(self) -> None:
+        """Remove the state file if this limiter created it."""
+        if self._owns_file:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _keys(self, family: str) -> List[str]:
+        return [key for key in (GLOBAL, family) if key in self.limits]
+
+    def _reserve(self, keys: List[str]) -> Tuple[float, List[str]]:
+        """
+        Take the next slot in the buckets that hold the request back.
+
+        Returns:
+            Seconds to wait, and the buckets still to charge once that wait is
+            over (empty when the request was charged everywhere and may be sent)
+        """
+        with self._lock, self._locked_state() as state:
+            now = self.clock()
+            # Earliest time each bucket admits one more request
+            allowed = {key: state.get(key, now) - (self.limits[key].burst - 1) / self.limits[key].rate for key in keys}
+            start = max(now, *allowed.values())
+            if start <= now:
+                charged, remaining = keys, []
+            else:
+                # Only the buckets that set the start are charged now; the others
+                # are charged at the real send time, after the wait
+                charged = [key for key in keys if allowed[key] >= start]
+                remaining = [key for key in keys if allowed[key] < start]
+            for key in charged:
+                state[key] = max(state.get(key, now), now) + 1.0 / self.limits[key].rate
+        return start - now, remaining
+
+    def _record(self, family: str, wait: float) -> None:
+        with self._lock:
+            stats = self.stats
+            stats.requests += 1
+            if wait > 0:
+                stats.delayed += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+                stats.by_family[family] = stats.by_family.get(family, 0.0) + wait
+
+    def _locked_state(self) -> "_StateFile":
+        return _StateFile(self.path)
+
+
+class _StateFile:
+    """Context manager yielding the decoded state dict under an exclusive file lock."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.state: Dict[str, float] = {}
+
+    def __enter__(self) -> Dict[str, float]:
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        raw = b""
+        while True:
+            chunk = os.read(self._fd, 65536)
+            if not chunk:
+                break
+            raw += chunk
+        try:
+            self.state = json.loads(raw) if raw else {}
+        except ValueError:
+            self.state = {}  # torn or foreign content: start from full buckets
+        return self.state
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                data = json.dumps(self.state, separators=(',', ':')).encode('utf-8')
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.ftruncate(self._fd, 0)
+                os.write(self._fd, data)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
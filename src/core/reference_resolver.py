@@ -0,0 +1,183 @@
+"""
+Concurrent resolution of NamedAPIResource links.
+
+Given a validated model (e.g. a Pokemon), the resolver collects every linked
+resource URL, dedupes them by canonical URL and fetches the targets
+concurrently through an AsyncBaseAPIClient, optionally following links found
+in the fetched payloads up to a depth limit.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+from pydantic import BaseModel
+from ..utils.urls import canonicalize_url, split_api_url
+from .async_base_api_client import AsyncBaseAPIClient
+from .response_cache import ResponseCache
+
+
+@dataclass
+class ResolvedReferences:
+    """Outcome of a resolution run, keyed by canonical resource URL."""
+
+    resources: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    depth_reached: int = 0
+
+    def by_family(self, family: str) -> Dict[str, Any]:
+        """Resolved payloads of one resource family, e.g. 'type'."""
+        marker = f"/{family}/"
+        return {url: payload for url, payload in self.resources.items() if marker in url}
+
+
+def collect_resource_urls(value: Any) -> List[str]:
+    """
+    Collect the 'url' of every resource reference in a model or raw payload.
+
+    Walks pydantic models, dicts and lists; a reference is any object with a
+    string 'url' field (NamedAPIResource and APIResource alike).
+
+    Args:
+        value: Pydantic model, dict, list or scalar
+
+    Returns:
+        URLs in discovery order (may contain duplicates)
+    """
+    urls: List[str] = []
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, BaseModel):
+            url = getattr(item, "url", None)
+            if isinstance(url, str):
+                urls.append(url)
+            stack.extend(getattr(item, name) for name in reversed(list(type(item).model_fields)))
+        elif isinstance(item, dict):
+            url = item.get("url")
+            if isinstance(url, str):
+                urls.append(url)
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+    return urls
+
+
+class ReferenceResolver:
+    """Follows resource links concurrently with per-family concurrency limits."""
+
+    def __init__(self, client: AsyncBaseAPIClient, max_depth: int = 1, family_limits: Optional[Dict[str, int]] = None, default_family_limit: int = 8, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            client: Async client used for fetching; give it a ResponseCache to share
+                fetched payloads across resolutions
+            max_depth: 1 resolves the model's own links; each extra level follows
+                links found in the previously resolved payloads
+            family_limits: Maximum in-flight requests per resource family, e.g. {'move': 16}
+            default_family_limit: Limit for families not listed in family_limits
+            logger: Optional logger instance
+        """
+        if max_depth < 1:
+            raise ValueError(f"Invalid max_depth: {max_depth}. Must be at least 1")
+
+        self.client = client
+        self.max_depth = max_depth
+        self.family_limits = family_limits or {}
+        self.default_family_limit = default_family_limit
+        self.logger = logger or logging.getLogger(__name__)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The response cache shared through the client, if any."""
+        return self.client.cache
+
+    async def resolve(self, model: Any) -> ResolvedReferences:
+        """
+        Resolve every resource link reachable from a model within max_depth.
+
+        Args:
+            model: Validated model (or raw payload) whose links should be followed
+
+        Returns:
+            Resolved payloads and per-URL errors, keyed by canonical URL
+        """
+        result = ResolvedReferences()
+        seen: Set[str] = set()
+        frontier = self._new_links(collect_resource_urls(model), seen)
+        total_limit = asyncio.Semaphore(self.client.concurrency)
+
+        for depth in range(1, self.max_depth + 1):
+            if not frontier:
+                break
+            self.logger.info("Resolving %d references at depth %d", len(frontier), depth)
+            payloads = await asyncio.gather(*(self._fetch(url, total_limit) for url in frontier), return_exceptions=True)
+
+            discovered: List[str] = []
+            for url, payload in zip(frontier, payloads):
+                if isinstance(payload, BaseException):
+                    result.errors[url] = payload
+                else:
+                    result.resources[url] = payload
+                    discovered.extend(collect_resource_urls(payload))
+            result.depth_reached = depth
+            frontier = self._new_links(discovered, seen)
+
+        return result
+
+    def _new_links(self, urls: Iterable[str], seen: Set[str]) -> List[str]:
+        """Canonicalize, keep API links only and drop URLs already scheduled."""
+        links = []
+        for url in urls:
+            key = canonicalize_url(url)
+            if key in seen:
+                continue
+            try:
+                split_api_url(key, self.client.base_url)
+            except ValueError:
+                continue  # not an API resource (e.g. sprite URLs)
+            seen.add(key)
+            links.append(key)
+        return links
+
+    async def _fetch(self, url: str, total_limit: asyncio.Semaphore) -> Any:
+        """Fetch one resource under its family limit and the client-wide limit."""
+        endpoint, params = split_api_url(url, self.client.base_url)
+        family = endpoint.strip('/').split('/')[0]
+        semaphore = self._semaphores.get(family)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.family_limits.get(family, self.default_family_limit))
+            self._semaphores[family] = semaphore
+
+        async with semaphore, total_limit:
+            return await self.client.get(endpoint, params=params or None)
+
+
+def resolve_references(model: Any, base_url: Optional[str] = None, max_depth: int = 1, family_limits: Optional[Dict[str, int]] = None, cache: Optional[ResponseCache] = None, concurrency: Optional[int] = None) -> ResolvedReferences:
+    """
+    Resolve a model's links from synchronous code (e.g. a sync test).
+
+    The event loop runs on a helper thread, so this also works while sync
+    Playwright holds the calling thread's loop. Async callers use
+    ReferenceResolver directly.
+
+    Args:
+        model: Validated model (or raw payload) whose links should be followed
+        base_url: Optional base URL override
+        max_depth: Link levels to follow
+        family_limits: Maximum in-flight requests per resource family
+        cache: Optional shared response cache
+        concurrency: Client-wide maximum of in-flight requests
+
+    Returns:
+        Resolved payloads and per-URL errors, keyed by canonical URL
+    """
+    async def run() -> ResolvedReferences:
+        async with AsyncBaseAPIClient.open(base_url=base_url, cache=cache, concurrency=concurrency) as client:
+            return await ReferenceResolver(client, max_depth=max_depth, family_limits=family_limits).resolve(model)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run()).result()
@@ -0,0 +1,375 @@
+"""
+Retry, retry budget and circuit breaker policies for idempotent API reads.
+
+``Resilience.execute`` wraps a single GET: transport failures (Playwright
+network and timeout errors), 429 and 5xx responses are retried with decorrelated-jitter backoff (or the server's
+``Retry-After``), each retry is paid for from a retry budget that refills
+with successful traffic, and a circuit breaker per ``Resilience`` instance
+fails fast once the API keeps failing, instead of waiting out a timeout per
+request. Share one instance between clients that target the same base URL.
+Any other exception (a cassette miss, a bug in the caller) is raised at once
+and says nothing about the API's health, so the breaker ignores it. The
+breaker is checked once before a request and told its final outcome once its
+retries are over, so it counts failed requests, not attempts.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple, Union
+from playwright.sync_api import Error as PlaywrightError
+from ..config.settings import settings
+
+# Exceptions meaning the request did not get a response; Playwright raises the
+# same Error/TimeoutError classes from its sync and async APIs
+TRANSPORT_ERRORS: Tuple[type, ...] = (PlaywrightError, ConnectionError, TimeoutError)
+
+
+class HTTPError(Exception):
+    """Non-successful HTTP response."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} error for {url}")
+        self.status = status
+        self.url = url
+
+
+class CircuitOpenError(Exception):
+    """Request refused without being sent because the circuit breaker is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """Which failures are retried and how long to wait between attempts."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_connection_errors: bool = True
+    max_retry_after: float = 30.0
+
+    def backoff(self, previous: float, rng: random.Random) -> float:
+        """
+        Decorrelated-jitter delay: uniform between base_delay and 3x the previous delay.
+
+        Args:
+            previous: Previous delay (base_delay before the first retry)
+            rng: Random source
+
+        Returns:
+            Delay in seconds, capped at max_delay
+        """
+        return min(self.max_delay, rng.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header (delta-seconds or HTTP date).
+
+    Args:
+        headers: Response headers (lower-case names, as Playwright returns them)
+
+    Returns:
+        Non-negative delay, or None when the header is missing or invalid
+    """
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of request volume.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, so
+    during an outage retries add at most ratio x the offered load once the
+    reserve of `min_retries` tokens is spent.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request in steady state
+            min_retries: Reserve (and cap) of tokens, so low-traffic clients can still retry
+        """
+        if ratio < 0 or min_retries < 0:
+            raise ValueError(f"Invalid retry budget: ratio={ratio}, min_retries={min_retries}. Must not be negative")
+        self.ratio = ratio
+        self.capacity = float(max(min_retries, 1))
+        self.tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit one request."""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take the token for one retry; False when the budget is exhausted."""
+        with self._lock:
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail immediately with CircuitOpenError. Once `reset_timeout`
+    seconds have passed a single probe request is let through (half-open):
+    its success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe is allowed
+            clock: Monotonic time source
+        """
+        if failure_threshold <= 0:
+            raise ValueError(f"Invalid failure threshold: {failure_threshold}. Must be positive")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self, url: str = "") -> None:
+        """
+        Admit a request or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open probe is already running)
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            remaining = max(0.0, self.reset_timeout - (self.clock() - self._opened_at))
+        raise CircuitOpenError(f"Circuit open after {self.failures} consecutive failures; not sending {url} (retry in {remaining:.1f}s)")
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """End a half-open probe that said nothing about the API, letting the next request probe."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+            self._probing = False
+
+
+@dataclass
+class ResilienceStats:
+    """Counters describing retry and circuit breaker activity."""
+
+    requests: int = 0
+    retries: int = 0
+    budget_exhausted: int = 0
+    short_circuited: int = 0
+
+
+Outcome = Union[Any, BaseException]
+
+
+class Resilience:
+    """Retry policy, retry budget and circuit breaker applied to idempotent requests."""
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, budget: Optional[RetryBudget] = None, breaker: Optional[CircuitBreaker] = None, logger: Optional[logging.Logger] = None, sleep: Callable[[float], None] = time.sleep, seed: Optional[int] = None):
+        """
+        Initialize the policies.
+
+        Args:
+            policy: Retry policy (defaults to settings.max_retries + 1 attempts)
+            budget: Retry budget (defaults to settings.retry_budget_ratio)
+            breaker: Circuit breaker (defaults to settings.circuit_failure_threshold
+                and settings.circuit_reset_timeout)
+            logger: Optional logger instance
+            sleep: Blocking sleep used between attempts
+            seed: Seed for backoff jitter
+        """
+        self.policy = policy or RetryPolicy(max_attempts=settings.max_retries + 1)
+        self.budget = budget or RetryBudget(ratio=settings.retry_budget_ratio)
+        self.breaker = breaker or CircuitBreaker(settings.circuit_failure_threshold, settings.circuit_reset_timeout)
+        self.logger = logger or logging.getLogger(__name__)
+        self.sleep = sleep
+        self.stats = ResilienceStats()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def execute(self, send: Callable[[], Any], url: str) -> Any:
+        """
+        Send a request with retries.
+
+        Args:
+            send: Performs one attempt and returns a response with .status and .headers
+            url: Request URL, for messages
+
+        Returns:
+            The first non-retryable response, or the last response once retries
+            or the budget are exhausted
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last transport error once retries are exhausted, or
+                any other exception from send() right away
+        """
+        delay = self._start(url)
+        attempt, outcome, finished = 1, None, False
+        try:
+            while True:
+                try:
+                    outcome = send()
+                except Exception as e:
+                    outcome = e
+                wait = self._after_attempt(outcome, attempt, delay, url)
+                if wait is None:
+                    finished = True
+                    break
+                self.sleep(wait)
+                delay, attempt = wait, attempt + 1
+        finally:
+            self._finish(outcome if finished else None)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def execute_async(self, send: Callable[[], Awaitable[Any]], url: str) -> Any:
+        """Coroutine version of execute for the async client."""
+        delay = self._start(url)
+        attempt, outcome, finished = 1, None, False
+        try:
+            while True:
+                try:
+                    outcome = await send()
+                except Exception as e:
+                    outcome = e
+                wait = self._after_attempt(outcome, attempt, delay, url)
+                if wait is None:
+                    finished = True
+                    break
+                await asyncio.sleep(wait)
+                delay, attempt = wait, attempt + 1
+        finally:
+            self._finish(outcome if finished else None)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def _start(self, url: str) -> float:
+        self._admit(url)
+        with self._lock:
+            self.stats.requests += 1
+        self.budget.deposit()
+        return self.policy.base_delay
+
+    def _admit(self, url: str) -> None:
+        try:
+            self.breaker.before_request(url)
+        except CircuitOpenError:
+            with self._lock:
+                self.stats.short_circuited += 1
+            raise
+
+    def _finish(self, outcome: Optional[Outcome]) -> None:
+        """
+        Report a request's final outcome (None if it was interrupted) to the breaker.
+
+        Transport failures and 5xx count as failures, other responses as
+        successes. A 429 only says the client is too fast, and errors that are
+        not about the API say nothing, so neither changes the failure count;
+        they just end a half-open probe.
+        """
+        if isinstance(outcome, TRANSPORT_ERRORS):
+            self.breaker.record_failure()
+            return
+        if isinstance(outcome, HTTPError):
+            status = outcome.status
+        elif outcome is None or isinstance(outcome, BaseException):
+            status = None
+        else:
+            status = outcome.status
+        if status is None or status == 429:
+            self.breaker.release_probe()
+        elif status >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _after_attempt(self, outcome: Outcome, attempt: int, delay: float, url: str) -> Optional[float]:
+        """Return the delay before retrying this outcome, or None to stop."""
+        if isinstance(outcome, HTTPError):
+            status, reason, retry_after = outcome.status, f"HTTP {outcome.status}", None
+        elif isinstance(outcome, TRANSPORT_ERRORS):
+            if not self.policy.retry_connection_errors:
+                return None
+            status, reason, retry_after = None, type(outcome).__name__, None
+        elif isinstance(outcome, BaseException):
+            return None
+        else:
+            status, reason, retry_after = outcome.status, f"HTTP {outcome.status}", parse_retry_after(outcome.headers)
+
+        if status is not None and status not in self.policy.retry_statuses:
+            return None
+
+        if attempt >= self.policy.max_attempts:
+            return None
+        if retry_after is not None and retry_after > self.policy.max_retry_after:
+            self.logger.warning("Not retrying %s: Retry-After %.0fs exceeds %.0fs", url, retry_after, self.policy.max_retry_after)
+            return None
+        if not self.budget.withdraw():
+            with self._lock:
+                self.stats.budget_exhausted += 1
+            self.logger.warning("Retry budget exhausted; not retrying %s after %s", url, reason)
+            return None
+
+        with self._lock:
+            wait = retry_after if retry_after is not None else self.policy.backoff(delay, self._rng)
+            self.stats.retries += 1
+        self.logger.warning("Retrying %s after %s (attempt %d of %d, waiting %.2fs)", url, reason, attempt + 1, self.policy.max_attempts, wait)
+        return wait
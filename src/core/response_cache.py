@@ -0,0 +1,161 @@
+"""
+In-process LRU + TTL cache for GET responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from ..utils.urls import canonicalize_url
+
+
+@dataclass
+class CacheEntry:
+    """A cached response: raw body, decoded payload and expiry time."""
+
+    status: int
+    body: bytes
+    data: Any
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        """Size of the entry in bytes, measured on the raw body."""
+        return len(self.body)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Thread-safe response cache bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: float = 300.0, cache_not_found: bool = False, negative_ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies in bytes
+            ttl: Lifetime of a successful response in seconds
+            cache_not_found: Whether 404 responses are cached as well
+            negative_ttl: Lifetime of a cached 404 in seconds (defaults to ttl)
+            clock: Monotonic time source, injectable for tests
+        """
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("Cache bounds must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.cache_not_found = cache_not_found
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request from its normalized URL and sorted params."""
+        return canonicalize_url(url, params)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of cached bodies in bytes."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a cached response, refreshing its LRU position.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached entry, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            if entry.status == 404:
+                self.stats.negative_hits += 1
+            return entry
+
+    def put(self, key: str, status: int, body: bytes, data: Any) -> None:
+        """
+        Store a response, evicting least recently used entries to stay in bounds.
+
+        404 responses are only stored when cache_not_found is enabled; other
+        non-2xx statuses and bodies larger than max_bytes are never stored.
+
+        Args:
+            key: Cache key from make_key()
+            status: HTTP status code
+            body: Raw response body
+            data: Decoded response payload
+        """
+        if status == 404:
+            if not self.cache_not_found:
+                return
+            ttl = self.negative_ttl
+        elif 200 <= status < 300:
+            ttl = self.ttl
+        else:
+            return
+
+        entry = CacheEntry(status=status, body=body, data=data, expires_at=self._clock() + ttl)
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; the caller must hold the lock."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
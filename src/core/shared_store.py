@@ -0,0 +1,197 @@
+"""
+Host-local response store shared by the processes of one test run.
+
+Responses live in a SQLite database in WAL mode, which every pytest-xdist
+worker opens, so a resource fetched by one worker is read by the others
+instead of being fetched again. A missing key is filled by a single writer.
+The first process to ask takes a lease on the key in a ``fills`` table and
+fetches it. Everyone else polls until the response appears, or until the
+lease is released or expires, in which case one of them takes it over.
+
+Unlike ``DiskHTTPCache`` the store is meant to live for one run: entries never
+expire and are not revalidated. 404 responses are stored too, so negative
+lookups are shared as well.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fills (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class SharedStoreStats:
+    """Per-process counters describing shared store effectiveness."""
+
+    hits: int = 0
+    fills: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    takeovers: int = 0
+
+
+class SharedResponseStore:
+    """SQLite-backed response store with single-writer fills across processes."""
+
+    def __init__(self, path: Union[str, Path], lease_timeout: float = 30.0, poll_interval: float = 0.005, max_poll_interval: float = 0.05, logger: Optional[logging.Logger] = None):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Database file shared by the cooperating processes
+            lease_timeout: Seconds after which an unfinished fill may be taken over
+            poll_interval: First delay between checks while another process fills a key
+            max_poll_interval: Upper bound of the (doubling) poll delay
+            logger: Optional logger instance
+        """
+        if lease_timeout <= 0 or poll_interval <= 0:
+            raise ValueError(f"Invalid lease_timeout {lease_timeout} or poll_interval {poll_interval}. Must be positive")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats = SharedStoreStats()
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        """
+        Read a stored response.
+
+        Args:
+            key: Canonical request URL
+
+        Returns:
+            Tuple of (status, body), or None if the key is not stored yet
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT status, body FROM responses WHERE key = ?", (key,)).fetchone()
+        return (row[0], bytes(row[1])) if row is not None else None
+
+    def fill(self, key: str, fetch: Callable[[], Tuple[int, bytes]]) -> Tuple[int, bytes, bool]:
+        """
+        Return the stored response for key, fetching it if no process has yet.
+
+        Only one caller across all processes runs ``fetch`` for a key at a time;
+        the others wait for its result. If ``fetch`` raises, the lease is released
+        and the error propagates, so a waiting caller can try instead.
+
+        Args:
+            key: Canonical request URL
+            fetch: Performs the request and returns (status, body)
+
+        Returns:
+            Tuple of (status, body, whether this call fetched it)
+        """
+        delay = self.poll_interval
+        waited_since = None
+        while True:
+            stored, claimed = self._claim(key)
+            if stored is not None or claimed:
+                break
+            if waited_since is None:
+                waited_since = time.perf_counter()
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+        with self._lock:
+            if waited_since is not None:
+                self.stats.waits += 1
+                self.stats.wait_time += time.perf_counter() - waited_since
+            if stored is not None:
+                self.stats.hits += 1
+        if stored is not None:
+            return stored[0], stored[1], False
+
+        try:
+            status, body = fetch()
+        except BaseException:
+            self._release(key)
+            raise
+        self._put(key, status, body)
+        with self._lock:
+            self.stats.fills += 1
+        return status, body, True
+
+    def __len__(self) -> int:
+        """Number of stored responses."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete every stored response and pending fill."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.execute("DELETE FROM fills")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def _owner(self) -> str:
+        return f"{os.getpid()}:{threading.get_ident()}"
+
+    def _claim(self, key: str) -> Tuple[Optional[Tuple[int, bytes]], bool]:
+        """Atomically read the key or take the fill lease; returns (stored response, claimed)."""
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute("SELECT status, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                return (row[0], bytes(row[1])), False
+            lease = connection.execute("SELECT owner, expires_at FROM fills WHERE key = ?", (key,)).fetchone()
+            if lease is not None and lease[1] > now:
+                return None, False
+            if lease is not None:
+                self.stats.takeovers += 1
+                self.logger.warning("Taking over expired fill of %s from %s", key, lease[0])
+            connection.execute("INSERT OR REPLACE INTO fills (key, owner, expires_at) VALUES (?, ?, ?)", (key, self._owner, now + self.lease_timeout))
+            return None, True
+
+    def _put(self, key: str, status: int, body: bytes) -> None:
+        with self._transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses (key, status, body, stored_at) VALUES (?, ?, ?, ?)", (key, status, body, time.time()))
+            connection.execute("DELETE FROM fills WHERE key = ?", (key,))
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM fills WHERE key = ? AND owner = ?", (key, self._owner))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction; BEGIN IMMEDIATE serializes writers across processes up front."""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
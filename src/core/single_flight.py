@@ -0,0 +1,138 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+While a call for a key is running, further calls for the same key don't start
+their own. They wait for the running call and receive its result, or its
+exception. Keys are released as soon as the call finishes, so this only
+merges requests that overlap in time. ``ResponseCache`` covers later repeats.
+
+``SingleFlight`` serves threads (e.g. the workers of an APIRequestContextPool)
+and ``AsyncSingleFlight`` serves tasks on one event loop.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters describing request coalescing."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        """Fraction of calls that joined an in-flight call instead of running."""
+        return self.coalesced / self.calls if self.calls else 0.0
+
+
+class _Call:
+    """One in-flight call and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key across threads."""
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self.stats = SingleFlightStats()
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a call for key is in flight, in which case wait for that one.
+
+        Args:
+            key: Identity of the call (e.g. a canonical URL)
+            fn: Performs the call; only run by the first caller
+
+        Returns:
+            The result of the call this caller ran or joined
+
+        Raises:
+            Exception: Whatever the call raised, re-raised in every caller
+        """
+        with self._lock:
+            self.stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent calls with the same key on one event loop."""
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self.stats = SingleFlightStats()
+        self._calls: Dict[str, "asyncio.Task[Any]"] = {}
+        self._waiters: Dict["asyncio.Task[Any]", int] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless a call for key is in flight, in which case await that one.
+
+        The call runs as its own task. Cancelling one caller does not cancel
+        the call for the others; it is cancelled once every caller is.
+
+        Args:
+            key: Identity of the call (e.g. a canonical URL)
+            fn: Returns the awaitable performing the call; only run by the first caller
+
+        Returns:
+            The result of the call this caller started or joined
+
+        Raises:
+            Exception: Whatever the call raised, re-raised in every caller
+        """
+        self.stats.calls += 1
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.stats.coalesced += 1
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
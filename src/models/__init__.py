@@ -22,15 +22,27 @@ from .base import (
     VersionEncounterDetail,
 )
 
+# Flyweight interning of resource references
+from .interning import (
+    InternedModel,
+    InternStats,
+    intern_stats,
+    intern_table,
+)
+
 # Resource-specific models
 from .pokemon import (
     PokemonAbility,
+    PokemonMoveVersion,
     PokemonMove,
     PokemonType,
     PokemonStat,
     PokemonSprites,
+    PokemonCore,
     Pokemon,
+    LazyPokemon,
 )
+from .learnset import Learnset
 
 __all__ = [
     # Base models
@@ -50,11 +62,20 @@ __all__ = [
     "EncounterVersionDetail",
     "PokemonEncounter",
     "VersionEncounterDetail",
+    # Interning
+    "InternedModel",
+    "InternStats",
+    "intern_stats",
+    "intern_table",
     # Pokémon models
     "PokemonAbility",
+    "PokemonMoveVersion",
     "PokemonMove", 
     "PokemonType",
     "PokemonStat",
     "PokemonSprites",
+    "PokemonCore",
     "Pokemon",
+    "LazyPokemon",
+    "Learnset",
 ]
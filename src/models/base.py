@@ -5,17 +5,18 @@ These models are shared across multiple resource families.
 
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from .interning import InternedModel
 
 
-class NamedAPIResource(BaseModel):
-    """Model for a named API resource reference."""
+class NamedAPIResource(InternedModel):
+    """Model for a named API resource reference (interned and immutable)."""
     
     name: str = Field(..., description="The name of the referenced resource")
     url: str = Field(..., description="The URL of the referenced resource")
 
 
-class APIResource(BaseModel):
-    """Model for an unnamed API resource reference."""
+class APIResource(InternedModel):
+    """Model for an unnamed API resource reference (interned and immutable)."""
     
     url: str = Field(..., description="The URL of the referenced resource")
 
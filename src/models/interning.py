@@ -0,0 +1,159 @@
+"""
+Flyweight intern table for resource reference models.
+
+PokéAPI responses repeat the same name/url pairs (version groups, learn
+methods, languages, stats, ...) thousands of times. Interned models resolve
+equal references to one shared, immutable instance during validation. The
+table holds weak references, so entries disappear once no model uses them.
+"""
+
+import sys
+import threading
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+from pydantic import BaseModel, ConfigDict, model_validator
+from ..config.settings import settings
+
+
+@dataclass
+class InternStats:
+    """Counters describing intern table effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    bytes_per_instance: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of validations served by a shared instance."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def approx_bytes_saved(self) -> int:
+        """Estimated memory not allocated thanks to shared instances."""
+        return self.hits * self.bytes_per_instance
+
+
+class InternTable:
+    """Thread-safe weak-valued table of shared model instances."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the table.
+
+        Args:
+            enabled: Whether lookups are performed (disabled tables always build new instances)
+        """
+        self.enabled = enabled
+        self._instances: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_per_instance = 0
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the shared instance for key, building it with factory on a miss.
+
+        Args:
+            key: Hashable identity of the value (e.g. model class, name, url)
+            factory: Builds the instance when it is not interned yet
+
+        Returns:
+            Shared instance (a new one when the table is disabled)
+        """
+        if not self.enabled:
+            return factory()
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._hits += 1
+                return instance
+
+        instance = factory()
+        with self._lock:
+            # Another thread may have interned an equal instance meanwhile
+            instance = self._instances.setdefault(key, instance)
+            self._misses += 1
+            if not self._bytes_per_instance:
+                self._bytes_per_instance = _instance_size(instance)
+        return instance
+
+    def stats(self) -> InternStats:
+        """Snapshot of the current counters."""
+        return InternStats(hits=self._hits, misses=self._misses, entries=len(self._instances), bytes_per_instance=self._bytes_per_instance)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._instances.clear()
+            self._hits = self._misses = 0
+
+
+def _instance_size(instance: Any) -> int:
+    """Shallow size of a model instance plus its field dict and string values."""
+    fields = getattr(instance, "__dict__", {})
+    return sys.getsizeof(instance) + sys.getsizeof(fields) + sum(sys.getsizeof(value) for value in fields.values() if isinstance(value, str))
+
+
+intern_table = InternTable(enabled=settings.intern_models)
+
+# Set while an InternedModel is built through __init__, which must fill the
+# new instance itself and therefore cannot hand out a shared one.
+_direct_init: ContextVar[bool] = ContextVar("_direct_init", default=False)
+
+
+def intern_stats() -> InternStats:
+    """Statistics of the shared intern table used by model validation."""
+    return intern_table.stats()
+
+
+def intern_key(model_type: type, data: Any) -> Optional[Hashable]:
+    """
+    Build an intern key for raw reference data, or None if it cannot be interned.
+
+    Args:
+        model_type: Model class being validated
+        data: Raw input (only plain dicts with string values are interned)
+
+    Returns:
+        Key tuple, or None
+    """
+    if not intern_table.enabled or type(data) is not dict:
+        return None
+    values = tuple(data.get(name) for name in model_type.model_fields)
+    if not all(type(value) is str for value in values):
+        return None
+    return (model_type, *values)
+
+
+class InternedModel(BaseModel):
+    """Immutable model whose equal instances are shared through the intern table."""
+
+    model_config = ConfigDict(frozen=True)
+
+    def __init__(self, /, **data: Any):
+        """Build a new instance from keyword arguments; direct construction is never interned."""
+        token = _direct_init.set(True)
+        try:
+            super().__init__(**data)
+        finally:
+            _direct_init.reset(token)
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def use_intern_table(cls, data: Any, handler) -> "InternedModel":
+        """Return the shared instance for equal raw data instead of building a new one (model_validate and nested fields only)."""
+        if _direct_init.get():
+            return handler(data)
+        key = intern_key(cls, data)
+        if key is None:
+            return handler(data)
+        return intern_table.get_or_create(key, lambda: handler(data))
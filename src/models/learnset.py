@@ -0,0 +1,134 @@
+"""
+Columnar, array-backed store for a Pokémon's move learnset.
+
+A ``/pokemon`` payload nests one ``version_group_details`` list per move. The
+Learnset flattens those into parallel ``array`` columns (move, learn method,
+version group, level), one row per detail. Move, method and version-group
+names are interned into process-wide vocabularies, so the integer IDs are
+shared by every Learnset and queries compare small ints instead of walking
+nested dicts.
+"""
+
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class Vocabulary:
+    """Thread-safe two-way mapping between names and dense integer IDs."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_for(self, name: str) -> int:
+        """Return the ID for name, assigning the next free one if it is new."""
+        value = self._ids.get(name)
+        if value is None:
+            with self._lock:
+                value = self._ids.setdefault(name, len(self.names))
+                if value == len(self.names):
+                    self.names.append(name)
+        return value
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the ID for name, or None if it was never interned."""
+        return self._ids.get(name)
+
+
+MOVES = Vocabulary()
+LEARN_METHODS = Vocabulary()
+VERSION_GROUPS = Vocabulary()
+
+
+class Learnset:
+    """Parallel-array representation of every (move, method, version group, level) row."""
+
+    __slots__ = ("move_ids", "method_ids", "version_group_ids", "levels")
+
+    def __init__(self):
+        self.move_ids = array('H')
+        self.method_ids = array('H')
+        self.version_group_ids = array('H')
+        self.levels = array('B')
+
+    def __len__(self) -> int:
+        return len(self.move_ids)
+
+    @classmethod
+    def from_moves(cls, moves: Iterable[Any]) -> "Learnset":
+        """
+        Build a learnset from validated PokemonMove models or raw move payloads.
+
+        Raw payloads (e.g. LazyPokemon's unvalidated moves) are read directly,
+        without building the nested models first.
+
+        Args:
+            moves: Items of a Pokémon's 'moves' list
+
+        Returns:
+            Learnset with one row per version group detail
+        """
+        learnset = cls()
+        for move in moves:
+            if isinstance(move, dict):
+                move_id = MOVES.id_for(move["move"]["name"])
+                for detail in move["version_group_details"]:
+                    learnset._append(move_id, detail["move_learn_method"]["name"], detail["version_group"]["name"], detail["level_learned_at"])
+            else:
+                move_id = MOVES.id_for(move.move.name)
+                for detail in move.version_group_details:
+                    learnset._append(move_id, detail.move_learn_method.name, detail.version_group.name, detail.level_learned_at)
+        return learnset
+
+    def _append(self, move_id: int, method: str, version_group: str, level: int) -> None:
+        self.move_ids.append(move_id)
+        self.method_ids.append(LEARN_METHODS.id_for(method))
+        self.version_group_ids.append(VERSION_GROUPS.id_for(version_group))
+        self.levels.append(level)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column buffers."""
+        return sum(column.itemsize * len(column) for column in (self.move_ids, self.method_ids, self.version_group_ids, self.levels))
+
+    def moves_learned(self, method: Optional[str] = None, version_group: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Moves matching a learn method and/or version group.
+
+        Args:
+            method: Learn method name, e.g. 'level-up' (None matches any)
+            version_group: Version group name, e.g. 'red-blue' (None matches any)
+
+        Returns:
+            (move name, level learned at) pairs ordered by level, then move name
+        """
+        method_id = LEARN_METHODS.lookup(method) if method is not None else None
+        version_group_id = VERSION_GROUPS.lookup(version_group) if version_group is not None else None
+        if (method is not None and method_id is None) or (version_group is not None and version_group_id is None):
+            return []
+
+        columns = zip(self.move_ids, self.method_ids, self.version_group_ids, self.levels)
+        if method_id is not None and version_group_id is not None:
+            matches = {(move, level) for move, m, vg, level in columns if m == method_id and vg == version_group_id}
+        elif method_id is not None:
+            matches = {(move, level) for move, m, _, level in columns if m == method_id}
+        elif version_group_id is not None:
+            matches = {(move, level) for move, _, vg, level in columns if vg == version_group_id}
+        else:
+            matches = {(move, level) for move, _, _, level in columns}
+
+        names = MOVES.names
+        return sorted(((names[move], level) for move, level in matches), key=lambda item: (item[1], item[0]))
+
+    def version_groups(self) -> List[str]:
+        """Version groups that have at least one row, in vocabulary order."""
+        return [VERSION_GROUPS.names[value] for value in sorted(set(self.version_group_ids))]
+
+    def methods(self) -> List[str]:
+        """Learn methods that have at least one row, in vocabulary order."""
+        return [LEARN_METHODS.names[value] for value in sorted(set(self.method_ids))]
@@ -2,9 +2,11 @@
 Pydantic models for Pokémon data validation.
 """
 
-from typing import List, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr, SerializationInfo, TypeAdapter, ValidationInfo, field_validator, model_serializer, model_validator
+from ..config.settings import settings
 from .base import NamedAPIResource
+from .learnset import Learnset
 
 
 class PokemonAbility(BaseModel):
@@ -15,11 +17,20 @@ class PokemonAbility(BaseModel):
     slot: int = Field(..., ge=0, description="Ability slot number")
 
 
+class PokemonMoveVersion(BaseModel):
+    """Model for how a Pokémon learns a move in one version group."""
+    
+    move_learn_method: NamedAPIResource = Field(..., description="Method by which the move is learned")
+    version_group: NamedAPIResource = Field(..., description="Version group the details apply to")
+    level_learned_at: int = Field(..., ge=0, description="Minimum level to learn the move (0 if not by level-up)")
+    order: Optional[int] = Field(None, description="Order in which moves are learned at the same level")
+
+
 class PokemonMove(BaseModel):
     """Model for Pokémon move data."""
     
     move: NamedAPIResource = Field(..., description="Move reference")
-    version_group_details: List[dict] = Field(..., description="Version group details")
+    version_group_details: List[PokemonMoveVersion] = Field(..., description="Version group details")
 
 
 class PokemonType(BaseModel):
@@ -50,8 +61,8 @@ class PokemonSprites(BaseModel):
     back_shiny_female: Optional[str] = Field(None, description="Shiny female back sprite URL")
 
 
-class Pokemon(BaseModel):
-    """Model for Pokémon data validation."""
+class PokemonCore(BaseModel):
+    """Scalar and small-collection Pokémon fields shared by Pokemon and LazyPokemon."""
     
     id: int = Field(..., ge=1, description="Pokémon ID")
     name: str = Field(..., min_length=1, description="Pokémon name")
@@ -59,12 +70,12 @@ class Pokemon(BaseModel):
     weight: int = Field(..., gt=0, description="Pokémon weight in hectograms")
     base_experience: int = Field(..., ge=0, description="Base experience value")
     abilities: List[PokemonAbility] = Field(..., min_length=1, description="List of abilities")
-    moves: List[PokemonMove] = Field(..., description="List of moves")
     types: List[PokemonType] = Field(..., min_length=1, max_length=2, description="List of types")
     stats: List[PokemonStat] = Field(..., min_length=6, max_length=6, description="List of stats")
-    sprites: PokemonSprites = Field(..., description="Sprite URLs")
     species: NamedAPIResource = Field(..., description="Species reference")
     
+    _learnset: Optional[Learnset] = PrivateAttr(default=None)
+    
     @field_validator('name')
     @classmethod
     def name_must_be_lowercase(cls, v):
@@ -72,3 +83,110 @@ class Pokemon(BaseModel):
         if not v.islower():
             raise ValueError('Name must be lowercase')
         return v
+
+
+class Pokemon(PokemonCore):
+    """Model for Pokémon data validation."""
+    
+    moves: List[PokemonMove] = Field(..., description="List of moves")
+    sprites: PokemonSprites = Field(..., description="Sprite URLs")
+    
+    @property
+    def learnset(self) -> Learnset:
+        """Columnar move learnset, built once on first access."""
+        if self._learnset is None:
+            self._learnset = Learnset.from_moves(self.moves)
+        return self._learnset
+
+
+_LAZY_ADAPTERS: Dict[str, TypeAdapter] = {
+    "moves": TypeAdapter(List[PokemonMove]),
+    "sprites": TypeAdapter(PokemonSprites),
+}
+
+
+class LazyPokemon(PokemonCore):
+    """
+    Pokémon model that defers validation of heavy fields until first access.
+    
+    ``moves`` and ``sprites`` are kept as raw data and validated (then cached)
+    when read. Pass ``context={"strict": True}`` to model_validate, or set
+    POKEAPI_STRICT_MODELS, to validate everything eagerly instead.
+    
+    Serialization includes both fields: validated ones are dumped from their
+    models, pending ones as the raw data (without validating them), so
+    ``model_dump()`` and ``model_dump_json()`` round-trip through model_validate.
+    """
+    
+    _raw: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _resolved: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode='wrap')
+    @classmethod
+    def defer_heavy_fields(cls, data: Any, handler, info: ValidationInfo) -> "LazyPokemon":
+        """Validate the core fields now and stash moves/sprites for later."""
+        if not isinstance(data, dict):
+            return handler(data)
+        
+        missing = [name for name in _LAZY_ADAPTERS if name not in data]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        
+        model = handler({key: value for key, value in data.items() if key not in _LAZY_ADAPTERS})
+        model._raw = {name: data[name] for name in _LAZY_ADAPTERS}
+        
+        strict = settings.strict_models or bool((info.context or {}).get("strict"))
+        if strict:
+            for name in _LAZY_ADAPTERS:
+                model._resolve(name)
+        return model
+    
+    @model_serializer(mode='wrap')
+    def include_heavy_fields(self, handler, info: SerializationInfo) -> Dict[str, Any]:
+        """Add moves and sprites to the serialized core fields."""
+        data = handler(self)
+        for name in _LAZY_ADAPTERS:
+            if (info.include is not None and name not in info.include) or (info.exclude is not None and name in info.exclude):
+                continue
+            if name in self._resolved:
+                data[name] = _LAZY_ADAPTERS[name].dump_python(self._resolved[name], mode=info.mode, by_alias=info.by_alias, exclude_none=info.exclude_none)
+            else:
+                data[name] = self._raw[name]
+        return data
+    
+    @property
+    def moves(self) -> List[PokemonMove]:
+        """Validated move list (validated on first access)."""
+        return self._resolve("moves")
+    
+    @property
+    def sprites(self) -> PokemonSprites:
+        """Validated sprites (validated on first access)."""
+        return self._resolve("sprites")
+    
+    @property
+    def learnset(self) -> Learnset:
+        """Columnar move learnset, built once from the moves without validating them."""
+        if self._learnset is None:
+            self._learnset = Learnset.from_moves(self._resolved.get("moves", self._raw["moves"]))
+        return self._learnset
+    
+    @property
+    def pending_fields(self) -> List[str]:
+        """Heavy fields that have not been validated yet."""
+        return [name for name in self._raw if name not in self._resolved]
+    
+    def to_pokemon(self) -> Pokemon:
+        """
+        Build a fully validated Pokemon from this lazy instance.
+        
+        Returns:
+            Eagerly validated Pokemon model
+        """
+        return Pokemon(**{**self.model_dump(exclude=set(_LAZY_ADAPTERS)), "moves": self.moves, "sprites": self.sprites})
+    
+    def _resolve(self, name: str) -> Any:
+        """Validate one deferred field and cache the result."""
+        if name not in self._resolved:
+            self._resolved[name] = _LAZY_ADAPTERS[name].validate_python(self._raw[name])
+        return self._resolved[name]
@@ -0,0 +1,3 @@
+"""
+Local PokéAPI stand-in server for offline runs and benchmarks.
+"""
@@ -0,0 +1,304 @@
+"""
+Fixture snapshots served by the local PokéAPI stand-in server.
+
+A snapshot maps resource paths relative to the API root (``pokemon/25``,
+``type/13``) to their JSON payloads. Snapshots are either captured from a live
+API or generated synthetically so the stand-in works without any network.
+"""
+
+import gzip
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+
+SPRITE_BASE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
+
+STAT_NAMES = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+TYPE_NAMES = [
+    "normal", "fighting", "flying", "poison", "ground", "rock", "bug", "ghost", "steel",
+    "fire", "water", "grass", "electric", "psychic", "ice", "dragon", "dark", "fairy",
+]
+
+MOVE_LEARN_METHODS = [
+    "level-up", "egg", "tutor", "machine", "stadium-surfing-pikachu", "light-ball-egg",
+    "colosseum-purification", "xd-shadow", "xd-purification", "form-change", "zygarde-cube",
+]
+
+VERSION_GROUPS = [
+    "red-blue", "yellow", "gold-silver", "crystal", "ruby-sapphire", "emerald",
+    "firered-leafgreen", "diamond-pearl", "platinum", "heartgold-soulsilver", "black-white",
+    "colosseum", "xd", "black-2-white-2", "x-y", "omega-ruby-alpha-sapphire", "sun-moon",
+    "ultra-sun-ultra-moon", "lets-go-pikachu-lets-go-eevee", "sword-shield", "the-isle-of-armor",
+    "the-crown-tundra", "brilliant-diamond-and-shining-pearl", "legends-arceus", "scarlet-violet",
+    "the-teal-mask", "the-indigo-disk",
+]
+
+MOVE_NAMES = [
+    "pound", "karate-chop", "double-slap", "comet-punch", "mega-punch", "pay-day", "fire-punch",
+    "ice-punch", "thunder-punch", "scratch", "vice-grip", "guillotine", "razor-wind",
+    "swords-dance", "cut", "gust", "wing-attack", "whirlwind", "fly", "bind", "slam", "vine-whip",
+    "stomp", "double-kick", "mega-kick", "jump-kick", "rolling-kick", "sand-attack", "headbutt",
+    "horn-attack",
+]
+
+ABILITY_NAMES = [
+    "stench", "drizzle", "speed-boost", "battle-armor", "sturdy", "damp", "limber", "sand-veil",
+    "static", "volt-absorb", "water-absorb", "oblivious", "cloud-nine", "compound-eyes",
+    "insomnia", "color-change", "immunity", "flash-fire", "shield-dust", "own-tempo",
+    "suction-cups", "intimidate", "shadow-tag", "rough-skin", "wonder-guard", "levitate",
+    "effect-spore", "synchronize", "clear-body", "natural-cure", "lightning-rod", "serene-grace",
+    "swift-swim", "chlorophyll", "illuminate", "trace", "huge-power", "poison-point",
+    "inner-focus", "magma-armor", "water-veil", "magnet-pull", "soundproof", "rain-dish",
+    "sand-stream", "pressure", "thick-fat", "early-bird", "flame-body", "run-away", "keen-eye",
+    "hyper-cutter", "pickup", "truant", "hustle", "cute-charm", "plus", "minus", "forecast",
+    "sticky-hold", "shed-skin", "guts", "marvel-scale", "liquid-ooze", "overgrow", "blaze",
+    "torrent", "swarm", "rock-head", "drought", "arena-trap", "vital-spirit", "white-smoke",
+    "pure-power", "shell-armor", "air-lock", "solar-power", "multitype", "unnerve",
+]
+
+# Pokémon whose details are pinned so the suite's expectations hold offline:
+# id -> (name, abilities, types, leading moves)
+KNOWN_POKEMON = {
+    1: ("bulbasaur", ["overgrow", "chlorophyll"], ["grass", "poison"], ["razor-wind", "swords-dance", "cut"]),
+    6: ("charizard", ["blaze", "solar-power"], ["fire", "flying"], ["mega-punch", "fire-punch", "thunder-punch"]),
+    25: ("pikachu", ["static", "lightning-rod"], ["electric"], ["mega-punch", "pay-day", "thunder-punch"]),
+    150: ("mewtwo", ["pressure", "unnerve"], ["psychic"], ["mega-punch", "pay-day", "fire-punch"]),
+    493: ("arceus", ["multitype"], ["normal"], ["swords-dance", "cut", "mega-punch"]),
+}
+
+
+class Snapshot:
+    """Resource payloads keyed by path relative to the API root."""
+
+    def __init__(self, resources: Dict[str, Any], source_base_url: str = POKEAPI_BASE_URL):
+        """
+        Args:
+            resources: Mapping of 'family/id' (or deeper sub-paths) to JSON payloads
+            source_base_url: Base URL the embedded resource links point at
+        """
+        self.resources = resources
+        self.source_base_url = source_base_url
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def families(self) -> List[str]:
+        """Resource families present in the snapshot, e.g. ['ability', 'pokemon', ...]."""
+        return sorted({path.split('/')[0] for path in self.resources if path.count('/') == 1})
+
+    def family_members(self, family: str) -> List[Any]:
+        """Payloads of one family ordered by numeric ID."""
+        members = [
+            payload for path, payload in self.resources.items()
+            if path.count('/') == 1 and path.split('/')[0] == family
+        ]
+        return sorted(members, key=lambda payload: payload.get("id", 0))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Snapshot":
+        """
+        Load a snapshot from a JSON file (optionally gzip'd).
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Snapshot file not found: {path}")
+
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        logger.info("Loaded snapshot with %d resources from %s", len(data['resources']), path)
+        return cls(data["resources"], data.get("source_base_url", POKEAPI_BASE_URL))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the snapshot as JSON (gzip'd when the path ends with .gz)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            json.dump({"source_base_url": self.source_base_url, "resources": self.resources}, f, separators=(',', ':'))
+        logger.info("Saved snapshot with %d resources to %s", len(self.resources), path)
+
+    @classmethod
+    def capture(cls, client: Any, pokemon_ids: Iterable[Union[int, str]]) -> "Snapshot":
+        """
+        Capture Pokémon payloads from a live API through a PokemonAPIClient.
+
+        Args:
+            client: PokemonAPIClient pointed at the source API
+            pokemon_ids: Pokémon IDs or names to capture
+
+        Returns:
+            Snapshot holding every successfully fetched Pokémon
+        """
+        resources = {}
+        for result in client.get_pokemon_many(list(pokemon_ids)):
+            if result.ok:
+                resources[f"pokemon/{result.data['id']}"] = result.data
+            else:
+                logger.warning("Skipping Pokémon %s: %s", result.key, result.error)
+        return cls(resources, client.base_url)
+
+    @classmethod
+    def synthetic(cls, pokemon_count: int = 1302, seed: int = 151, base_url: str = POKEAPI_BASE_URL) -> "Snapshot":
+        """
+        Generate a deterministic, schema-valid snapshot.
+
+        Pokémon listed in KNOWN_POKEMON keep their real names, abilities, types
+        and leading moves; everything else is generated from the seed.
+
+        Args:
+            pokemon_count: Number of Pokémon (and species) to generate
+            seed: Random seed
+            base_url: Base URL embedded in resource links
+
+        Returns:
+            Generated snapshot, including the families the Pokémon link to
+        """
+        return _SyntheticBuilder(pokemon_count, seed, base_url.rstrip('/')).build()
+
+
+class _SyntheticBuilder:
+    """Builds a synthetic snapshot with consistent cross-resource links."""
+
+    def __init__(self, pokemon_count: int, seed: int, base_url: str):
+        self.pokemon_count = pokemon_count
+        self.rng = random.Random(seed)
+        self.base_url = base_url
+        self.resources: Dict[str, Any] = {}
+        self.move_names = MOVE_NAMES + [f"move-{index}" for index in range(len(MOVE_NAMES) + 1, 201)]
+        self.move_ids = {name: index for index, name in enumerate(self.move_names, start=1)}
+        self.detail_pool: List[List[Dict[str, Any]]] = []
+
+    def ref(self, family: str, index: int, name: str) -> Dict[str, str]:
+        return {"name": name, "url": f"{self.base_url}/{family}/{index}/"}
+
+    def build(self) -> Snapshot:
+        for index, name in enumerate(STAT_NAMES, start=1):
+            self.resources[f"stat/{index}"] = {"id": index, "name": name, "is_battle_only": False, "game_index": index}
+        for index, name in enumerate(MOVE_LEARN_METHODS, start=1):
+            self.resources[f"move-learn-method/{index}"] = {
+                "id": index, "name": name,
+                "version_groups": [self.ref("version-group", vg, vg_name) for vg, vg_name in enumerate(VERSION_GROUPS, start=1)],
+            }
+        for index, name in enumerate(VERSION_GROUPS, start=1):
+            self.resources[f"version-group/{index}"] = {
+                "id": index, "name": name, "order": index,
+                "move_learn_methods": [self.ref("move-learn-method", m, m_name) for m, m_name in enumerate(MOVE_LEARN_METHODS[:4], start=1)],
+            }
+        for index, name in enumerate(self.move_names, start=1):
+            type_index = (index % len(TYPE_NAMES)) + 1
+            self.resources[f"move/{index}"] = {
+                "id": index, "name": name, "accuracy": 100, "power": 40 + (index % 8) * 10, "pp": 35 - (index % 7) * 5,
+                "priority": 0, "type": self.ref("type", type_index, TYPE_NAMES[type_index - 1]),
+            }
+
+        type_members: Dict[int, List[Dict[str, Any]]] = {index: [] for index in range(1, len(TYPE_NAMES) + 1)}
+        ability_members: Dict[int, List[Dict[str, Any]]] = {index: [] for index in range(1, len(ABILITY_NAMES) + 1)}
+        for pokemon_id in range(1, self.pokemon_count + 1):
+            pokemon = self.pokemon(pokemon_id)
+            self.resources[f"pokemon/{pokemon_id}"] = pokemon
+            self.resources[f"pokemon/{pokemon_id}/encounters"] = []
+            self.resources[f"pokemon-species/{pokemon_id}"] = {
+                "id": pokemon_id, "name": pokemon["name"], "order": pokemon_id,
+                "varieties": [{"is_default": True, "pokemon": self.ref("pokemon", pokemon_id, pokemon["name"])}],
+            }
+            for entry in pokemon["types"]:
+                type_members[TYPE_NAMES.index(entry["type"]["name"]) + 1].append({"slot": entry["slot"], "pokemon": self.ref("pokemon", pokemon_id, pokemon["name"])})
+            for entry in pokemon["abilities"]:
+                ability_members[ABILITY_NAMES.index(entry["ability"]["name"]) + 1].append({"is_hidden": entry["is_hidden"], "slot": entry["slot"], "pokemon": self.ref("pokemon", pokemon_id, pokemon["name"])})
+
+        for index, name in enumerate(TYPE_NAMES, start=1):
+            self.resources[f"type/{index}"] = {"id": index, "name": name, "pokemon": type_members[index]}
+        for index, name in enumerate(ABILITY_NAMES, start=1):
+            self.resources[f"ability/{index}"] = {"id": index, "name": name, "is_main_series": True, "pokemon": ability_members[index]}
+
+        return Snapshot(self.resources, self.base_url)
+
+    def pokemon(self, pokemon_id: int) -> Dict[str, Any]:
+        rng = self.rng
+        known = KNOWN_POKEMON.get(pokemon_id)
+        if known:
+            name, ability_names, type_names, leading_moves = known
+        else:
+            name = f"pokemon-{pokemon_id}"
+            ability_names = rng.sample(ABILITY_NAMES, rng.randint(1, 3))
+            type_names = rng.sample(TYPE_NAMES, rng.randint(1, 2))
+            leading_moves = []
+
+        move_count = rng.randint(10, 60)
+        other_moves = [move for move in self.move_names if move not in leading_moves]
+        move_names = leading_moves + rng.sample(other_moves, move_count - len(leading_moves))
+
+        return {
+            "id": pokemon_id,
+            "name": name,
+            "order": pokemon_id,
+            "is_default": True,
+            "height": rng.randint(2, 200),
+            "weight": rng.randint(1, 9999),
+            "base_experience": rng.randint(36, 340),
+            "abilities": [
+                {"ability": self.ref("ability", ABILITY_NAMES.index(ability) + 1, ability), "is_hidden": slot == 3, "slot": slot}
+                for slot, ability in enumerate(ability_names, start=1)
+            ],
+            "types": [
+                {"slot": slot, "type": self.ref("type", TYPE_NAMES.index(type_name) + 1, type_name)}
+                for slot, type_name in enumerate(type_names, start=1)
+            ],
+            "stats": [
+                {"base_stat": rng.randint(5, 255), "effort": rng.randint(0, 3), "stat": self.ref("stat", index, stat)}
+                for index, stat in enumerate(STAT_NAMES, start=1)
+            ],
+            "moves": [
+                {"move": self.ref("move", self.move_ids[move], move), "version_group_details": self.version_group_details()}
+                for move in move_names
+            ],
+            "sprites": {
+                "front_default": f"{SPRITE_BASE_URL}/{pokemon_id}.png",
+                "front_shiny": f"{SPRITE_BASE_URL}/shiny/{pokemon_id}.png",
+                "front_female": None,
+                "front_shiny_female": None,
+                "back_default": f"{SPRITE_BASE_URL}/back/{pokemon_id}.png",
+                "back_shiny": f"{SPRITE_BASE_URL}/back/shiny/{pokemon_id}.png",
+                "back_female": None,
+                "back_shiny_female": None,
+            },
+            "species": self.ref("pokemon-species", pokemon_id, name),
+            "location_area_encounters": f"{self.base_url}/pokemon/{pokemon_id}/encounters",
+        }
+
+    def version_group_details(self) -> List[Dict[str, Any]]:
+        """Pick one of a fixed pool of learn-detail lists, which keeps generation fast."""
+        if not self.detail_pool:
+            self.detail_pool = [self.make_version_group_details() for _ in range(256)]
+        return self.rng.choice(self.detail_pool)
+
+    def make_version_group_details(self) -> List[Dict[str, Any]]:
+        rng = self.rng
+        details = []
+        for version_group in sorted(rng.sample(range(1, len(VERSION_GROUPS) + 1), rng.randint(1, 4))):
+            method = rng.choice((1, 1, 1, 2, 3, 4))
+            details.append({
+                "level_learned_at": rng.randint(1, 100) if method == 1 else 0,
+                "move_learn_method": self.ref("move-learn-method", method, MOVE_LEARN_METHODS[method - 1]),
+                "order": None,
+                "version_group": self.ref("version-group", version_group, VERSION_GROUPS[version_group - 1]),
+            })
+        return details
+
+
+def load_or_build_snapshot(path: Optional[Union[str, Path]] = None, pokemon_count: int = 1302) -> Snapshot:
+    """Load a snapshot file when a path is given, otherwise build a synthetic one."""
+    if path:
+        return Snapshot.load(path)
+    return Snapshot.synthetic(pokemon_count=pokemon_count)
@@ -0,0 +1,408 @@
+"""
+High-throughput local PokéAPI stand-in server.
+
+Serves a Snapshot over HTTP/1.1 with keep-alive using asyncio streams. Every
+resource response is serialized once at start-up and kept in memory as bytes,
+so the hot path is a dictionary lookup and a socket write. Latency, error
+injection and 429 throttling can be configured to exercise client behaviour.
+
+Usage:
+    python -m src.server.stub_server --port 8000
+    python -m src.server.stub_server --snapshot testdata/snapshots/pokeapi.json.gz --latency lognormal:20:0.5 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from .snapshot import Snapshot, load_or_build_snapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+
+_REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable",
+}
+
+
+class LatencyDistribution:
+    """Per-request artificial latency, parsed from a 'kind:arg[:arg]' spec in milliseconds."""
+
+    def __init__(self, spec: str = "none", rng: Optional[random.Random] = None):
+        """
+        Args:
+            spec: One of 'none', 'fixed:MS', 'uniform:MIN_MS:MAX_MS',
+                'exponential:MEAN_MS' or 'lognormal:MEDIAN_MS:SIGMA'
+            rng: Random source
+
+        Raises:
+            ValueError: If the spec is not recognised
+        """
+        kind, *args = spec.split(':')
+        if kind not in ("none", "fixed", "uniform", "exponential", "lognormal"):
+            raise ValueError(f"Unsupported latency distribution: {spec}")
+        self.spec = spec
+        self.kind = kind
+        self.args = [float(arg) for arg in args]
+        self.rng = rng or random.Random()
+
+    def sample(self) -> float:
+        """Draw a delay in seconds."""
+        if self.kind == "fixed":
+            delay_ms = self.args[0]
+        elif self.kind == "uniform":
+            delay_ms = self.rng.uniform(self.args[0], self.args[1])
+        elif self.kind == "exponential":
+            delay_ms = self.rng.expovariate(1.0 / self.args[0])
+        elif self.kind == "lognormal":
+            delay_ms = self.rng.lognormvariate(math.log(self.args[0]), self.args[1])
+        else:
+            return 0.0
+        return max(delay_ms, 0.0) / 1000.0
+
+
+@dataclass
+class FaultProfile:
+    """Fault injection settings for the stub server."""
+
+    latency: str = "none"
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (500, 503)
+    rate_limit: Optional[float] = None
+    burst: int = 10
+    seed: Optional[int] = None
+
+
+@dataclass
+class ServerStats:
+    """Counters describing what the stub server has served."""
+
+    requests: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+    def record(self, status: int) -> None:
+        self.requests += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+class _TokenBucket:
+    """Server-side throttle producing 429 responses."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume a token; returns 0 on success or the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+def _response(status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None, connection: str = "keep-alive") -> bytes:
+    """Serialize a complete HTTP/1.1 response."""
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}", f"Content-Length: {len(body)}", f"Connection: {connection}"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, Dict[str, str], int]:
+    """
+    Parse a request head into (method, target, lower-cased headers, content length).
+
+    Raises:
+        ValueError: If the request line or Content-Length is malformed
+    """
+    request_line, *header_lines = head.decode('latin-1').split("\r\n")
+    parts = request_line.split(" ")
+    if len(parts) != 3 or not parts[0] or not parts[1] or not parts[2].startswith("HTTP/"):
+        raise ValueError(f"Malformed request line: {request_line!r}")
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    content_length = int(headers.get("content-length", "0") or 0)
+    if content_length < 0:
+        raise ValueError(f"Invalid Content-Length: {content_length}")
+    return parts[0], parts[1], headers, content_length
+
+
+def _positive_int(value: Optional[str], default: int, strict: bool) -> int:
+    """Parse a pagination parameter the way Django REST framework does."""
+    try:
+        number = int(value)
+        if number < 0 or (strict and number == 0):
+            raise ValueError
+        return number
+    except (TypeError, ValueError):
+        return default
+
+
+class _Resource:
+    """A pre-serialized resource: full 200 and 304 responses plus its ETag."""
+
+    __slots__ = ("ok", "not_modified", "etag")
+
+    def __init__(self, payload: object):
+        body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {"Content-Type": "application/json; charset=utf-8", "ETag": self.etag, "Cache-Control": "public, max-age=86400"}
+        self.ok = _response(200, body, headers)
+        self.not_modified = _response(304, b"", {"ETag": self.etag})
+
+
+class StubPokeAPIServer:
+    """Asyncio HTTP server answering PokéAPI v2 routes from a snapshot."""
+
+    def __init__(self, snapshot: Optional[Snapshot] = None, host: str = "127.0.0.1", port: int = 8000, api_prefix: str = "/api/v2", faults: Optional[FaultProfile] = None):
+        """
+        Build the in-memory routing tables.
+
+        Args:
+            snapshot: Snapshot to serve (defaults to a synthetic snapshot)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            api_prefix: Path prefix of the API root
+            faults: Latency, error and throttling settings
+        """
+        self.snapshot = snapshot or Snapshot.synthetic()
+        self.host = host
+        self.port = port
+        self.api_prefix = api_prefix.rstrip('/')
+        self.faults = faults or FaultProfile()
+        self.stats = ServerStats()
+        self._rng = random.Random(self.faults.seed)
+        self._latency = LatencyDistribution(self.faults.latency, self._rng)
+        self._bucket = _TokenBucket(self.faults.rate_limit, self.faults.burst) if self.faults.rate_limit else None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: "set[asyncio.Task]" = set()
+
+        self._resources: Dict[str, _Resource] = {}
+        self._listings: Dict[str, List[bytes]] = {}
+        source = self.snapshot.source_base_url.rstrip('/')
+        for path, payload in self.snapshot.resources.items():
+            resource = _Resource(payload)
+            self._resources[path] = resource
+            if path.count('/') == 1 and isinstance(payload, dict) and "name" in payload:
+                self._resources[f"{path.split('/')[0]}/{payload['name']}"] = resource
+        for family in self.snapshot.families():
+            self._listings[family] = [
+                json.dumps({"name": payload["name"], "url": f"{source}/{family}/{payload['id']}/"}, separators=(',', ':')).encode('utf-8')
+                for payload in self.snapshot.family_members(family)
+            ]
+
+        self._not_found = _response(404, b"Not Found", {"Content-Type": "text/plain; charset=utf-8"})
+        self._bad_request = _response(400, b"Bad Request", {"Content-Type": "text/plain; charset=utf-8"}, connection="close")
+        self._index = _Resource({family: f"{source}/{family}/" for family in self._listings}).ok
+
+    @property
+    def base_url(self) -> str:
+        """Base URL clients should use, including the API prefix."""
+        return f"http://{self.host}:{self.port}{self.api_prefix}"
+
+    async def start(self) -> None:
+        """Bind the listening socket."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Stub PokéAPI serving %d resources at %s", len(self.snapshot), self.base_url)
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        """Close the listening socket and drop open keep-alive connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one keep-alive connection."""
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                try:
+                    method, target, headers, content_length = _parse_head(head)
+                except ValueError:
+                    # Framing is lost after a malformed head: answer and drop the connection
+                    self.stats.record(400)
+                    writer.write(self._bad_request)
+                    await writer.drain()
+                    break
+
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                delay = self._latency.sample()
+                if delay:
+                    await asyncio.sleep(delay)
+
+                writer.write(self._dispatch(method, target, headers))
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    def _dispatch(self, method: str, target: str, headers: Dict[str, str]) -> bytes:
+        """Route a request to its pre-serialized response."""
+        status, response = self._route(method, target, headers)
+        self.stats.record(status)
+        return response
+
+    def _route(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        if self._bucket is not None:
+            wait = self._bucket.take()
+            if wait:
+                body = b'{"detail":"Request was throttled."}'
+                return 429, _response(429, body, {"Content-Type": "application/json", "Retry-After": str(math.ceil(wait))})
+
+        if self.faults.error_rate and self._rng.random() < self.faults.error_rate:
+            status = self._rng.choice(self.faults.error_statuses)
+            return status, _response(status, b'{"detail":"Injected failure."}', {"Content-Type": "application/json"})
+
+        parts = urlsplit(target)
+        if not parts.path.startswith(self.api_prefix):
+            return 404, self._not_found
+        path = parts.path[len(self.api_prefix):].strip('/')
+
+        if method != "GET":
+            body = json.dumps({"detail": f'Method "{method}" not allowed.'}).encode('utf-8')
+            return 405, _response(405, body, {"Content-Type": "application/json", "Allow": "GET, HEAD, OPTIONS"})
+
+        if not path:
+            return 200, self._index
+
+        if path in self._listings:
+            return 200, self._list(path, dict(parse_qsl(parts.query)), headers)
+
+        resource = self._resources.get(path)
+        if resource is None:
+            return 404, self._not_found
+        if headers.get("if-none-match") == resource.etag:
+            return 304, resource.not_modified
+        return 200, resource.ok
+
+    def _list(self, family: str, query: Dict[str, str], headers: Dict[str, str]) -> bytes:
+        """Build a paginated list response with count/next/previous links."""
+        entries = self._listings[family]
+        limit = _positive_int(query.get("limit"), DEFAULT_PAGE_SIZE, strict=True)
+        offset = _positive_int(query.get("offset"), 0, strict=False)
+
+        page_url = f"http://{headers.get('host', f'{self.host}:{self.port}')}{self.api_prefix}/{family}"
+        next_url = f"{page_url}?offset={offset + limit}&limit={limit}" if offset + limit < len(entries) else None
+        if offset <= 0:
+            previous_url = None
+        elif offset - limit <= 0:
+            previous_url = f"{page_url}?limit={limit}"
+        else:
+            previous_url = f"{page_url}?offset={offset - limit}&limit={limit}"
+
+        head = json.dumps({"count": len(entries), "next": next_url, "previous": previous_url}, separators=(',', ':')).encode('utf-8')
+        body = head[:-1] + b',"results":[' + b",".join(entries[offset:offset + limit]) + b"]}"
+        return _response(200, body, {"Content-Type": "application/json; charset=utf-8"})
+
+
+class StubServerThread:
+    """Runs a StubPokeAPIServer on a background event loop thread."""
+
+    def __init__(self, server: StubPokeAPIServer):
+        self.server = server
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="stub-pokeapi", daemon=True)
+
+    def start(self) -> StubPokeAPIServer:
+        """Start the loop thread and bind the server; returns the running server."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server
+
+    def stop(self) -> None:
+        """Stop the server and the loop thread."""
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@contextmanager
+def run_stub_server(snapshot: Optional[Snapshot] = None, port: int = 0, faults: Optional[FaultProfile] = None) -> Iterator[StubPokeAPIServer]:
+    """
+    Run a stub server in a background thread for the duration of the block.
+
+    Args:
+        snapshot: Snapshot to serve (defaults to a synthetic snapshot)
+        port: Port to bind (0 picks a free port)
+        faults: Latency, error and throttling settings
+
+    Yields:
+        The running server; use its base_url with the API clients
+    """
+    runner = StubServerThread(StubPokeAPIServer(snapshot, port=port, faults=faults))
+    server = runner.start()
+    try:
+        yield server
+    finally:
+        runner.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Local PokéAPI v2 stand-in server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    parser.add_argument("--snapshot", default=None, help="Snapshot JSON file (.json or .json.gz); synthetic data when omitted")
+    parser.add_argument("--pokemon-count", type=int, default=1302, help="Pokémon in the synthetic snapshot (default: 1302)")
+    parser.add_argument("--latency", default="none", help="Latency distribution, e.g. fixed:20, uniform:5:50, lognormal:20:0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500/503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second before answering 429")
+    parser.add_argument("--burst", type=int, default=10, help="Token bucket burst size for --rate-limit")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and error injection")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)8s] %(name)s: %(message)s')
+    faults = FaultProfile(latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit, burst=args.burst, seed=args.seed)
+    server = StubPokeAPIServer(load_or_build_snapshot(args.snapshot, args.pokemon_count), host=args.host, port=args.port, faults=faults)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ Utility functions and helpers for PokeAPI testing.
 """
 
 from .data_loader import load_test_data, load_yaml_data, load_json_data
-from .logger import setup_logger, get_correlation_id
+from .logger import setup_logger, get_correlation_id, request_log_enabled, stop_log_listeners
+from .urls import canonicalize_url, endpoint_template, split_api_url
 
 __all__ = [
     "load_test_data",
@@ -11,4 +12,9 @@ __all__ = [
     "load_json_data",
     "setup_logger",
     "get_correlation_id",
+    "request_log_enabled",
+    "stop_log_listeners",
+    "canonicalize_url",
+    "endpoint_template",
+    "split_api_url",
 ]
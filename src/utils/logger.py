@@ -1,10 +1,21 @@
 """
 Logging utilities with correlation ID support.
+
+Handlers can run behind a QueueHandler/QueueListener pair so formatting and
+I/O happen on a background thread instead of the request hot path, and
+routine per-request logging can be sampled per logger. A queued logger keeps
+propagating; its ancestors' handlers (e.g. pytest's log_cli handler on the
+root logger) are run from the listener thread as well.
 """
 
+import atexit
+import itertools
 import logging
+import queue
+import threading
 import uuid
-from typing import Optional
+from logging.handlers import QueueListener
+from typing import Dict, List, Optional, Tuple, Union
 from contextvars import ContextVar
 
 # Context variable for correlation ID
@@ -44,13 +55,114 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     return correlation_id
 
 
-def setup_logger(name: str, level: str = "INFO") -> CorrelationAdapter:
+class RequestSampler:
+    """Decides which requests of a high-volume logger get logged (one in every N)."""
+    
+    def __init__(self, every: int):
+        """
+        Initialize the sampler.
+        
+        Args:
+            every: Log one request out of this many (1 logs every request)
+        """
+        if every <= 0:
+            raise ValueError(f"Invalid sampling rate: {every}. Must be positive")
+        self.every = every
+        self._counter = itertools.count()
+    
+    def sample(self) -> bool:
+        """Whether the next request should be logged."""
+        return next(self._counter) % self.every == 0
+
+
+_samplers: Dict[str, RequestSampler] = {}
+
+
+def request_log_enabled(logger: Union[logging.Logger, logging.LoggerAdapter], level: int = logging.INFO) -> bool:
+    """
+    Decide once per request whether its routine log lines should be emitted.
+    
+    Checks the level first and then the logger's RequestSampler (configured with
+    setup_logger(sample_every=N)), so skipped requests never build a LogRecord.
+    Warnings and errors should be logged unconditionally.
+    
+    Args:
+        logger: Logger or adapter used for the request
+        level: Level of the routine lines
+        
+    Returns:
+        True if the request's lines should be logged
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    sampler = _samplers.get(logger.name)
+    return sampler is None or sampler.sample()
+
+
+class QueueFilter(logging.Filter):
+    """
+    Logger filter that hands records to a queue and stops them there.
+    
+    The records are enqueued unformatted (an in-process queue does not need
+    them pickled), so formatting is left to the listener thread. Arguments
+    passed to a log call must not be mutated afterwards. Unlike a QueueHandler
+    the filter also holds the record back from propagation, so the logger can
+    keep propagating (pytest attaches its own handlers to loggers that don't).
+    """
+    
+    def __init__(self, log_queue: "queue.SimpleQueue[logging.LogRecord]"):
+        super().__init__()
+        self.queue = log_queue
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        self.queue.put_nowait(record)
+        return False
+
+
+class LoggerHandler(logging.Handler):
+    """Listener-side handler running a logger's handlers, and its ancestors' if it propagates."""
+    
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self.logger = logger
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        self.logger.callHandlers(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+_listeners: Dict[str, Tuple[QueueListener, QueueFilter]] = {}
+_listeners_lock = threading.Lock()
+
+
+def stop_log_listeners() -> None:
+    """Flush and stop every queue listener started by setup_logger (also runs at exit)."""
+    with _listeners_lock:
+        listeners = dict(_listeners)
+        _listeners.clear()
+    for name, (listener, queue_filter) in listeners.items():
+        logging.getLogger(name).removeFilter(queue_filter)
+        listener.stop()
+
+
+atexit.register(stop_log_listeners)
+
+
+def setup_logger(name: str, level: str = "INFO", use_queue: bool = False, sample_every: Optional[int] = None, stream: bool = True) -> CorrelationAdapter:
     """
     Set up a logger with correlation ID support.
     
     Args:
         name: Logger name
         level: Logging level
+        use_queue: Move handler formatting and I/O to a background QueueListener thread
+        sample_every: Log only one in this many requests through this logger
+            (see request_log_enabled); warnings and errors are never sampled
+        stream: Attach a StreamHandler if the logger has none; pass False to
+            rely on propagation alone (e.g. to pytest's logging handlers)
         
     Returns:
         Logger adapter with correlation ID support
@@ -65,9 +177,30 @@ def setup_logger(name: str, level: str = "INFO") -> CorrelationAdapter:
     )
     
     # Create handler if not exists
-    if not logger.handlers:
+    if stream and not logger.handlers:
         handler = logging.StreamHandler()
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     
+    if use_queue:
+        _enable_queue(logger)
+    
+    if sample_every is not None and sample_every != 1:
+        _samplers[name] = RequestSampler(sample_every)
+    else:
+        _samplers.pop(name, None)
+    
     return CorrelationAdapter(logger, {})
+
+
+def _enable_queue(logger: logging.Logger) -> None:
+    """Divert the logger's records to a listener thread that runs its handlers."""
+    with _listeners_lock:
+        if logger.name in _listeners:
+            return
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = QueueListener(log_queue, LoggerHandler(logger), respect_handler_level=True)
+        listener.start()
+        queue_filter = QueueFilter(log_queue)
+        logger.addFilter(queue_filter)
+        _listeners[logger.name] = (listener, queue_filter)
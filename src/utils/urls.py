@@ -0,0 +1,79 @@
+"""
+URL helpers shared by caching and request bookkeeping.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def canonicalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a canonical form of a URL so equivalent requests compare equal.
+
+    Scheme and host are lowercased, trailing slashes are dropped from the path,
+    and query parameters (including ``params``) are merged and sorted.
+
+    Args:
+        url: Absolute request URL
+        params: Optional query parameters sent alongside the URL
+
+    Returns:
+        Canonical URL string
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(key), str(value)) for key, value in params.items())
+
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+def split_api_url(url: str, base_url: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Turn an absolute API link (e.g. a pagination 'next' URL) into an endpoint and params.
+
+    Only the path below the API root is kept, so links that carry a different
+    host than the configured base URL still resolve against the client.
+
+    Args:
+        url: Absolute URL returned by the API
+        base_url: Client base URL, e.g. 'https://pokeapi.co/api/v2'
+
+    Returns:
+        Tuple of (endpoint path such as '/pokemon', query parameters)
+
+    Raises:
+        ValueError: If the URL is not below the base URL's API root
+    """
+    parts = urlsplit(url)
+    root = urlsplit(base_url).path.rstrip('/')
+    if parts.path != root and not parts.path.startswith(root + '/'):
+        raise ValueError(f"URL {url} is not below the API root {root or '/'}")
+
+    endpoint = parts.path[len(root):] or '/'
+    return endpoint, dict(parse_qsl(parts.query, keep_blank_values=True))
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse resource identifiers in an endpoint path into placeholders.
+
+    Numeric segments become ``{id}`` and the identifier right after the
+    resource family becomes ``{name}`` when it is not numeric, so
+    '/pokemon/25' and '/pokemon/25/encounters' map to '/pokemon/{id}' and
+    '/pokemon/{id}/encounters', and '/pokemon/pikachu' to '/pokemon/{name}'.
+
+    Args:
+        endpoint: Endpoint path, optionally with a query string
+
+    Returns:
+        Endpoint template without query string or trailing slash
+    """
+    segments = [segment for segment in endpoint.split('?', 1)[0].split('/') if segment]
+    for position, segment in enumerate(segments):
+        if segment.isdigit():
+            segments[position] = "{id}"
+        elif position == 1:
+            segments[position] = "{name}"
+    return "/" + "/".join(segments)
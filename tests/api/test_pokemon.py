@@ -113,6 +113,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_id, expected_name", VALID_POKEMON_BY_ID)
+    @pytest.mark.prefetch("/pokemon/{pokemon_id}")
     def test_pok_01_retrieve_pokemon_by_valid_id(self, pokemon_client: PokemonAPIClient, pokemon_id: int, expected_name: str):
         """
         POK-01: Retrieve a Pokémon by valid ID → 200 OK with correct details.
@@ -138,6 +139,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_name, expected_id", VALID_POKEMON_BY_NAME)
+    @pytest.mark.prefetch("/pokemon/{pokemon_name}")
     def test_pok_02_retrieve_pokemon_by_valid_name(self, pokemon_client: PokemonAPIClient, pokemon_name: str, expected_id: int):
         """
         POK-02: Retrieve a Pokémon by valid name → 200 OK with correct details.
@@ -162,6 +164,7 @@ class TestPokemon:
 
     @pytest.mark.api
     @pytest.mark.pokemon
+    @pytest.mark.prefetch("/pokemon")
     def test_pok_03_list_pokemon_no_params(self, pokemon_client: PokemonAPIClient):
         """
         POK-03: List Pokémon (no params) → default paginated list with count.
@@ -191,6 +194,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("limit, offset, expected_count, description", PAGINATION_TEST_CASES)
+    @pytest.mark.prefetch("/pokemon?limit={limit}&offset={offset}")
     def test_pok_04_paginate_pokemon_with_limit_offset(self, pokemon_client: PokemonAPIClient, limit: int, offset: int, expected_count: int, description: str):
         """
         POK-04: Paginate Pokémon with limit/offset → correct lengths and links.
@@ -225,6 +229,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("limit, offset, description", BOUNDARY_PAGINATION_CASES)
+    @pytest.mark.prefetch("/pokemon?limit={limit}&offset={offset}")
     def test_pok_05_boundary_pagination(self, pokemon_client: PokemonAPIClient, limit: int, offset: int, description: str):
         """
         POK-05: Boundary pagination (limit=0/1/high; offset=0/end/beyond).
@@ -268,6 +273,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_id, expected_name", VALID_POKEMON_BY_ID)
+    @pytest.mark.prefetch("/pokemon/{pokemon_id}")
     def test_pok_06_schema_correctness(self, pokemon_client: PokemonAPIClient, pokemon_id: int, expected_name: str):
         """
         POK-06: Schema correctness (abilities, moves, types, stats, sprites, species).
@@ -314,6 +320,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_id, pokemon_name, expected_abilities, expected_types, expected_moves", CROSS_RESOURCE_TEST_CASES)
+    @pytest.mark.prefetch("/pokemon/{pokemon_id}")
     def test_pok_07_nested_references_validation(self, pokemon_client: PokemonAPIClient, pokemon_id: int, pokemon_name: str, expected_abilities: list, expected_types: list, expected_moves: list):
         """
         POK-07: Nested references validation (abilities, types, moves are valid).
@@ -362,6 +369,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("invalid_id", INVALID_POKEMON_IDS)
+    @pytest.mark.prefetch("/pokemon/{invalid_id}")
     def test_pok_08_retrieve_pokemon_by_invalid_id(self, pokemon_client: PokemonAPIClient, invalid_id: int):
         """
         POK-08: Non-existent Pokémon → 404 Not Found.
@@ -382,6 +390,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("invalid_name", INVALID_POKEMON_NAMES)
+    @pytest.mark.prefetch("/pokemon/{invalid_name}")
     def test_pok_08_retrieve_pokemon_by_invalid_name(self, pokemon_client: PokemonAPIClient, invalid_name: str):
         """
         POK-08: Non-existent Pokémon → 404 Not Found.
@@ -460,6 +469,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_id, description", SERVER_ERROR_TEST_CASES)
+    @pytest.mark.prefetch("/pokemon/{pokemon_id}")
     def test_pok_11_server_error_handling(self, pokemon_client: PokemonAPIClient, pokemon_id: int, description: str):
         """
         POK-11: Server error handling → 5xx without internal details.
@@ -495,6 +505,7 @@ class TestPokemon:
     @pytest.mark.api
     @pytest.mark.pokemon
     @pytest.mark.parametrize("pokemon_id, expected_name", VALID_POKEMON_BY_ID)
+    @pytest.mark.prefetch("/pokemon/{pokemon_id}")
     def test_pok_12_cross_resource_consistency_validation(self, pokemon_client: PokemonAPIClient, pokemon_id: int, expected_name: str):
         """
         POK-12: Cross-resource consistency validation.
@@ -583,6 +594,7 @@ class TestPokemon:
 
     @pytest.mark.api
     @pytest.mark.pokemon
+    @pytest.mark.prefetch("/pokemon?limit=10&offset=0", "/pokemon?limit=10&offset=10")
     def test_pok_14_pagination_navigation_consistency(self, pokemon_client: PokemonAPIClient):
         """
         POK-14: Pagination navigation consistency.
@@ -622,6 +634,7 @@ class TestPokemon:
 
     @pytest.mark.api
     @pytest.mark.pokemon
+    @pytest.mark.prefetch("/pokemon/25", "/pokemon/pikachu")
     def test_pok_15_data_integrity_across_requests(self, pokemon_client: PokemonAPIClient):
         """
         POK-15: Data integrity across requests.
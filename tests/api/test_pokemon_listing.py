@@ -0,0 +1,59 @@
+"""
+Tests for client-side Pokémon listing helpers, run against the local stand-in.
+"""
+
+import pytest
+from src.api.pokemon_client import PokemonAPIClient
+from src.models.base import NamedAPIResource
+
+
+@pytest.mark.pokemon
+class TestPokemonListing:
+    """Test class for Pokémon listing helpers."""
+
+    @pytest.mark.parametrize("page_size, prefetch", [(100, True), (500, False), (1302, True)])
+    def test_iter_pokemon_walks_full_index(self, stub_pokemon_client: PokemonAPIClient, page_size: int, prefetch: bool):
+        """
+        iter_pokemon follows 'next' links and yields every entry exactly once, in order.
+
+        Args:
+            stub_pokemon_client: API client pointed at the local stand-in
+            page_size: Entries requested per page
+            prefetch: Whether the next page is fetched in the background
+        """
+        expected_count = stub_pokemon_client.list_pokemon(limit=1)["count"]
+
+        entries = list(stub_pokemon_client.iter_pokemon(page_size=page_size, prefetch=prefetch))
+
+        assert len(entries) == expected_count
+        assert all(isinstance(entry, NamedAPIResource) for entry in entries)
+        assert len({entry.url for entry in entries}) == expected_count
+        assert entries[0].name == "bulbasaur"
+
+    def test_iter_pokemon_stops_early(self, stub_pokemon_client: PokemonAPIClient):
+        """
+        Abandoning the iterator part-way releases the prefetch without errors.
+
+        Args:
+            stub_pokemon_client: API client pointed at the local stand-in
+        """
+        iterator = stub_pokemon_client.iter_pokemon(page_size=10)
+        first = [next(iterator) for _ in range(15)]
+        iterator.close()
+
+        assert [entry.name for entry in first][:1] == ["bulbasaur"]
+
+    @pytest.mark.parametrize("page_size", [100, 250, 5000])
+    def test_list_all_pokemon_matches_sequential_walk(self, stub_pokemon_client: PokemonAPIClient, page_size: int):
+        """
+        Sharded listing returns the same entries, in the same order, as following 'next' links.
+
+        Args:
+            stub_pokemon_client: API client pointed at the local stand-in
+            page_size: Entries per window
+        """
+        sequential = list(stub_pokemon_client.iter_pokemon(page_size=200, prefetch=False))
+
+        sharded = stub_pokemon_client.list_all_pokemon(page_size=page_size)
+
+        assert sharded == sequential
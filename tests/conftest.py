@@ -4,9 +4,41 @@ Pytest configuration and fixtures for PokeAPI testing.
 
 import pytest
 import os
+import tempfile
+import uuid
+from dataclasses import asdict
 from playwright.sync_api import APIRequestContext, Playwright, sync_playwright
 from src.api.pokemon_client import PokemonAPIClient
-from src.config.settings import test_settings
+from src.config.settings import settings, test_settings
+from src.core.cassette import API_MODES, Cassette
+from src.core.client_pool import ClientPool, WarmupReport
+from src.core.context_pool import APIRequestContextPool
+from src.core.disk_cache import DiskHTTPCache
+from src.core.metrics import MetricsObserver, MetricsRegistry
+from src.core.prefetch import PrefetchPlan, PrefetchReport, prefetch
+from src.core.rate_limiter import SharedRateLimiter, parse_rate_limits
+from src.core.resilience import Resilience
+from src.core.response_cache import ResponseCache
+from src.core.shared_store import SharedResponseStore, SharedStoreStats
+from src.server.stub_server import StubPokeAPIServer, StubServerThread
+from src.utils.logger import setup_logger, stop_log_listeners
+
+response_cache_key = pytest.StashKey[ResponseCache]()
+http_cache_key = pytest.StashKey[DiskHTTPCache]()
+cassette_key = pytest.StashKey[Cassette]()
+stub_server_key = pytest.StashKey[StubServerThread]()
+metrics_key = pytest.StashKey[MetricsRegistry]()
+resilience_key = pytest.StashKey[Resilience]()
+rate_limiter_key = pytest.StashKey[SharedRateLimiter]()
+client_pool_key = pytest.StashKey[ClientPool]()
+warmup_reports_key = pytest.StashKey[list]()
+prefetch_plan_key = pytest.StashKey[PrefetchPlan]()
+prefetch_report_key = pytest.StashKey[PrefetchReport]()
+shared_store_key = pytest.StashKey[SharedResponseStore]()
+shared_store_stats_key = pytest.StashKey[list]()
+
+# Loggers that log once per request
+CLIENT_LOGGERS = ("src.core.base_api_client", "src.core.async_base_api_client")
 
 
 def pytest_addoption(parser):
@@ -17,15 +49,328 @@ def pytest_addoption(parser):
         default=None,
         help="Override base URL for API requests (e.g., --api-base-url=http://localhost:8000/api/v2)"
     )
+    parser.addoption(
+        "--stub-server",
+        action="store_true",
+        default=False,
+        help="Run the suite against an in-process local PokéAPI stand-in (implies --api-base-url)"
+    )
+    parser.addoption(
+        "--response-cache",
+        action="store_true",
+        default=False,
+        help="Serve repeated GETs from an in-process response cache (404s included)"
+    )
+    parser.addoption(
+        "--response-cache-ttl",
+        action="store",
+        type=float,
+        default=300.0,
+        help="Lifetime of cached responses in seconds (default: 300)"
+    )
+    parser.addoption(
+        "--http-cache-dir",
+        action="store",
+        default=None,
+        help="Directory for the persistent HTTP cache revalidated with ETag/Last-Modified"
+    )
+    parser.addoption(
+        "--http-cache-max-mb",
+        action="store",
+        type=int,
+        default=256,
+        help="Size bound of the persistent HTTP cache in megabytes (default: 256)"
+    )
+    parser.addoption(
+        "--api-mode",
+        action="store",
+        choices=API_MODES,
+        default="live",
+        help="live: hit the API; record: hit the API and save a cassette; replay: serve from the cassette only"
+    )
+    parser.addoption(
+        "--cassette",
+        action="store",
+        default="cassettes/pokeapi",
+        help="Cassette path without extension (default: cassettes/pokeapi)"
+    )
+    parser.addoption(
+        "--rate-limit",
+        action="store",
+        default=None,
+        help="Host-wide request rate shared by all xdist workers: RPS[:BURST] or family=RPS[:BURST],... ('*' for all requests)"
+    )
+    parser.addoption(
+        "--shared-store",
+        action="store_true",
+        default=False,
+        help="Share fetched responses between the xdist workers of this run through a host-local SQLite store"
+    )
+    parser.addoption(
+        "--prefetch",
+        action="store_true",
+        default=False,
+        help="Fetch every endpoint declared with @pytest.mark.prefetch into the response cache before the first test (implies --response-cache)"
+    )
+    parser.addoption(
+        "--no-warmup",
+        action="store_true",
+        default=False,
+        help="Do not pre-warm the session client's request context before the first test"
+    )
+    parser.addoption(
+        "--warm-pool",
+        action="store_true",
+        default=False,
+        help="Also start and pre-warm every worker of the context pool (otherwise they start on first use)"
+    )
+    parser.addoption(
+        "--metrics-file",
+        action="store",
+        default=None,
+        help="Write per-request latency histograms and counters in OpenMetrics text format to this file"
+    )
 
 
 def pytest_configure(config):
     """Configure pytest and store CLI options."""
+    if config.getoption("--stub-server"):
+        runner = StubServerThread(StubPokeAPIServer(port=0))
+        server = runner.start()
+        config.stash[stub_server_key] = runner
+        config.option.api_base_url = server.base_url
+    
     # Set environment variable if CLI argument is provided
     cli_base_url = config.getoption("--api-base-url")
     if cli_base_url:
         os.environ['POKEAPI_BASE_URL'] = cli_base_url
         os.environ['TEST_BASE_URL'] = cli_base_url
+    
+    if settings.log_queue or settings.log_sample_every > 1:
+        # Keep per-request logging off the hot path; records still reach pytest's handlers
+        for name in CLIENT_LOGGERS:
+            setup_logger(name, settings.log_level, use_queue=settings.log_queue, sample_every=settings.log_sample_every, stream=False)
+    
+    config.addinivalue_line("markers", "unit: Offline unit tests for framework components (no network)")
+    config.addinivalue_line("markers", "prefetch(*endpoints): endpoints the test reads, as str.format templates over its parameters")
+    
+    if config.getoption("--response-cache") or config.getoption("--prefetch"):
+        config.stash[response_cache_key] = ResponseCache(
+            ttl=config.getoption("--response-cache-ttl"),
+            cache_not_found=True,
+        )
+    
+    http_cache_dir = config.getoption("--http-cache-dir")
+    if http_cache_dir:
+        config.stash[http_cache_key] = DiskHTTPCache(
+            http_cache_dir,
+            max_bytes=config.getoption("--http-cache-max-mb") * 1024 * 1024,
+        )
+
+
+    api_mode = config.getoption("--api-mode")
+    if api_mode != "live":
+        cassette_path = config.rootpath / config.getoption("--cassette")
+        config.stash[cassette_key] = Cassette(cassette_path, api_mode)
+    
+    config.stash[metrics_key] = MetricsRegistry()
+    # One breaker and retry budget for the whole session, so a dead API fails fast across tests
+    config.stash[resilience_key] = Resilience()
+    
+    rate_limit = config.getoption("--rate-limit")
+    # Like the shared store, the controller's limiter picks the state file for its xdist workers
+    rate_limit_path = getattr(config, "workerinput", {}).get("rate_limit_path")
+    limiter = SharedRateLimiter(parse_rate_limits(rate_limit if '=' in rate_limit else f"*={rate_limit}"), path=rate_limit_path) if rate_limit else SharedRateLimiter.from_settings(rate_limit_path)
+    if limiter is not None:
+        config.stash[rate_limiter_key] = limiter
+    config.stash[warmup_reports_key] = []
+    
+    if config.getoption("--shared-store"):
+        # The controller picks the file and hands it to its xdist workers
+        workerinput = getattr(config, "workerinput", {})
+        path = workerinput.get("shared_store_path") or os.path.join(tempfile.gettempdir(), f"pokeapi-shared-{uuid.uuid4().hex}.sqlite3")
+        config.stash[shared_store_key] = SharedResponseStore(path)
+    config.stash[shared_store_stats_key] = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist controller: point the worker at this run's shared store and rate limiter state."""
+    store = node.config.stash.get(shared_store_key, None)
+    if store is not None:
+        node.workerinput["shared_store_path"] = str(store.path)
+    limiter = node.config.stash.get(rate_limiter_key, None)
+    if limiter is not None:
+        node.workerinput["rate_limit_path"] = str(limiter.path)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Gather the endpoints the selected tests declare with @pytest.mark.prefetch."""
+    if not config.getoption("--prefetch"):
+        return
+    plan = PrefetchPlan()
+    for item in items:
+        if "pokemon_client" not in getattr(item, "fixturenames", ()):
+            continue
+        templates = [endpoint for marker in item.iter_markers("prefetch") for endpoint in marker.args]
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        try:
+            plan.add(templates, params)
+        except KeyError as e:
+            raise pytest.UsageError(f"{item.nodeid}: prefetch endpoint uses unknown parameter {e}")
+    config.stash[prefetch_plan_key] = plan
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Collect the client pool's warm-up report (and hand it to the xdist controller)."""
+    config = session.config
+    pool = config.stash.get(client_pool_key, None)
+    if pool is not None:
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["client_pool"] = pool.report.to_dict()
+        else:
+            config.stash[warmup_reports_key].append(pool.report)
+    
+    store = config.stash.get(shared_store_key, None)
+    if store is not None:
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["shared_store"] = asdict(store.stats)
+        else:
+            config.stash[shared_store_stats_key].append(store.stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller: gather the warm-up report of a finished worker."""
+    workeroutput = getattr(node, "workeroutput", {})
+    report = workeroutput.get("client_pool")
+    if report is not None:
+        node.config.stash[warmup_reports_key].append(WarmupReport.from_dict(report))
+    stats = workeroutput.get("shared_store")
+    if stats is not None:
+        node.config.stash[shared_store_stats_key].append(SharedStoreStats(**stats))
+
+
+def pytest_unconfigure(config):
+    """Release resources created in pytest_configure."""
+    stop_log_listeners()
+    
+    cassette = config.stash.get(cassette_key, None)
+    if cassette is not None:
+        # A no-op where nothing was recorded, e.g. on the xdist controller
+        cassette.save()
+    
+    runner = config.stash.get(stub_server_key, None)
+    if runner is not None:
+        runner.stop()
+    http_cache = config.stash.get(http_cache_key, None)
+    if http_cache is not None:
+        http_cache.close()
+    
+    limiter = config.stash.get(rate_limiter_key, None)
+    if limiter is not None:
+        limiter.close()
+    
+    store = config.stash.get(shared_store_key, None)
+    if store is not None:
+        store.close()
+        if not hasattr(config, "workerinput"):
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(f"{store.path}{suffix}")
+                except FileNotFoundError:
+                    pass
+    
+    metrics_file = config.getoption("--metrics-file")
+    registry = config.stash.get(metrics_key, None)
+    if metrics_file and registry is not None:
+        with open(metrics_file, "w", encoding="utf-8") as f:
+            f.write(registry.to_openmetrics())
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report response cache effectiveness at the end of the run."""
+    cache = config.stash.get(response_cache_key, None)
+    if cache is not None:
+        stats = cache.stats
+        terminalreporter.write_sep("-", "response cache")
+        terminalreporter.write_line(
+            f"hits={stats.hits} misses={stats.misses} negative_hits={stats.negative_hits} "
+            f"evictions={stats.evictions} expirations={stats.expirations} "
+            f"hit_ratio={stats.hit_ratio:.1%} entries={len(cache)} bytes={cache.total_bytes}"
+        )
+    
+    cassette = config.stash.get(cassette_key, None)
+    if cassette is not None:
+        terminalreporter.write_sep("-", f"cassette ({cassette.mode})")
+        terminalreporter.write_line(f"responses={len(cassette)} replayed={cassette.replayed} path={cassette.data_path}")
+    
+    http_cache = config.stash.get(http_cache_key, None)
+    if http_cache is not None:
+        stats = http_cache.stats
+        terminalreporter.write_sep("-", "http cache")
+        terminalreporter.write_line(
+            f"lookups={stats.lookups} revalidated={stats.revalidated} stored={stats.stored} "
+            f"evictions={stats.evictions} bytes={http_cache.total_bytes()} path={http_cache.path}"
+        )
+    
+    resilience = config.stash.get(resilience_key, None)
+    if resilience is not None and (resilience.stats.retries or resilience.stats.short_circuited or resilience.stats.budget_exhausted):
+        stats = resilience.stats
+        terminalreporter.write_sep("-", "resilience")
+        terminalreporter.write_line(
+            f"requests={stats.requests} retries={stats.retries} budget_exhausted={stats.budget_exhausted} "
+            f"short_circuited={stats.short_circuited} circuit={resilience.breaker.state}"
+        )
+    
+    limiter = config.stash.get(rate_limiter_key, None)
+    if limiter is not None and limiter.stats.requests:
+        stats = limiter.stats
+        terminalreporter.write_sep("-", "rate limiter")
+        terminalreporter.write_line(
+            f"requests={stats.requests} delayed={stats.delayed} total_wait={stats.total_wait:.2f}s "
+            f"max_wait={stats.max_wait * 1000:.0f}ms path={limiter.path}"
+        )
+    
+    reports = config.stash.get(warmup_reports_key, [])
+    if reports:
+        terminalreporter.write_sep("-", "client pool")
+        for report in sorted(reports, key=lambda r: r.name):
+            terminalreporter.write_line(
+                f"{report.name}: contexts={len(report.contexts)} warmup={report.elapsed * 1000:.0f}ms "
+                f"cold_p50={report.cold_p50 * 1000:.1f}ms warm_p50={report.warm_p50 * 1000:.1f}ms "
+                f"reuses={report.reuses} errors={len(report.errors)}"
+            )
+    
+    store_stats = config.stash.get(shared_store_stats_key, [])
+    if store_stats:
+        terminalreporter.write_sep("-", "shared store")
+        terminalreporter.write_line(
+            f"processes={len(store_stats)} fills={sum(s.fills for s in store_stats)} "
+            f"hits={sum(s.hits for s in store_stats)} waits={sum(s.waits for s in store_stats)} "
+            f"wait_time={sum(s.wait_time for s in store_stats):.2f}s takeovers={sum(s.takeovers for s in store_stats)}"
+        )
+    
+    plan = config.stash.get(prefetch_plan_key, None)
+    report = config.stash.get(prefetch_report_key, None)
+    if plan is not None and report is not None:
+        terminalreporter.write_sep("-", "prefetch")
+        terminalreporter.write_line(
+            f"endpoints={report.endpoints} fetched={report.fetched} not_found={report.not_found} "
+            f"failed={len(report.failed)} elapsed={report.elapsed * 1000:.0f}ms "
+            f"coverage={plan.covered}/{plan.items} tests ({plan.coverage:.0%})"
+        )
+    
+    registry = config.stash.get(metrics_key, None)
+    rows = registry.latency_summary() if registry is not None else []
+    if rows:
+        terminalreporter.write_sep("-", "request latency")
+        for row in rows:
+            terminalreporter.write_line(
+                f"{row.method} {row.endpoint}: n={row.count} p50={row.p50 * 1000:.1f}ms "
+                f"p95={row.p95 * 1000:.1f}ms p99={row.p99 * 1000:.1f}ms max={row.max * 1000:.1f}ms"
+            )
 
 
 @pytest.fixture(scope="session")
@@ -36,8 +381,14 @@ def playwright() -> Playwright:
 
 
 @pytest.fixture(scope="session")
-def api_request_context(playwright: Playwright, dynamic_settings: dict) -> APIRequestContext:
-    """API request context for making HTTP requests."""
+def api_request_context(request, cassette: Cassette, dynamic_settings: dict) -> APIRequestContext:
+    """API request context for making HTTP requests (None when replaying a cassette)."""
+    if cassette is not None and cassette.mode == "replay":
+        # Replay never touches the network, so skip starting Playwright altogether
+        yield None
+        return
+    
+    playwright = request.getfixturevalue("playwright")
     # Use dynamic settings if CLI override is provided, otherwise use default
     timeout = dynamic_settings['test_settings'].timeout * 1000  # Convert seconds to milliseconds
     context = playwright.request.new_context(timeout=timeout)
@@ -45,12 +396,113 @@ def api_request_context(playwright: Playwright, dynamic_settings: dict) -> APIRe
     context.dispose()
 
 
-@pytest.fixture(scope="function")
-def pokemon_client(api_request_context: APIRequestContext, dynamic_settings: dict) -> PokemonAPIClient:
-    """Create a Pokémon API client for testing."""
+@pytest.fixture(scope="session")
+def api_context_pool(dynamic_settings: dict) -> APIRequestContextPool:
+    """Per-thread API request contexts for bulk reads (workers start on first use)."""
+    test_settings = dynamic_settings['test_settings']
+    pool = APIRequestContextPool(test_settings.parallel_workers, timeout=test_settings.timeout * 1000)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def response_cache(request) -> ResponseCache:
+    """Session-wide response cache, or None unless --response-cache is given."""
+    return request.config.stash.get(response_cache_key, None)
+
+
+@pytest.fixture(scope="session")
+def http_cache(request) -> DiskHTTPCache:
+    """Persistent HTTP cache, or None unless --http-cache-dir is given."""
+    return request.config.stash.get(http_cache_key, None)
+
+
+@pytest.fixture(scope="session")
+def cassette(request) -> Cassette:
+    """Cassette selected with --api-mode, or None in live mode."""
+    return request.config.stash.get(cassette_key, None)
+
+
+@pytest.fixture(scope="session")
+def metrics_registry(request) -> MetricsRegistry:
+    """Session-wide registry fed by the client fixtures' request observers."""
+    return request.config.stash[metrics_key]
+
+
+@pytest.fixture(scope="session")
+def resilience(request) -> Resilience:
+    """Session-wide retry budget and circuit breaker for clients of the API under test."""
+    return request.config.stash[resilience_key]
+
+
+@pytest.fixture(scope="session")
+def rate_limiter(request) -> SharedRateLimiter:
+    """Host-wide rate limiter from --rate-limit or POKEAPI_RATE_LIMIT(S), or None."""
+    return request.config.stash.get(rate_limiter_key, None)
+
+
+@pytest.fixture(scope="session")
+def shared_store(request) -> SharedResponseStore:
+    """Response store shared by this run's xdist workers, or None unless --shared-store is given."""
+    return request.config.stash.get(shared_store_key, None)
+
+
+@pytest.fixture(scope="session")
+def client_pool(request, api_request_context: APIRequestContext, api_context_pool: APIRequestContextPool, response_cache: ResponseCache, http_cache: DiskHTTPCache, cassette: Cassette, metrics_registry: MetricsRegistry, resilience: Resilience, rate_limiter: SharedRateLimiter, shared_store: SharedResponseStore, dynamic_settings: dict) -> ClientPool:
+    """Session-wide Pokémon API client and context pool, warmed up unless --no-warmup is given."""
     # Use dynamic settings if CLI override is provided, otherwise use default
     base_url = dynamic_settings.get('cli_base_url')
-    return PokemonAPIClient(api_request_context, base_url=base_url)
+    client = PokemonAPIClient(api_request_context, base_url=base_url, context_pool=api_context_pool, cache=response_cache, http_cache=http_cache, cassette=cassette, observers=[MetricsObserver(metrics_registry)], resilience=resilience, rate_limiter=rate_limiter, shared_store=shared_store)
+    # Under xdist each worker process gets its own pool
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    pool = ClientPool(client, api_context_pool, name=worker)
+    if not request.config.getoption("--no-warmup"):
+        pool.warm_up(warm_pool=request.config.getoption("--warm-pool"))
+    request.config.stash[client_pool_key] = pool
+    return pool
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_client_pool(request):
+    """Build and warm the client pool, and run the prefetch, before the first test that uses it."""
+    if any("pokemon_client" in getattr(item, "fixturenames", ()) for item in request.session.items):
+        pool = request.getfixturevalue("client_pool")
+        plan = request.config.stash.get(prefetch_plan_key, None)
+        if plan is not None and plan.endpoints:
+            request.config.stash[prefetch_report_key] = prefetch(pool.client, plan.endpoints)
+
+
+@pytest.fixture(scope="function")
+def pokemon_client(client_pool: ClientPool) -> PokemonAPIClient:
+    """Pokémon API client for testing, shared across the session."""
+    return client_pool.acquire()
+
+
+@pytest.fixture(scope="session")
+def stub_server(request) -> StubPokeAPIServer:
+    """Local PokéAPI stand-in (shared with --stub-server when that flag is set)."""
+    runner = request.config.stash.get(stub_server_key, None)
+    if runner is not None:
+        yield runner.server
+        return
+    
+    runner = StubServerThread(StubPokeAPIServer(port=0))
+    yield runner.start()
+    runner.stop()
+
+
+@pytest.fixture(scope="session")
+def stub_api_request_context(playwright: Playwright) -> APIRequestContext:
+    """Live request context for tests that always target the local stand-in."""
+    context = playwright.request.new_context(timeout=10000)
+    yield context
+    context.dispose()
+
+
+@pytest.fixture(scope="function")
+def stub_pokemon_client(stub_api_request_context: APIRequestContext, api_context_pool: APIRequestContextPool, stub_server: StubPokeAPIServer, metrics_registry: MetricsRegistry) -> PokemonAPIClient:
+    """Pokémon API client pointed at the local stand-in, independent of --api-mode."""
+    return PokemonAPIClient(stub_api_request_context, base_url=stub_server.base_url, context_pool=api_context_pool, observers=[MetricsObserver(metrics_registry)])
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1 @@
+# Core framework test modules
@@ -0,0 +1,109 @@
+"""
+Tests for the async API client and its bounded-concurrency get_many.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.api.async_pokemon_client import AsyncPokemonAPIClient
+from src.core.resilience import HTTPError
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+def run_async(coroutine):
+    """Run a coroutine on a fresh thread (sync Playwright may own this thread's loop)."""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def track_in_flight(client: AsyncPokemonAPIClient, delays=None) -> dict:
+    """Wrap client.get to record in-flight and peak calls, optionally delaying endpoints."""
+    counters = {"in_flight": 0, "peak": 0, "cancelled": 0}
+    get = client.get
+
+    async def tracked_get(endpoint, *args, **kwargs):
+        counters["in_flight"] += 1
+        counters["peak"] = max(counters["peak"], counters["in_flight"])
+        try:
+            await asyncio.sleep((delays or {}).get(endpoint, 0))
+            return await get(endpoint, *args, **kwargs)
+        except asyncio.CancelledError:
+            counters["cancelled"] += 1
+            raise
+        finally:
+            counters["in_flight"] -= 1
+
+    client.get = tracked_get
+    return counters
+
+
+@pytest.mark.unit
+class TestAsyncPokemonClient:
+    """Test class for AsyncPokemonAPIClient against the local stand-in."""
+
+    def test_resource_methods(self):
+        """Lookups by id, by name and the listing return the served resources."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=30)) as server:
+            async def run():
+                async with AsyncPokemonAPIClient.open(base_url=server.base_url) as client:
+                    return await client.get_pokemon_by_id(25), await client.get_pokemon_by_name("pikachu"), await client.list_pokemon(limit=3, offset=1)
+
+            by_id, by_name, listing = run_async(run())
+
+        assert by_id == by_name and by_id["name"] == "pikachu"
+        assert [entry["name"] for entry in listing["results"]] == ["pokemon-2", "pokemon-3", "pokemon-4"]
+
+    def test_get_many_keeps_input_order(self):
+        """Results line up with the endpoints even when responses finish out of order."""
+        endpoints = [f"/pokemon/{i}" for i in (5, 3, 1, 4, 2)]
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=FaultProfile(latency="uniform:1:30", seed=7)) as server:
+            async def run():
+                async with AsyncPokemonAPIClient.open(base_url=server.base_url) as client:
+                    return await client.get_many(endpoints)
+
+            results = run_async(run())
+
+        assert [result["id"] for result in results] == [5, 3, 1, 4, 2]
+
+    def test_get_many_bounds_concurrency(self):
+        """No more than `concurrency` requests are in flight at once."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=9), faults=FaultProfile(latency="fixed:20")) as server:
+            async def run():
+                async with AsyncPokemonAPIClient.open(base_url=server.base_url, concurrency=8) as client:
+                    counters = track_in_flight(client)
+                    await client.get_many([f"/pokemon/{i}" for i in range(1, 10)], concurrency=3)
+                    return counters
+
+            counters = run_async(run())
+
+        assert counters["peak"] == 3
+        assert server.stats.statuses == {200: 9}
+
+    def test_get_many_error_cancels_the_rest(self):
+        """The first failure is raised after the other requests were cancelled."""
+        delays = {f"/pokemon/{i}": 5.0 for i in range(1, 4)}
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5)) as server:
+            async def run():
+                async with AsyncPokemonAPIClient.open(base_url=server.base_url) as client:
+                    counters = track_in_flight(client, delays)
+                    with pytest.raises(HTTPError, match="404"):
+                        await client.get_many(["/pokemon/1", "/pokemon/999", "/pokemon/2", "/pokemon/3"], concurrency=4)
+                    return dict(counters)
+
+            counters = run_async(run())
+
+        assert (counters["in_flight"], counters["cancelled"]) == (0, 3)
+        assert server.stats.statuses == {404: 1}
+
+    def test_get_many_return_exceptions(self):
+        """With return_exceptions the failure takes its endpoint's slot and the rest complete."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5)) as server:
+            async def run():
+                async with AsyncPokemonAPIClient.open(base_url=server.base_url) as client:
+                    return await client.get_many(["/pokemon/1", "/pokemon/999", "/pokemon/2"], return_exceptions=True)
+
+            first, missing, second = run_async(run())
+
+        assert (first["id"], second["id"]) == (1, 2)
+        assert isinstance(missing, HTTPError) and missing.status == 404
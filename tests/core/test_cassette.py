@@ -0,0 +1,82 @@
+"""
+Tests for record/replay cassettes.
+"""
+
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.cassette import Cassette, CassetteMissError, RecordedResponse
+from src.core.resilience import Resilience, RetryPolicy
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+def _response(body: bytes) -> RecordedResponse:
+    """Response as the clients read it, for recording without a server."""
+    return RecordedResponse(200, "http://api.test/api/v2/pokemon/1", {"content-type": "application/json"}, body)
+
+
+@pytest.mark.unit
+class TestCassette:
+    """Test class for recording, saving and replaying API traffic."""
+
+    def test_record_and_replay_round_trip(self, stub_api_request_context, tmp_path):
+        """Responses recorded against one server replay offline against another host."""
+        path = tmp_path / "pokeapi"
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5)) as server:
+            recorder = BaseAPIClient(stub_api_request_context, base_url=server.base_url, cassette=Cassette(path, "record"))
+            recorded = recorder.get("/pokemon/1")
+            listing = recorder.get("/pokemon", params={"limit": 2, "offset": 0})
+            recorder.cassette.save()
+
+        cassette = Cassette(path, "replay")
+        player = BaseAPIClient(None, base_url="https://pokeapi.co/api/v2", cassette=cassette)
+
+        assert len(cassette) == 2
+        assert player.get("/pokemon/1/") == recorded
+        assert player.get("/pokemon?offset=0&limit=2") == listing
+        assert cassette.replayed == 2
+
+    def test_retried_errors_are_replaced_by_the_final_response(self, stub_api_request_context, tmp_path):
+        """A 5xx that a retry turned into a 200 is not what the cassette replays."""
+        path = tmp_path / "pokeapi"
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=FaultProfile(error_rate=0.5, seed=3)) as server:
+            policy = Resilience(RetryPolicy(max_attempts=6), sleep=lambda seconds: None)
+            recorder = BaseAPIClient(stub_api_request_context, base_url=server.base_url, cassette=Cassette(path, "record"), resilience=policy)
+            recorded = [recorder.get(f"/pokemon/{i}") for i in range(1, 6)]
+            recorder.cassette.save()
+
+        assert policy.stats.retries > 0
+        player = BaseAPIClient(None, base_url=server.base_url, cassette=Cassette(path, "replay"))
+        assert [player.get(f"/pokemon/{i}") for i in range(1, 6)] == recorded
+
+    def test_replay_miss(self, tmp_path):
+        """A request that was never recorded fails instead of reaching the network."""
+        path = tmp_path / "pokeapi"
+        recorder = Cassette(path, "record")
+        recorder.record("GET /pokemon/1", _response(b'{"id":1}'))
+        recorder.save()
+
+        player = BaseAPIClient(None, base_url="http://api.test/api/v2", cassette=Cassette(path, "replay"))
+
+        assert player.get("/pokemon/1") == {"id": 1}
+        with pytest.raises(CassetteMissError):
+            player.get("/pokemon/2")
+
+    def test_empty_cassette_is_not_saved(self, tmp_path):
+        """Saving a cassette that recorded nothing keeps the file written by another process."""
+        path = tmp_path / "pokeapi"
+        recorder = Cassette(path, "record")
+        recorder.record("GET /pokemon/1", _response(b"{}"))
+        recorder.save()
+
+        Cassette(path, "record").save()
+
+        assert len(Cassette(path, "replay")) == 1
+
+    def test_keys_ignore_host_and_api_root(self):
+        """Keys hold the canonical path and query below the base URL."""
+        key = Cassette.make_key("get", "http://127.0.0.1:50123/api/v2/pokemon/25/", {"b": 2, "a": 1}, base_url="http://127.0.0.1:50123/api/v2")
+
+        assert key == "GET /pokemon/25?a=1&b=2"
+        assert Cassette.make_key("GET", "https://pokeapi.co/api/v2/pokemon/25", {"a": 1, "b": 2}, base_url="https://pokeapi.co/api/v2") == key
+
@@ -0,0 +1,81 @@
+"""
+Tests for the session client pool and context warm-up.
+"""
+
+import threading
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.cassette import Cassette
+from src.core.client_pool import ClientPool, WarmupReport
+from src.core.context_pool import APIRequestContextPool
+
+
+@pytest.mark.unit
+class TestBroadcast:
+    """Test class for running a task on every pool worker."""
+
+    def test_runs_once_per_worker(self):
+        """Each worker runs the task exactly once."""
+        with APIRequestContextPool(3) as pool:
+            results = pool.broadcast(lambda context: threading.current_thread().name)
+
+        assert all(result.ok for result in results)
+        assert sorted(result.key for result in results) == ["api-context-0", "api-context-1", "api-context-2"]
+        assert all(result.key == result.data for result in results)
+
+
+@pytest.mark.unit
+class TestClientPool:
+    """Test class for ClientPool warm-up and reuse."""
+
+    def test_warm_up_leaves_pool_workers_lazy(self, stub_api_request_context, stub_server):
+        """By default only the session context is warmed; the pool workers are not started."""
+        context_pool = APIRequestContextPool(2)
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, context_pool=context_pool)
+
+        report = ClientPool(client, context_pool).warm_up()
+
+        assert [c.context for c in report.contexts] == ["session"]
+        assert report.pool_start == 0.0
+        assert not context_pool._threads
+        context_pool.close()
+
+    def test_warm_up_every_context(self, stub_api_request_context, stub_server):
+        """With warm_pool the session context and every pool worker are warmed without feeding observers."""
+        timings = []
+        with APIRequestContextPool(2) as context_pool:
+            client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, context_pool=context_pool, observers=[timings.append])
+            pool = ClientPool(client, context_pool, name="gw1")
+
+            report = pool.warm_up(warm_pool=True)
+
+        assert sorted(c.context for c in report.contexts) == ["api-context-0", "api-context-1", "session"]
+        assert report.errors == [] and timings == []
+        assert all(c.cold > 0 and c.warm > 0 for c in report.contexts)
+        assert report.elapsed >= report.pool_start > 0
+
+    def test_failures_are_reported(self, stub_api_request_context):
+        """An unreachable API is recorded in the report instead of failing the session."""
+        client = BaseAPIClient(stub_api_request_context, base_url="http://127.0.0.1:9/api/v2")
+
+        report = ClientPool(client).warm_up()
+
+        assert report.contexts == [] and len(report.errors) == 1
+
+    def test_cassette_clients_are_not_warmed(self, tmp_path):
+        """Clients using a cassette are left alone (replay never touches the network)."""
+        client = BaseAPIClient(None, base_url="http://api.test/api/v2", cassette=Cassette(tmp_path / "c", "record"))
+
+        assert ClientPool(client).warm_up().contexts == []
+
+    def test_reuse_and_report_round_trip(self, stub_api_request_context, stub_server):
+        """acquire() hands out the one client; reports survive the xdist round trip."""
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url)
+        pool = ClientPool(client, name="gw0")
+
+        assert pool.acquire() is pool.acquire() is client
+        report = pool.warm_up()
+
+        restored = WarmupReport.from_dict(report.to_dict())
+        assert restored == report and restored.reuses == 2
+        assert restored.cold_p50 == report.contexts[0].cold
@@ -0,0 +1,52 @@
+"""
+Tests for pluggable JSON codecs and the bytes-to-model fast path.
+"""
+
+from typing import List
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.codecs import JSONCodec, PydanticJSONCodec, available_codecs, get_codec, register_codec, type_adapter
+from src.core.response_cache import ResponseCache
+from src.models.base import NamedAPIResource
+from src.models.pokemon import LazyPokemon, Pokemon
+
+
+BODY = b'[{"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon/25/"}]'
+
+
+@pytest.mark.unit
+class TestCodecs:
+    """Test class for codec selection and model decoding."""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_codecs_agree(self, name):
+        """Every installed codec decodes and validates to the same result."""
+        codec = get_codec(name)
+
+        assert codec.loads(BODY) == JSONCodec().loads(BODY)
+        assert codec.validate(BODY, List[NamedAPIResource])[0].name == "pikachu"
+
+    def test_unknown_codec_and_registration(self):
+        """Unknown names raise ValueError; registered factories become selectable."""
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("does-not-exist")
+
+        register_codec("test-pydantic", PydanticJSONCodec)
+        assert isinstance(get_codec("test-pydantic"), PydanticJSONCodec)
+
+    def test_type_adapters_are_cached(self):
+        """Adapters are compiled once per type."""
+        assert type_adapter(Pokemon) is type_adapter(Pokemon)
+
+    def test_get_model_matches_dict_path(self, stub_api_request_context, stub_server):
+        """get_model returns the same model as get() + model_validate, and shares the cache."""
+        cache = ResponseCache()
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, cache=cache)
+
+        pokemon = client.get_model("/pokemon/25", Pokemon)
+        data = client.get("/pokemon/25")
+
+        assert pokemon == Pokemon.model_validate(data)
+        assert cache.stats.hits == 1
+        assert cache.get(cache.make_key(f"{stub_server.base_url}/pokemon/25")).data is data
+        assert client.get_model("/pokemon/25", LazyPokemon).name == "pikachu"
@@ -0,0 +1,65 @@
+"""
+Tests for the per-thread APIRequestContext pool and threaded bulk reads.
+"""
+
+import threading
+import time
+import pytest
+from src.api.pokemon_client import PokemonAPIClient
+from src.core.context_pool import APIRequestContextPool
+from src.core.resilience import HTTPError
+
+
+@pytest.mark.unit
+class TestAPIRequestContextPool:
+    """Test class for map(), error capture and shutdown."""
+
+    def test_map_keeps_input_order(self):
+        """Results follow the items even when later items finish first."""
+        with APIRequestContextPool(3) as pool:
+            results = pool.map(lambda context, delay: time.sleep(delay) or delay, [0.06, 0.03, 0.0, 0.05, 0.01])
+
+        assert [result.key for result in results] == [0.06, 0.03, 0.0, 0.05, 0.01]
+        assert [result.data for result in results] == [result.key for result in results]
+        assert all(result.ok for result in results)
+
+    def test_failures_are_captured_per_item(self):
+        """A failing item carries its error; the other items still succeed."""
+        def invert(context, number):
+            return 1 / number
+
+        with APIRequestContextPool(2) as pool:
+            results = pool.map(invert, [1, 0, 4])
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ZeroDivisionError)
+        assert (results[0].data, results[2].data) == (1.0, 0.25)
+
+    def test_close_stops_workers(self):
+        """Closing the pool joins every worker thread and refuses further work."""
+        pool = APIRequestContextPool(3)
+        workers = [result.data for result in pool.broadcast(lambda context: threading.current_thread())]
+        assert len(set(workers)) == 3 and all(worker.is_alive() for worker in workers)
+
+        pool.close()
+
+        assert not any(worker.is_alive() for worker in workers)
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda context: None)
+
+
+@pytest.mark.unit
+class TestGetPokemonMany:
+    """Test class for PokemonAPIClient.get_pokemon_many."""
+
+    def test_results_in_input_order_with_item_errors(self, stub_api_request_context, stub_server):
+        """Every identifier gets its own result; an unknown one fails alone."""
+        client = PokemonAPIClient(stub_api_request_context, base_url=stub_server.base_url)
+        before = set(threading.enumerate())
+
+        results = client.get_pokemon_many([25, "bulbasaur", 999999, 6], workers=2)
+
+        assert [result.key for result in results] == [25, "bulbasaur", 999999, 6]
+        assert [result.data["name"] for result in results if result.ok] == ["pikachu", "bulbasaur", "charizard"]
+        assert isinstance(results[2].error, HTTPError) and results[2].error.status == 404
+        assert not [thread for thread in set(threading.enumerate()) - before if thread.name.startswith("api-context-")]
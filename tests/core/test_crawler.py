@@ -0,0 +1,77 @@
+"""
+Tests for the breadth-first API crawler.
+"""
+
+import gzip
+import json
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.crawler import APICrawler, JsonlSink, extract_api_links
+from src.server.snapshot import Snapshot
+from src.server.stub_server import run_stub_server
+from src.utils.urls import canonicalize_url, split_api_url
+
+
+@pytest.fixture(scope="module")
+def small_stub():
+    """Stub server over a 30-Pokémon synthetic snapshot."""
+    snapshot = Snapshot.synthetic(pokemon_count=30)
+    with run_stub_server(snapshot) as server:
+        yield server, snapshot
+
+
+def _expected_keys(server, snapshot):
+    return {canonicalize_url(f"{server.base_url}/{path}") for path in snapshot.resources}
+
+
+@pytest.mark.unit
+class TestAPICrawler:
+    """Test class for APICrawler against a small stub server."""
+
+    def test_full_crawl_visits_every_resource_once(self, small_stub, stub_api_request_context, api_context_pool):
+        """Every snapshot resource is reached from the API root and fetched exactly once."""
+        server, snapshot = small_stub
+        client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, context_pool=api_context_pool)
+        fetched = []
+
+        stats = APICrawler(client, sink=lambda url, data: fetched.append(url)).crawl()
+
+        assert not stats.errors
+        assert len(fetched) == len(set(fetched)) == stats.fetched
+        assert _expected_keys(server, snapshot) <= set(fetched)
+        assert not any("sprites" in url for url in fetched)
+
+    def test_checkpoint_resume_completes_crawl(self, small_stub, stub_api_request_context, api_context_pool, tmp_path):
+        """An interrupted crawl resumes from its checkpoint without refetching finished resources."""
+        server, snapshot = small_stub
+        client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, context_pool=api_context_pool)
+        checkpoint = tmp_path / "crawl.json"
+        output = tmp_path / "crawl.jsonl.gz"
+
+        with JsonlSink(output) as sink:
+            partial = APICrawler(client, sink=sink, checkpoint_path=checkpoint, max_resources=50).crawl()
+        assert partial.fetched == 50
+        assert json.loads(checkpoint.read_text())["frontier"]
+
+        with JsonlSink(output) as sink:
+            final = APICrawler(client, sink=sink, checkpoint_path=checkpoint, checkpoint_every=25).crawl()
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            urls = [json.loads(line)["url"] for line in f]
+        assert len(urls) == len(set(urls)) == final.fetched
+        assert _expected_keys(server, snapshot) <= set(urls)
+        assert not json.loads(checkpoint.read_text())["frontier"]
+
+    def test_family_filter_and_link_extraction(self, small_stub, stub_api_request_context, api_context_pool):
+        """Restricting families keeps the crawl inside them; links are found in any string field."""
+        server, _ = small_stub
+        client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, context_pool=api_context_pool)
+        fetched = []
+
+        APICrawler(client, sink=lambda url, data: fetched.append(url), families=["type"]).crawl()
+
+        families = {split_api_url(url, server.base_url)[0].strip("/").split("/")[0] for url in fetched}
+        assert families == {"", "type"}
+        assert list(extract_api_links({"next": "http://x/api/v2/pokemon?offset=20", "count": 1, "results": [{"url": "https://pokeapi.co/api/v2/type/1/"}]})) == [
+            "http://x/api/v2/pokemon?offset=20", "https://pokeapi.co/api/v2/type/1/",
+        ]
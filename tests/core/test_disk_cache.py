@@ -0,0 +1,47 @@
+"""
+Tests for the persistent on-disk HTTP cache.
+"""
+
+import pytest
+from src.core.disk_cache import DiskHTTPCache
+
+
+@pytest.mark.unit
+class TestDiskHTTPCache:
+    """Test class for DiskHTTPCache."""
+
+    def test_store_and_conditional_headers(self, tmp_path):
+        """Stored responses carry their validators as conditional request headers."""
+        cache = DiskHTTPCache(tmp_path)
+        cache.store("https://pokeapi.co/api/v2/pokemon/25", 200, b'{"id": 25}', {"etag": 'W/"abc"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+        stored = cache.lookup("https://pokeapi.co/api/v2/pokemon/25")
+
+        assert stored.body == b'{"id": 25}'
+        assert stored.conditional_headers() == {"If-None-Match": 'W/"abc"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        cache.close()
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        """A response that cannot be revalidated is not persisted."""
+        cache = DiskHTTPCache(tmp_path)
+
+        assert cache.store("k", 200, b"{}", {}) is False
+        assert cache.lookup("k") is None
+        cache.close()
+
+    def test_size_based_eviction(self, tmp_path):
+        """Least recently used responses are evicted to respect max_bytes."""
+        cache = DiskHTTPCache(tmp_path, max_bytes=10)
+        cache.store("a", 200, b"123456", {"etag": '"a"'})
+        cache.store("b", 200, b"123456", {"etag": '"b"'})
+
+        assert cache.lookup("a") is None
+        assert cache.lookup("b") is not None
+        assert cache.stats.evictions == 1
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new cache instance sees responses stored by a previous session."""
+        DiskHTTPCache(tmp_path).store("k", 200, b"{}", {"etag": '"v1"'})
+
+        assert DiskHTTPCache(tmp_path).lookup("k").etag == '"v1"'
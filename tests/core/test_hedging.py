@@ -0,0 +1,172 @@
+"""
+Tests for hedged requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.context_pool import APIRequestContextPool
+from src.core.hedging import HedgePolicy
+from src.core.metrics import HEDGES, MetricsObserver, MetricsRegistry
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+class ExecutorPool:
+    """Stand-in for APIRequestContextPool running fetch(None) on plain threads."""
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(4)
+
+    def submit(self, func, *args):
+        return self.executor.submit(func, None, *args)
+
+
+def warmed(policy: HedgePolicy, latency: float = 0.01) -> HedgePolicy:
+    for _ in range(policy.min_samples):
+        policy.observe(latency)
+    return policy
+
+
+def slow_then_fast(slow: float = 0.5):
+    """fetch() whose first call is slow and later calls answer immediately."""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(context):
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        if first:
+            time.sleep(slow)
+            return "primary"
+        return "hedge"
+    return fetch
+
+
+@pytest.mark.unit
+class TestHedgePolicy:
+    """Test class for hedge timing, budget and outcomes."""
+
+    def test_delay_tracks_percentile(self):
+        """The hedge delay is the configured percentile of recent latencies."""
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0)
+        for value in range(1, 10):
+            policy.observe(value / 1000)
+        assert policy.hedge_delay() is None
+
+        policy.observe(0.010)
+        assert policy.hedge_delay() == pytest.approx(0.010)
+
+    def test_slow_request_is_hedged(self):
+        """A request slower than the hedge delay is duplicated and the hedge wins."""
+        policy = warmed(HedgePolicy(max_hedge_ratio=1.0, min_samples=5))
+
+        started = time.perf_counter()
+        response, hedged, won = policy.run(ExecutorPool(), slow_then_fast())
+
+        assert (response, hedged, won) == ("hedge", True, True)
+        assert time.perf_counter() - started < 0.4
+        assert policy.stats.hedged == policy.stats.hedge_wins == 1
+
+    def test_fast_request_is_not_hedged(self):
+        """Requests answering within the delay are not duplicated."""
+        policy = warmed(HedgePolicy(min_samples=5), latency=0.5)
+
+        assert policy.run(ExecutorPool(), lambda context: "ok") == ("ok", False, False)
+        assert policy.stats.hedged == 0
+
+    def test_hedge_rate_is_capped(self):
+        """Without budget the slow request is awaited instead of hedged."""
+        policy = warmed(HedgePolicy(max_hedge_ratio=0.0, min_samples=5, min_delay=0.001))
+        policy.budget.tokens = 0
+
+        assert policy.run(ExecutorPool(), slow_then_fast(0.05)) == ("primary", False, False)
+        assert policy.stats.capped == 1 and policy.stats.hedged == 0
+
+    def test_async_hedge_cancels_loser(self):
+        """The async variant cancels the slower request."""
+        policy = warmed(HedgePolicy(max_hedge_ratio=1.0, min_samples=5))
+        cancelled = []
+
+        async def fetch():
+            first = not hasattr(fetch, "called")
+            fetch.called = True
+            try:
+                await asyncio.sleep(1.0 if first else 0)
+            except asyncio.CancelledError:
+                cancelled.append(first)
+                raise
+            return "primary" if first else "hedge"
+
+        async def run():
+            result = await policy.run_async(fetch)
+            await asyncio.sleep(0)
+            return result
+
+        # Sync Playwright may own this thread's event loop, so run on a fresh thread
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(asyncio.run, run()).result() == ("hedge", True, True)
+        assert cancelled == [True]
+
+    def test_cancelled_caller_cancels_every_request(self):
+        """Cancelling the caller while both requests are in flight cancels both of them."""
+        policy = warmed(HedgePolicy(max_hedge_ratio=1.0, min_samples=5))
+        cancelled = []
+
+        async def fetch():
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append(None)
+                raise
+
+        async def run():
+            caller = asyncio.ensure_future(policy.run_async(fetch))
+            await asyncio.sleep(0.1)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.sleep(0)
+            return len(cancelled)
+
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(asyncio.run, run()).result() == 2
+        assert policy.stats.hedged == 1
+
+
+@pytest.mark.unit
+class TestClientHedging:
+    """Test class for hedging in BaseAPIClient."""
+
+    def test_hedges_against_slow_tail(self, stub_api_request_context):
+        """Against a heavy-tailed stub, hedges fire within the cap and are reported."""
+        faults = FaultProfile(latency="lognormal:2:1.2", seed=11)
+        with run_stub_server(Snapshot.synthetic(pokemon_count=20), faults=faults) as server, APIRequestContextPool(3) as pool:
+            registry = MetricsRegistry()
+            policy = HedgePolicy(percentile=90, max_hedge_ratio=0.2, min_samples=20)
+            client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, context_pool=pool, hedging=policy, observers=[MetricsObserver(registry)])
+
+            for i in range(150):
+                assert client.get(f"/pokemon/{i % 20 + 1}")["id"] == i % 20 + 1
+
+        stats = policy.stats
+        assert stats.requests == 150
+        assert 0 < stats.hedged <= 0.2 * stats.requests + 1
+        won = registry.counter(HEDGES, method="GET", endpoint="/pokemon/{id}", outcome="won").value
+        lost = registry.counter(HEDGES, method="GET", endpoint="/pokemon/{id}", outcome="lost").value
+        assert (won, won + lost) == (stats.hedge_wins, stats.hedged)
+
+    def test_pool_workers_do_not_hedge(self, stub_api_request_context, stub_server):
+        """Requests made on the pool's own workers bypass hedging (no self-deadlock)."""
+        with APIRequestContextPool(1) as pool:
+            policy = warmed(HedgePolicy(min_samples=1))
+            client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, context_pool=pool, hedging=policy)
+
+            result = pool.submit(lambda context: client.with_context(context).get("/pokemon/1")).result(timeout=30)
+
+        assert result["id"] == 1
+        assert policy.stats.requests == 0
@@ -0,0 +1,75 @@
+"""
+Tests for the open-loop load generator.
+"""
+
+import random
+import pytest
+from src.api.pokemon_client import PokemonAPIClient
+from src.core.load_generator import OPERATIONS, LoadGenerator, arrival_offsets, format_report, parse_mix
+from src.server.snapshot import Snapshot
+from src.server.stub_server import run_stub_server
+
+
+@pytest.fixture(scope="module")
+def load_stub():
+    """Small stub server for short load runs."""
+    with run_stub_server(Snapshot.synthetic(pokemon_count=30)) as server:
+        yield server
+
+
+@pytest.mark.unit
+class TestLoadSchedule:
+    """Test class for operation mixes and arrival schedules."""
+
+    def test_parse_mix(self):
+        """Weights are parsed; unknown operations and bad weights raise ValueError."""
+        assert parse_mix("by-id=6, by-name=3,list") == {"by-id": 6.0, "by-name": 3.0, "list": 1.0}
+
+        for spec in ("teleport=1", "by-id=fast", "by-id=0", ""):
+            with pytest.raises(ValueError):
+                parse_mix(spec)
+
+    def test_constant_arrivals(self):
+        """Constant arrivals are evenly spaced at the target rate."""
+        offsets = arrival_offsets(50, 2)
+
+        assert len(offsets) == 100
+        assert offsets[1] - offsets[0] == pytest.approx(0.02)
+
+    def test_poisson_arrivals(self):
+        """Poisson arrivals average the target rate and stay within the duration."""
+        offsets = arrival_offsets(200, 50, "poisson", random.Random(3))
+
+        assert len(offsets) == pytest.approx(10000, rel=0.05)
+        assert offsets == sorted(offsets) and offsets[-1] < 50
+
+        with pytest.raises(ValueError, match="Unknown arrival"):
+            arrival_offsets(10, 1, "bursty")
+
+
+@pytest.mark.unit
+class TestLoadGenerator:
+    """Test class for load runs against the local stub server."""
+
+    def test_run_reports_windows(self, stub_api_request_context, load_stub):
+        """Every scheduled request completes and is reported in its window."""
+        client = PokemonAPIClient(stub_api_request_context, base_url=load_stub.base_url)
+        report = LoadGenerator(client, rps=40, duration=1.0, concurrency=2, window=0.5, pool_size=30, seed=1).run()
+
+        assert report.scheduled == report.completed == 40
+        assert report.errors == 0
+        assert [window.start for window in report.windows] == [0.0, 0.5]
+        assert sum(window.scheduled for window in report.windows) == 40
+        assert 0 < report.p50_ms <= report.p99_ms <= report.max_ms
+        assert "p99 ms" in format_report(report)
+
+    def test_error_rate_series(self, stub_api_request_context, load_stub, monkeypatch):
+        """Failed requests are counted per window and grouped by HTTP status."""
+        monkeypatch.setitem(OPERATIONS, "missing", lambda client, pokemon, rng: client.get_pokemon_by_id(999999))
+        client = PokemonAPIClient(stub_api_request_context, base_url=load_stub.base_url)
+        report = LoadGenerator(client, rps=40, duration=0.5, mix={"by-id": 1, "missing": 1}, concurrency=2, pool_size=30, seed=2).run()
+
+        assert 0 < report.errors < report.completed
+        assert report.error_types == {"HTTP 404": report.errors}
+        assert report.windows[0].error_rate == pytest.approx(report.errors / report.completed)
+        assert report.to_dict()["windows"][0]["error_rate"] == report.windows[0].error_rate
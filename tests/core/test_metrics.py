@@ -0,0 +1,110 @@
+"""
+Tests for request timing observers, latency histograms and the OpenMetrics export.
+"""
+
+import random
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.codecs import get_codec
+from src.core.metrics import REQUEST_DURATION, REQUESTS, LatencyHistogram, MetricsObserver, MetricsRegistry
+from src.core.response_cache import ResponseCache
+from src.models.pokemon import Pokemon
+from src.utils.urls import endpoint_template
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Test class for the HDR-style histogram."""
+
+    def test_percentiles_within_one_percent(self):
+        """Percentiles match exact order statistics within the histogram's relative error."""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-4, 1) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 90, 95, 99, 99.9):
+            exact = values[int(percent / 100 * len(values)) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.01)
+        assert histogram.count == len(values)
+        assert histogram.percentile(100) == values[-1]
+
+    def test_empty_histogram(self):
+        """An empty histogram reports zero."""
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test class for the registry and its export."""
+
+    def test_openmetrics_export(self):
+        """Histograms export cumulative buckets, count and sum; counters a _total sample."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(REQUEST_DURATION, method="GET", endpoint='/pokemon/{id}', phase="total")
+        for value in (0.002, 0.02, 0.2):
+            histogram.record(value)
+        registry.counter(REQUESTS, method="GET", endpoint='/pokemon/{id}', status="200", source="network").inc(3)
+
+        text = registry.to_openmetrics()
+        lines = text.splitlines()
+
+        assert f"# TYPE {REQUEST_DURATION} histogram" in lines
+        assert f'{REQUEST_DURATION}_bucket{{endpoint="/pokemon/{{id}}",method="GET",phase="total",le="0.01"}} 1' in lines
+        assert f'{REQUEST_DURATION}_bucket{{endpoint="/pokemon/{{id}}",method="GET",phase="total",le="+Inf"}} 3' in lines
+        assert f'{REQUEST_DURATION}_count{{endpoint="/pokemon/{{id}}",method="GET",phase="total"}} 3' in lines
+        assert f'{REQUESTS}_total{{endpoint="/pokemon/{{id}}",method="GET",source="network",status="200"}} 3.0' in lines
+        assert text.endswith("# EOF\n")
+
+    def test_endpoint_template(self):
+        """Identifiers are collapsed so histograms are per endpoint, not per resource."""
+        assert endpoint_template("/pokemon/25") == "/pokemon/{id}"
+        assert endpoint_template("/pokemon/pikachu/") == "/pokemon/{name}"
+        assert endpoint_template("/pokemon/25/encounters") == "/pokemon/{id}/encounters"
+        assert endpoint_template("/pokemon") == "/pokemon"
+
+
+@pytest.mark.unit
+class TestRequestObservers:
+    """Test class for client timing instrumentation."""
+
+    def test_phases_recorded(self, stub_api_request_context, stub_server):
+        """Network requests report send/read/decode/validate phases and a consistent total."""
+        timings = []
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, codec=get_codec("pydantic"), observers=[timings.append])
+
+        client.get_model("/pokemon/25", Pokemon)
+        timing = timings[-1]
+
+        assert timing.endpoint == "/pokemon/{id}"
+        assert timing.status == 200 and timing.source == "network" and timing.response_bytes > 0
+        assert None not in (timing.send, timing.read, timing.decode, timing.validate)
+        assert timing.total >= timing.send + timing.read + timing.decode + timing.validate
+
+        client.with_context(stub_api_request_context).get("/pokemon/pikachu")
+        assert timings[-1].endpoint == "/pokemon/{name}" and timings[-1].validate is None
+
+    def test_cache_hits_and_errors(self, stub_api_request_context, stub_server):
+        """Cache hits are reported as such, failures carry the error and feed the registry."""
+        registry = MetricsRegistry()
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, cache=ResponseCache(), observers=[MetricsObserver(registry)])
+
+        client.get("/pokemon/1")
+        client.get("/pokemon/1")
+        with pytest.raises(Exception, match="HTTP 404"):
+            client.get("/pokemon/999999")
+
+        assert registry.counter(REQUESTS, method="GET", endpoint="/pokemon/{id}", status="200", source="network").value == 1
+        assert registry.counter(REQUESTS, method="GET", endpoint="/pokemon/{id}", status="200", source="memory").value == 1
+        assert registry.counter(REQUESTS, method="GET", endpoint="/pokemon/{id}", status="404", source="network").value == 1
+        [row] = registry.latency_summary()
+        assert row.endpoint == "/pokemon/{id}" and row.count == 3
+
+    def test_observer_errors_are_ignored(self, stub_api_request_context, stub_server):
+        """A failing observer does not fail the request."""
+        def broken(timing):
+            raise RuntimeError("observer bug")
+
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url, observers=[broken])
+        assert client.get("/pokemon/1")["id"] == 1
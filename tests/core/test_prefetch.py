@@ -0,0 +1,60 @@
+"""
+Tests for collection-time endpoint prefetching.
+"""
+
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.context_pool import APIRequestContextPool
+from src.core.prefetch import PrefetchPlan, prefetch
+from src.core.response_cache import ResponseCache
+from src.server.snapshot import Snapshot
+from src.server.stub_server import run_stub_server
+
+
+@pytest.mark.unit
+class TestPrefetchPlan:
+    """Test class for expanding endpoint templates."""
+
+    def test_expands_and_deduplicates(self):
+        """Templates are formatted with test parameters; repeated endpoints are kept once."""
+        plan = PrefetchPlan()
+        plan.add(["/pokemon/{pokemon_id}"], {"pokemon_id": 25, "expected_name": "pikachu"})
+        plan.add(["/pokemon/{pokemon_id}"], {"pokemon_id": 25})
+        plan.add(["/pokemon?limit={limit}&offset={offset}"], {"limit": 5, "offset": 0})
+        plan.add([], {})
+
+        assert plan.endpoints == {"/pokemon/25", "/pokemon?limit=5&offset=0"}
+        assert (plan.covered, plan.items, plan.coverage) == (3, 4, 0.75)
+
+    def test_unknown_parameter(self):
+        """A template naming a missing parameter raises KeyError."""
+        with pytest.raises(KeyError):
+            PrefetchPlan().add(["/pokemon/{pokemon_id}"], {"pokemon_name": "pikachu"})
+
+
+@pytest.mark.unit
+class TestPrefetch:
+    """Test class for filling the response cache ahead of the tests."""
+
+    def test_tests_run_from_memory(self, stub_api_request_context):
+        """After a prefetch, the same reads are served without touching the server."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5)) as server, APIRequestContextPool(2) as pool:
+            client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, context_pool=pool, cache=ResponseCache(cache_not_found=True))
+
+            report = prefetch(client, ["/pokemon/1", "/pokemon/2", "/pokemon/2", "/pokemon/999", "/pokemon?limit=2&offset=0"])
+            sent = sum(server.stats.statuses.values())
+
+            assert client.get("/pokemon/1")["id"] == 1
+            assert len(client.get("/pokemon", params={"limit": 2, "offset": 0})["results"]) == 2
+            with pytest.raises(Exception, match="404"):
+                client.get("/pokemon/999")
+
+        assert (report.endpoints, report.fetched, report.not_found, report.failed) == (4, 3, 1, [])
+        assert sum(server.stats.statuses.values()) == sent == 4
+
+    def test_requires_response_cache(self, stub_api_request_context, stub_server):
+        """Prefetching into a client without a cache is refused."""
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url)
+
+        with pytest.raises(ValueError):
+            prefetch(client, ["/pokemon/1"])
@@ -0,0 +1,139 @@
+"""
+Tests for the host-wide shared rate limiter.
+"""
+
+import multiprocessing
+import stat
+import time
+import pytest
+from src.config.settings import settings
+from src.core.base_api_client import BaseAPIClient
+from src.core.rate_limiter import GLOBAL, RateLimit, SharedRateLimiter, endpoint_family, parse_rate_limits
+from src.core.resilience import Resilience, RetryPolicy
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+def acquire_many(path: str, count: int) -> None:
+    """Worker process body: take `count` slots from the shared bucket."""
+    limiter = SharedRateLimiter({GLOBAL: RateLimit(50, 1)}, path=path)
+    for _ in range(count):
+        limiter.acquire()
+
+
+@pytest.mark.unit
+class TestRateLimits:
+    """Test class for limit parsing and bucket arithmetic."""
+
+    def test_parse_rate_limits(self):
+        """Entries are family=rate[:burst]; malformed entries raise ValueError."""
+        assert parse_rate_limits("*=20:10, pokemon=5") == {GLOBAL: RateLimit(20, 10), "pokemon": RateLimit(5, 1)}
+        for spec in ("pokemon=fast", "pokemon=0", "pokemon=5:0"):
+            with pytest.raises(ValueError):
+                parse_rate_limits(spec)
+
+    def test_endpoint_family(self):
+        """Families are the first path segment."""
+        assert endpoint_family("/pokemon/25/") == "pokemon"
+        assert endpoint_family("/berry?limit=5") == "berry"
+        assert endpoint_family("/") == ""
+
+    def test_burst_then_rate(self, tmp_path):
+        """A full bucket admits `burst` requests at once, then one per 1/rate seconds."""
+        now = [1000.0]
+        limiter = SharedRateLimiter({GLOBAL: RateLimit(10, 3)}, path=tmp_path / "state.json", clock=lambda: now[0], sleep=lambda seconds: None)
+
+        assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire() == pytest.approx(0.1)
+        assert limiter.acquire() == pytest.approx(0.2)
+
+        now[0] += 10
+        assert limiter.acquire() == 0.0
+        assert limiter.stats.delayed == 2 and limiter.stats.total_wait == pytest.approx(0.3)
+
+    def test_family_and_global_limits(self, tmp_path):
+        """Family limits apply to their family only; the global limit applies to all."""
+        now = [0.0]
+        limiter = SharedRateLimiter({GLOBAL: RateLimit(100, 100), "berry": RateLimit(1, 1)}, path=tmp_path / "state.json", clock=lambda: now[0], sleep=lambda seconds: None)
+
+        assert limiter.acquire("berry") == 0.0
+        assert limiter.acquire("berry") == pytest.approx(1.0)
+        assert limiter.acquire("pokemon") == 0.0
+        assert limiter.stats.by_family == {"berry": pytest.approx(1.0)}
+
+    def test_waiting_request_charges_other_buckets_at_send_time(self, tmp_path):
+        """A request held back by its family debits the global bucket when it is sent."""
+        now = [0.0]
+        limiter = SharedRateLimiter(
+            {GLOBAL: RateLimit(10, 1), "berry": RateLimit(1, 1)}, path=tmp_path / "state.json",
+            clock=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds),
+        )
+
+        limiter.acquire("berry")
+        assert limiter.acquire("berry") == pytest.approx(1.0)
+        # The second berry request went out at t=1, so the global bucket is busy until t=1.1
+        assert limiter.acquire("pokemon") == pytest.approx(0.1)
+
+    def test_state_is_shared_between_instances(self, tmp_path):
+        """Limiters on the same file draw from one budget."""
+        now = [0.0]
+        first = SharedRateLimiter({GLOBAL: RateLimit(10, 1)}, path=tmp_path / "state.json", clock=lambda: now[0], sleep=lambda seconds: None)
+        second = SharedRateLimiter({GLOBAL: RateLimit(10, 1)}, path=tmp_path / "state.json", clock=lambda: now[0], sleep=lambda seconds: None)
+
+        assert first.acquire() == 0.0
+        assert second.acquire() == pytest.approx(0.1)
+
+        second.reset()
+        assert first.acquire() == 0.0
+
+    def test_default_state_file_is_private(self, monkeypatch):
+        """Without a path each limiter gets its own owner-only file, removed on close."""
+        monkeypatch.setattr(settings, "rate_limit_file", None)
+        first, second = SharedRateLimiter({GLOBAL: RateLimit(10, 1)}), SharedRateLimiter({GLOBAL: RateLimit(10, 1)})
+        first.acquire()
+
+        assert first.path != second.path
+        assert stat.S_IMODE(first.path.stat().st_mode) == 0o600
+        for limiter in (first, second):
+            limiter.close()
+            assert not limiter.path.exists()
+
+    def test_processes_share_budget(self, tmp_path):
+        """Two processes together stay within the shared rate."""
+        path = str(tmp_path / "state.json")
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=acquire_many, args=(path, 10)) for _ in range(2)]
+
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+        elapsed = time.perf_counter() - started
+
+        assert all(process.exitcode == 0 for process in processes)
+        # 20 slots at 50/s with burst 1 span at least 19 intervals of 20ms
+        assert elapsed >= 0.38
+
+
+@pytest.mark.unit
+class TestClientRateLimiting:
+    """Test class for rate limiting in BaseAPIClient."""
+
+    def test_stays_under_server_throttle(self, stub_api_request_context, tmp_path):
+        """Limiting below the server's rate and burst avoids 429 responses entirely."""
+        faults = FaultProfile(rate_limit=40, burst=5)
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=faults) as server:
+            limiter = SharedRateLimiter({GLOBAL: RateLimit(30, 2)}, path=tmp_path / "state.json")
+            timings = []
+            client = BaseAPIClient(
+                stub_api_request_context, base_url=server.base_url, rate_limiter=limiter,
+                resilience=Resilience(RetryPolicy(max_attempts=1)), observers=[timings.append],
+            )
+
+            for i in range(30):
+                client.get(f"/pokemon/{i % 5 + 1}")
+
+        assert server.stats.statuses.get(429, 0) == 0
+        assert limiter.stats.delayed > 0
+        assert sum(timing.throttle for timing in timings) == pytest.approx(limiter.stats.total_wait)
@@ -0,0 +1,46 @@
+"""
+Tests for the concurrent NamedAPIResource reference resolver.
+"""
+
+import pytest
+from src.core.reference_resolver import collect_resource_urls, resolve_references
+from src.core.response_cache import ResponseCache
+from src.models.pokemon import Pokemon
+
+
+@pytest.mark.unit
+class TestReferenceResolver:
+    """Test class for ReferenceResolver against the local stub server."""
+
+    def test_collects_and_dedupes_pokemon_links(self, stub_pokemon_client):
+        """Every ability, type and move link of a Pokémon is resolved exactly once."""
+        pokemon = Pokemon(**stub_pokemon_client.get_pokemon_by_name("pikachu"))
+        base_url = stub_pokemon_client.base_url
+
+        result = resolve_references(pokemon, base_url=base_url, family_limits={"move": 4})
+
+        assert not result.errors
+        assert result.depth_reached == 1
+        assert len(result.resources) == len(set(result.resources))
+        assert {payload["name"] for payload in result.by_family("type").values()} == {t.type.name for t in pokemon.types}
+        assert {payload["name"] for payload in result.by_family("ability").values()} == {a.ability.name for a in pokemon.abilities}
+        assert len(result.by_family("move")) == len({m.move.url for m in pokemon.moves})
+        assert not any("sprites" in url for url in result.resources)
+
+    def test_depth_limit_follows_nested_links(self, stub_pokemon_client):
+        """A second level follows links found in the first level's payloads via the shared cache."""
+        pokemon = Pokemon(**stub_pokemon_client.get_pokemon_by_name("pikachu"))
+        cache = ResponseCache()
+
+        shallow = resolve_references(pokemon, base_url=stub_pokemon_client.base_url, max_depth=1, cache=cache)
+        deep = resolve_references(pokemon, base_url=stub_pokemon_client.base_url, max_depth=2, cache=cache)
+
+        assert deep.depth_reached == 2
+        assert set(shallow.resources) < set(deep.resources)
+        assert cache.stats.hits >= len(shallow.resources)
+
+    def test_collect_resource_urls_walks_raw_payloads(self):
+        """URLs are collected from nested dicts and lists alike."""
+        payload = {"a": {"name": "x", "url": "https://pokeapi.co/api/v2/type/1/"}, "b": [{"url": "https://pokeapi.co/api/v2/type/1/"}]}
+
+        assert collect_resource_urls(payload) == ["https://pokeapi.co/api/v2/type/1/"] * 2
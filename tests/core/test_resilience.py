@@ -0,0 +1,252 @@
+"""
+Tests for retries, the retry budget and the circuit breaker.
+"""
+
+import random
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.cassette import CassetteMissError, RecordedResponse
+from src.core.resilience import CircuitBreaker, CircuitOpenError, HTTPError, Resilience, RetryBudget, RetryPolicy, parse_retry_after
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+def response(status: int, headers=None) -> RecordedResponse:
+    return RecordedResponse(status, "http://api.test/pokemon/1", headers or {}, b"{}")
+
+
+def scripted(*outcomes):
+    """send() callable returning (or raising) the given outcomes in order."""
+    remaining = list(outcomes)
+
+    def send():
+        outcome = remaining.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+    return send
+
+
+def resilience(**policy) -> Resilience:
+    sleeps = []
+    instance = Resilience(RetryPolicy(**policy), RetryBudget(), CircuitBreaker(), sleep=sleeps.append, seed=1)
+    instance.sleeps = sleeps
+    return instance
+
+
+@pytest.mark.unit
+class TestRetryPolicies:
+    """Test class for backoff, Retry-After parsing and the retry budget."""
+
+    def test_decorrelated_jitter_bounds(self):
+        """Delays stay between the base delay, 3x the previous delay and the cap."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+        rng = random.Random(5)
+        delay = policy.base_delay
+        for _ in range(50):
+            next_delay = policy.backoff(delay, rng)
+            assert policy.base_delay <= next_delay <= min(2.0, delay * 3)
+            delay = next_delay
+
+    def test_parse_retry_after(self):
+        """Delta-seconds and HTTP dates are understood; junk is ignored."""
+        assert parse_retry_after({"retry-after": "3"}) == 3.0
+        assert parse_retry_after({"retry-after": formatdate(time.time() + 60, usegmt=True)}) == pytest.approx(60, abs=2)
+        assert parse_retry_after({"retry-after": "soon"}) is None
+        assert parse_retry_after({}) is None
+
+    def test_retry_budget(self):
+        """The reserve is spent by retries and refilled by requests at the ratio."""
+        budget = RetryBudget(ratio=0.5, min_retries=2)
+        assert budget.withdraw() and budget.withdraw()
+        assert not budget.withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test class for circuit breaker state transitions."""
+
+    def test_open_half_open_close(self):
+        """Consecutive failures open the circuit; one probe is allowed after the timeout."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("http://api.test/")
+
+        now[0] = 10.0
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # only one probe at a time
+
+        breaker.release_probe()  # the probe failed for a reason unrelated to the API
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        now[0] = 20.0
+        breaker.before_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+
+@pytest.mark.unit
+class TestResilienceExecute:
+    """Test class for retry classification."""
+
+    def test_retries_server_errors(self):
+        """5xx and 429 responses are retried until a success."""
+        policy = resilience(max_attempts=4)
+        result = policy.execute(scripted(response(503), response(429), response(200)), "u")
+
+        assert result.status == 200
+        assert policy.stats.retries == 2 and len(policy.sleeps) == 2
+
+    def test_not_found_is_not_retried(self):
+        """Client errors are returned immediately and count as breaker successes."""
+        policy = resilience()
+        assert policy.execute(scripted(response(404)), "u").status == 404
+        assert policy.stats.retries == 0 and policy.breaker.failures == 0
+
+    def test_honors_retry_after(self):
+        """Retry-After replaces the backoff delay; values above the cap stop retrying."""
+        policy = resilience()
+        policy.execute(scripted(response(429, {"retry-after": "2"}), response(200)), "u")
+        assert policy.sleeps == [2.0]
+
+        policy = resilience(max_retry_after=1)
+        assert policy.execute(scripted(response(503, {"retry-after": "120"})), "u").status == 503
+        assert policy.sleeps == []
+
+    def test_connection_errors_exhaust_attempts(self):
+        """Connection errors are retried, then the last one is raised."""
+        policy = resilience(max_attempts=3)
+        with pytest.raises(ConnectionError, match="third"):
+            policy.execute(scripted(ConnectionError("first"), ConnectionError("second"), ConnectionError("third")), "u")
+        assert policy.stats.retries == 2
+
+    def test_breaker_counts_requests_not_attempts(self):
+        """Retries of one request count once; a request let through finishes its retries."""
+        policy = Resilience(RetryPolicy(max_attempts=3), RetryBudget(), CircuitBreaker(failure_threshold=2), sleep=lambda seconds: None)
+
+        def always_503():
+            return response(503)
+
+        assert policy.execute(always_503, "u").status == 503
+        assert (policy.breaker.failures, policy.breaker.state) == (1, CircuitBreaker.CLOSED)
+        assert policy.execute(always_503, "u").status == 503
+        assert policy.breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            policy.execute(always_503, "u")
+        assert (policy.stats.retries, policy.stats.short_circuited) == (4, 1)
+
+    def test_throttling_does_not_close_half_open_circuit(self):
+        """A 429 probe neither closes nor reopens the circuit; the next request probes again."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        policy = Resilience(RetryPolicy(max_attempts=1), RetryBudget(), breaker, sleep=lambda seconds: None)
+        breaker.record_failure()
+        now[0] = 10.0
+
+        assert policy.execute(scripted(response(429)), "u").status == 429
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert policy.execute(scripted(response(200)), "u").status == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_other_errors_are_not_retried(self):
+        """Errors that are not transport failures are raised at once and leave the breaker alone."""
+        policy = resilience(max_attempts=3)
+        for error in (CassetteMissError("GET /pokemon/2"), TypeError("bad argument")):
+            with pytest.raises(type(error)):
+                policy.execute(scripted(error, response(200)), "u")
+
+        assert policy.stats.retries == 0 and policy.sleeps == []
+        assert policy.breaker.failures == 0 and policy.breaker.state == CircuitBreaker.CLOSED
+
+    def test_retryable_http_errors(self):
+        """An HTTPError with a retryable status is retried like the response itself."""
+        policy = resilience(max_attempts=3)
+        assert policy.execute(scripted(HTTPError(503, "u"), response(200)), "u").status == 200
+        with pytest.raises(HTTPError):
+            policy.execute(scripted(HTTPError(404, "u"), response(200)), "u")
+        assert policy.stats.retries == 1
+
+    def test_stats_are_thread_safe(self):
+        """Counters stay exact when one instance is used from many threads."""
+        policy = Resilience(RetryPolicy(max_attempts=2), RetryBudget(ratio=1, min_retries=1000), CircuitBreaker(failure_threshold=10**6), sleep=lambda seconds: None)
+
+        def run(_):
+            policy.execute(scripted(response(503), response(200)), "u")
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(run, range(400)))
+        assert (policy.stats.requests, policy.stats.retries) == (400, 400)
+
+    def test_budget_limits_retries(self):
+        """Without budget tokens failures are returned without retrying."""
+        policy = Resilience(RetryPolicy(max_attempts=5), RetryBudget(ratio=0, min_retries=1), CircuitBreaker(failure_threshold=100), sleep=lambda seconds: None)
+
+        assert policy.execute(scripted(response(500), response(500)), "u").status == 500
+        assert policy.execute(scripted(response(500)), "u").status == 500
+        assert policy.stats.retries == 1 and policy.stats.budget_exhausted == 2
+
+
+def closed_port() -> int:
+    """A local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.unit
+class TestClientResilience:
+    """Test class for resilience in BaseAPIClient."""
+
+    def test_transient_errors_are_retried(self, stub_api_request_context):
+        """Injected 5xx responses are retried transparently."""
+        faults = FaultProfile(error_rate=0.5, seed=3)
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=faults) as server:
+            policy = Resilience(RetryPolicy(max_attempts=6), sleep=lambda seconds: None)
+            client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, resilience=policy)
+
+            assert [client.get(f"/pokemon/{i}")["id"] for i in range(1, 6)] == [1, 2, 3, 4, 5]
+            assert policy.stats.retries > 0
+            assert server.stats.statuses.get(500, 0) + server.stats.statuses.get(503, 0) == policy.stats.retries
+
+    def test_errors_are_typed(self, stub_api_request_context, stub_server):
+        """Non-OK responses raise HTTPError carrying the status."""
+        client = BaseAPIClient(stub_api_request_context, base_url=stub_server.base_url)
+
+        with pytest.raises(HTTPError, match="HTTP 404") as error:
+            client.get("/pokemon/999999")
+        assert error.value.status == 404
+
+    def test_dead_endpoint_fails_fast(self, stub_api_request_context):
+        """Once the breaker opens, requests fail without touching the network."""
+        policy = Resilience(RetryPolicy(max_attempts=1), breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        client = BaseAPIClient(stub_api_request_context, base_url=f"http://127.0.0.1:{closed_port()}/api/v2", resilience=policy)
+
+        for _ in range(2):
+            with pytest.raises(Exception) as error:
+                client.get("/pokemon/1")
+            assert not isinstance(error.value, CircuitOpenError)
+
+        started = time.perf_counter()
+        with pytest.raises(CircuitOpenError):
+            client.get("/pokemon/1")
+        assert time.perf_counter() - started < 0.05
+        assert policy.stats.short_circuited == 1
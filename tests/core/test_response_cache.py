@@ -0,0 +1,86 @@
+"""
+Tests for the in-process response cache.
+"""
+
+import pytest
+from src.core.response_cache import ResponseCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test class for ResponseCache."""
+
+    def test_key_normalizes_url_and_sorts_params(self):
+        """Equivalent URLs and parameter orders map to the same key."""
+        key_a = ResponseCache.make_key("HTTPS://PokeAPI.co/api/v2/pokemon/", {"offset": 20, "limit": 10})
+        key_b = ResponseCache.make_key("https://pokeapi.co/api/v2/pokemon?limit=10", {"offset": 20})
+
+        assert key_a == key_b == "https://pokeapi.co/api/v2/pokemon?limit=10&offset=20"
+
+    def test_hit_and_miss_counters(self):
+        """Lookups update hit and miss counters."""
+        cache = ResponseCache()
+        cache.put("k", 200, b'{"id": 25}', {"id": 25})
+
+        assert cache.get("k").data == {"id": 25}
+        assert cache.get("missing") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_lru_eviction_by_entry_count(self):
+        """The least recently used entry is evicted when the entry bound is hit."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 200, b"a", "a")
+        cache.put("b", 200, b"b", "b")
+        cache.get("a")
+        cache.put("c", 200, b"c", "c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_byte_size(self):
+        """Entries are evicted to keep the total body size within bounds."""
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", 200, b"123456", "a")
+        cache.put("b", 200, b"123456", "b")
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 6
+        assert cache.get("a") is None
+
+    def test_ttl_expiry(self):
+        """Entries expire once their TTL has elapsed."""
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, clock=clock)
+        cache.put("k", 200, b"{}", {})
+
+        clock.now = 9.9
+        assert cache.get("k") is not None
+        clock.now = 10.0
+        assert cache.get("k") is None
+        assert cache.stats.expirations == 1
+
+    @pytest.mark.parametrize("cache_not_found, expected_cached", [(False, False), (True, True)])
+    def test_negative_caching_is_opt_in(self, cache_not_found: bool, expected_cached: bool):
+        """404 responses are only cached when negative caching is enabled."""
+        cache = ResponseCache(cache_not_found=cache_not_found)
+        cache.put("k", 404, b"", None)
+
+        assert (cache.get("k") is not None) == expected_cached
+
+    def test_server_errors_are_never_cached(self):
+        """5xx responses never enter the cache."""
+        cache = ResponseCache(cache_not_found=True)
+        cache.put("k", 503, b"", None)
+
+        assert cache.get("k") is None
@@ -0,0 +1,133 @@
+"""
+Tests for the cross-process shared response store.
+"""
+
+import multiprocessing
+import os
+import threading
+import pytest
+from src.core.base_api_client import BaseAPIClient
+from src.core.resilience import HTTPError
+from src.core.shared_store import SharedResponseStore
+from src.server.snapshot import Snapshot
+from src.server.stub_server import run_stub_server
+
+KEYS = [f"http://api.test/api/v2/pokemon/{i}" for i in range(1, 6)]
+
+
+def fill_all(path: str, results) -> None:
+    """Worker process body: read every key through the store, reporting what was fetched."""
+    store = SharedResponseStore(path)
+    for key in KEYS:
+        status, body, fetched = store.fill(key, lambda: (200, str(os.getpid()).encode()))
+        results.put((key, body, fetched))
+    store.close()
+
+
+@pytest.mark.unit
+class TestSharedResponseStore:
+    """Test class for single-writer fills."""
+
+    def test_fill_once(self, tmp_path):
+        """The first fill fetches; later fills (from any instance) read the stored response."""
+        store = SharedResponseStore(tmp_path / "store.sqlite3")
+        other = SharedResponseStore(tmp_path / "store.sqlite3")
+        calls = []
+
+        def fetch():
+            calls.append(None)
+            return 200, b'{"id":1}'
+
+        assert store.fill(KEYS[0], fetch) == (200, b'{"id":1}', True)
+        assert other.fill(KEYS[0], fetch) == (200, b'{"id":1}', False)
+        assert len(calls) == 1 and len(other) == 1
+        assert (store.stats.fills, other.stats.hits) == (1, 1)
+
+    def test_failed_fill_releases_lease(self, tmp_path):
+        """When fetch raises, the lease is released and the next caller fills the key."""
+        store = SharedResponseStore(tmp_path / "store.sqlite3")
+
+        def fail():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            store.fill(KEYS[0], fail)
+        assert store.get(KEYS[0]) is None
+        assert store.fill(KEYS[0], lambda: (200, b"{}"))[2] is True
+
+    def test_waiter_gets_writer_result(self, tmp_path):
+        """A concurrent caller waits for the writer instead of fetching."""
+        path = tmp_path / "store.sqlite3"
+        writer, reader = SharedResponseStore(path), SharedResponseStore(path)
+        started, finish = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            started.set()
+            finish.wait(5)
+            return 200, b"writer"
+
+        thread = threading.Thread(target=writer.fill, args=(KEYS[0], slow_fetch))
+        thread.start()
+        started.wait(5)
+        threading.Timer(0.05, finish.set).start()
+
+        assert reader.fill(KEYS[0], lambda: (200, b"reader")) == (200, b"writer", False)
+        thread.join()
+        assert reader.stats.waits == 1 and reader.stats.wait_time > 0
+
+    def test_expired_lease_is_taken_over(self, tmp_path):
+        """A writer that holds its lease too long is replaced."""
+        path = tmp_path / "store.sqlite3"
+        stuck = SharedResponseStore(path, lease_timeout=0.05)
+        store = SharedResponseStore(path, lease_timeout=0.05)
+        started, finish = threading.Event(), threading.Event()
+
+        def hang():
+            started.set()
+            finish.wait(5)
+            return 200, b"late"
+
+        thread = threading.Thread(target=stuck.fill, args=(KEYS[0], hang))
+        thread.start()
+        started.wait(5)
+        try:
+            assert store.fill(KEYS[0], lambda: (200, b"fresh")) == (200, b"fresh", True)
+            assert store.stats.takeovers == 1
+        finally:
+            finish.set()
+            thread.join()
+
+    def test_processes_fetch_each_key_once(self, tmp_path):
+        """Across processes, every key is fetched by exactly one of them."""
+        path = str(tmp_path / "store.sqlite3")
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        processes = [context.Process(target=fill_all, args=(path, results)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        outcomes = [results.get(timeout=60) for _ in range(len(processes) * len(KEYS))]
+        for process in processes:
+            process.join(timeout=60)
+
+        assert sum(fetched for _, _, fetched in outcomes) == len(KEYS)
+        for key in KEYS:
+            assert len({body for k, body, _ in outcomes if k == key}) == 1
+
+
+@pytest.mark.unit
+class TestClientSharedStore:
+    """Test class for the shared store in BaseAPIClient."""
+
+    def test_one_request_per_resource(self, stub_api_request_context, tmp_path):
+        """Clients with separate store handles send each request once, 404s included."""
+        path = tmp_path / "store.sqlite3"
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5)) as server:
+            clients = [BaseAPIClient(stub_api_request_context, base_url=server.base_url, shared_store=SharedResponseStore(path)) for _ in range(3)]
+
+            for client in clients:
+                assert [client.get(f"/pokemon/{i}")["id"] for i in range(1, 5)] == [1, 2, 3, 4]
+                with pytest.raises(HTTPError, match="404"):
+                    client.get("/pokemon/999")
+
+        assert server.stats.statuses == {200: 4, 404: 1}
+        assert sum(client.shared_store.stats.hits for client in clients) == 10
@@ -0,0 +1,150 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.core.async_base_api_client import AsyncBaseAPIClient
+from src.core.base_api_client import BaseAPIClient
+from src.core.context_pool import APIRequestContextPool
+from src.core.metrics import REQUESTS, MetricsObserver, MetricsRegistry
+from src.core.single_flight import AsyncSingleFlight, SingleFlight
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, run_stub_server
+
+
+def run_async(coroutine):
+    """Run a coroutine on a fresh thread (sync Playwright may own this thread's loop)."""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test class for coalescing across threads."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Callers arriving while a call runs get its result without running fn."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(None)
+            release.wait(5)
+            return {"id": 1}
+
+        with ThreadPoolExecutor(5) as executor:
+            futures = [executor.submit(flight.do, "k", fn) for _ in range(5)]
+            while flight.stats.calls < 5:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert (flight.stats.calls, flight.stats.coalesced) == (5, 4)
+
+    def test_errors_are_shared_and_keys_released(self):
+        """Joined callers see the leader's error; the next call runs again."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ConnectionError("down")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "k", fail)
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", lambda: "unused")
+            while flight.stats.calls < 2:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ConnectionError):
+                    future.result()
+
+        assert flight.do("k", lambda: "again") == "again"
+
+    def test_async_calls_share_one_task(self):
+        """Concurrent coroutines share one call; cancelling a caller does not cancel it."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+            return "payload"
+
+        async def run():
+            callers = [asyncio.ensure_future(flight.do("k", fn)) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            callers[0].cancel()
+            return await asyncio.gather(*callers[1:])
+
+        assert run_async(run()) == ["payload"] * 3
+        assert len(calls) == 1 and flight.stats.coalesced == 3
+
+    def test_async_call_cancelled_with_last_caller(self):
+        """Once every caller is cancelled, the shared call is cancelled too."""
+        flight = AsyncSingleFlight()
+        cancelled = []
+
+        async def fn():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(None)
+                raise
+
+        async def run():
+            callers = [asyncio.ensure_future(flight.do("k", fn)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.sleep(0)
+            return await flight.do("k", lambda: asyncio.sleep(0, "fresh"))
+
+        assert run_async(run()) == "fresh"
+        assert cancelled == [None]
+
+
+@pytest.mark.unit
+class TestClientCoalescing:
+    """Test class for coalescing in the API clients."""
+
+    def test_threaded_fan_in(self, stub_api_request_context):
+        """Pool workers reading the same resource send one request; the rest are counted as coalesced."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=FaultProfile(latency="fixed:100")) as server, APIRequestContextPool(4) as pool:
+            pool.broadcast(lambda context: None)  # start the workers before timing matters
+            registry = MetricsRegistry()
+            client = BaseAPIClient(stub_api_request_context, base_url=server.base_url, observers=[MetricsObserver(registry)])
+
+            results = pool.map(lambda context, _: client.with_context(context).get("/pokemon/1"), range(4))
+
+        assert all(result.ok and result.data is results[0].data for result in results)
+        assert server.stats.statuses == {200: 1}
+        coalesced = registry.counter(REQUESTS, method="GET", endpoint="/pokemon/{id}", status="200", source="coalesced").value
+        assert coalesced == client.single_flight.stats.coalesced == 3
+
+    def test_async_fan_in(self):
+        """Concurrent async gets of the same URL share one request, 404s included."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=5), faults=FaultProfile(latency="fixed:20")) as server:
+            async def run():
+                async with AsyncBaseAPIClient.open(base_url=server.base_url) as client:
+                    found = await asyncio.gather(*(client.get("/type/1") for _ in range(5)))
+                    missing = await asyncio.gather(*(client.get("/pokemon/999") for _ in range(3)), return_exceptions=True)
+                    return found, missing, client.single_flight.stats
+
+            found, missing, stats = run_async(run())
+
+        assert [payload["id"] for payload in found] == [1] * 5
+        assert all("404" in str(error) for error in missing)
+        assert server.stats.statuses == {200: 1, 404: 1}
+        assert stats.coalesced == 6
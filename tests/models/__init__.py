@@ -0,0 +1 @@
+# Model validation test modules
@@ -0,0 +1,76 @@
+"""
+Tests for flyweight interning of resource reference models.
+"""
+
+import warnings
+import pytest
+from pydantic import ValidationError
+from src.models.base import APIResource, Name, NamedAPIResource
+from src.models.interning import InternTable, intern_table
+
+
+@pytest.fixture
+def fresh_intern_table():
+    """Enable and empty the shared intern table for one test."""
+    enabled = intern_table.enabled
+    intern_table.enabled = True
+    intern_table.clear()
+    yield intern_table
+    intern_table.enabled = enabled
+    intern_table.clear()
+
+
+@pytest.mark.unit
+class TestInterning:
+    """Test class for the intern table and interned base models."""
+
+    def test_equal_references_share_one_instance(self, fresh_intern_table):
+        """Equal name/url pairs validate to the same object, also when embedded."""
+        ref = {"name": "english", "url": "https://pokeapi.co/api/v2/language/9/"}
+
+        first = NamedAPIResource.model_validate(ref)
+        embedded = Name.model_validate({"name": "Pikachu", "language": dict(ref)})
+
+        assert embedded.language is first
+        assert NamedAPIResource.model_validate({**ref, "name": "fr"}) is not first
+        assert APIResource.model_validate({"url": ref["url"]}) is not first
+        stats = fresh_intern_table.stats()
+        assert (stats.hits, stats.misses) == (1, 3)
+        assert stats.approx_bytes_saved > 0
+
+    def test_interned_instances_are_immutable(self, fresh_intern_table):
+        """Shared instances cannot be mutated through one of their users."""
+        resource = NamedAPIResource(name="pikachu", url="https://pokeapi.co/api/v2/pokemon/25/")
+
+        with pytest.raises(ValidationError):
+            resource.name = "raichu"
+
+    def test_direct_construction_builds_new_instances(self, fresh_intern_table):
+        """Keyword construction always fills a new instance, even for interned data."""
+        ref = {"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon/25/"}
+        shared = NamedAPIResource.model_validate(ref)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            first, second = NamedAPIResource(**ref), NamedAPIResource(**ref)
+
+        assert (second.name, second.url) == (first.name, first.url) == (ref["name"], ref["url"])
+        assert first is not second and first is not shared
+        assert NamedAPIResource.model_validate(ref) is shared
+
+    def test_invalid_data_is_not_interned(self, fresh_intern_table):
+        """Data that is not a complete string mapping goes through normal validation."""
+        with pytest.raises(ValidationError):
+            NamedAPIResource.model_validate({"name": "pikachu"})
+        assert len(fresh_intern_table) == 0
+
+    def test_entries_are_weak(self):
+        """Entries vanish once no model references them; disabled tables always build."""
+        table = InternTable()
+        table.get_or_create("key", lambda: NamedAPIResource(name="a", url="b"))
+        assert len(table) == 0
+
+        table.enabled = False
+        kept = table.get_or_create("key", lambda: NamedAPIResource(name="a", url="b"))
+        assert table.get_or_create("key", lambda: NamedAPIResource(name="a", url="b")) is not kept
+        assert table.stats().hits == 0
@@ -0,0 +1,68 @@
+"""
+Tests for the lazily validated Pokémon model.
+"""
+
+import pytest
+from pydantic import ValidationError
+from src.models.pokemon import LazyPokemon, Pokemon, PokemonMove, PokemonSprites
+from src.server.snapshot import Snapshot
+
+
+@pytest.fixture(scope="module")
+def pikachu_data():
+    """Raw pikachu payload from a small synthetic snapshot."""
+    return Snapshot.synthetic(pokemon_count=30).resources["pokemon/25"]
+
+
+@pytest.mark.unit
+class TestLazyPokemon:
+    """Test class for LazyPokemon."""
+
+    def test_heavy_fields_validate_on_first_access(self, pikachu_data):
+        """Core fields are validated up front; moves and sprites only when read, then cached."""
+        pokemon = LazyPokemon.model_validate(pikachu_data)
+
+        assert pokemon.name == "pikachu"
+        assert pokemon.pending_fields == ["moves", "sprites"]
+        moves = pokemon.moves
+        assert all(isinstance(move, PokemonMove) for move in moves)
+        assert pokemon.moves is moves
+        assert pokemon.pending_fields == ["sprites"]
+        assert isinstance(pokemon.sprites, PokemonSprites)
+
+    def test_matches_eager_model(self, pikachu_data):
+        """A lazy instance converts to the same data as the eager Pokemon model."""
+        lazy = LazyPokemon.model_validate(pikachu_data)
+
+        assert lazy.to_pokemon() == Pokemon.model_validate(pikachu_data)
+
+    def test_serialization_round_trip(self, pikachu_data):
+        """Dumps include moves and sprites, pending or validated, and validate back to equal data."""
+        pending = LazyPokemon.model_validate(pikachu_data)
+        validated = LazyPokemon.model_validate(pikachu_data, context={"strict": True})
+
+        dumped = pending.model_dump()
+        assert dumped["moves"] == pikachu_data["moves"] and dumped["sprites"] == pikachu_data["sprites"]
+        assert pending.pending_fields == ["moves", "sprites"]
+        eager = Pokemon.model_validate(pikachu_data)
+        for lazy in (pending, validated):
+            assert LazyPokemon.model_validate(lazy.model_dump()).to_pokemon() == eager
+            assert LazyPokemon.model_validate_json(lazy.model_dump_json()).to_pokemon() == eager
+        assert "moves" not in pending.model_dump(exclude={"moves"})
+
+    def test_invalid_moves_fail_only_on_access_unless_strict(self, pikachu_data):
+        """Bad nested data surfaces on access, or immediately in strict mode."""
+        data = {**pikachu_data, "moves": [{"move": {"name": "tackle"}}]}
+
+        pokemon = LazyPokemon.model_validate(data)
+        with pytest.raises(ValidationError):
+            pokemon.moves
+        with pytest.raises(ValidationError):
+            LazyPokemon.model_validate(data, context={"strict": True})
+
+    def test_missing_heavy_field_fails_eagerly(self, pikachu_data):
+        """Deferred fields are still required."""
+        data = {key: value for key, value in pikachu_data.items() if key != "sprites"}
+
+        with pytest.raises(ValidationError, match="sprites"):
+            LazyPokemon.model_validate(data)
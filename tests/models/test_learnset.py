@@ -0,0 +1,65 @@
+"""
+Tests for typed version group details and the columnar learnset.
+"""
+
+import pytest
+from src.models.learnset import Learnset, VERSION_GROUPS
+from src.models.pokemon import LazyPokemon, Pokemon, PokemonMoveVersion
+from src.server.snapshot import Snapshot
+
+
+@pytest.fixture(scope="module")
+def pikachu_data():
+    """Raw pikachu payload from a small synthetic snapshot."""
+    return Snapshot.synthetic(pokemon_count=30).resources["pokemon/25"]
+
+
+def _walk_nested(data, method, version_group):
+    """Reference implementation over the raw nested dicts."""
+    return sorted(
+        {
+            (move["move"]["name"], detail["level_learned_at"])
+            for move in data["moves"]
+            for detail in move["version_group_details"]
+            if detail["move_learn_method"]["name"] == method and detail["version_group"]["name"] == version_group
+        },
+        key=lambda item: (item[1], item[0]),
+    )
+
+
+@pytest.mark.unit
+class TestLearnset:
+    """Test class for PokemonMoveVersion and Learnset."""
+
+    def test_version_group_details_are_typed(self, pikachu_data):
+        """Version group details validate into PokemonMoveVersion models."""
+        pokemon = Pokemon.model_validate(pikachu_data)
+
+        detail = pokemon.moves[0].version_group_details[0]
+        assert isinstance(detail, PokemonMoveVersion)
+        assert detail.level_learned_at >= 0
+
+    def test_queries_match_nested_walk(self, pikachu_data):
+        """Columnar queries return what a walk over the nested dicts returns."""
+        learnset = Pokemon.model_validate(pikachu_data).learnset
+
+        assert len(learnset) == sum(len(move["version_group_details"]) for move in pikachu_data["moves"])
+        for version_group in learnset.version_groups():
+            assert learnset.moves_learned("level-up", version_group) == _walk_nested(pikachu_data, "level-up", version_group)
+
+    def test_lazy_pokemon_builds_learnset_without_validating_moves(self, pikachu_data):
+        """LazyPokemon builds the same learnset from its raw moves."""
+        eager = Pokemon.model_validate(pikachu_data).learnset
+        lazy = LazyPokemon.model_validate(pikachu_data)
+
+        assert lazy.learnset.moves_learned() == eager.moves_learned()
+        assert lazy.learnset is lazy.learnset
+        assert "moves" in lazy.pending_fields
+
+    def test_unknown_names_and_compact_storage(self, pikachu_data):
+        """Unknown methods/version groups match nothing; IDs are shared vocabulary entries."""
+        learnset = Learnset.from_moves(pikachu_data["moves"])
+
+        assert learnset.moves_learned("level-up", "no-such-version-group") == []
+        assert max(learnset.version_group_ids) < len(VERSION_GROUPS)
+        assert learnset.nbytes == len(learnset) * 7
@@ -0,0 +1 @@
+# Local stand-in server test modules
@@ -0,0 +1,100 @@
+"""
+Tests for the local PokéAPI stand-in server.
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+import pytest
+from src.server.snapshot import Snapshot
+from src.server.stub_server import FaultProfile, LatencyDistribution, run_stub_server
+
+
+def _get(url: str, headers: dict = None):
+    """Issue a GET and return (status, headers, body) without raising on HTTP errors."""
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+@pytest.mark.unit
+class TestStubServer:
+    """Test class for the stub server."""
+
+    def test_pagination_links(self, stub_server):
+        """List pages carry count/next/previous links consistent with limit/offset."""
+        status, _, body = _get(f"{stub_server.base_url}/pokemon?limit=10&offset=10")
+        page = json.loads(body)
+
+        assert status == 200
+        assert page["count"] == 1302
+        assert [entry["name"] for entry in page["results"]][0] == "pokemon-11"
+        assert page["next"].endswith("/pokemon?offset=20&limit=10")
+        assert page["previous"].endswith("/pokemon?limit=10")
+
+    def test_lookup_by_id_and_name_match(self, stub_server):
+        """A resource is reachable by ID and by name, with or without trailing slash."""
+        _, _, by_id = _get(f"{stub_server.base_url}/pokemon/25/")
+        _, _, by_name = _get(f"{stub_server.base_url}/pokemon/pikachu")
+
+        assert by_id == by_name
+        assert json.loads(by_id)["name"] == "pikachu"
+
+    def test_etag_revalidation(self, stub_server):
+        """A matching If-None-Match yields 304 with no body."""
+        _, headers, _ = _get(f"{stub_server.base_url}/pokemon/1")
+        status, _, body = _get(f"{stub_server.base_url}/pokemon/1", {"If-None-Match": headers["ETag"]})
+
+        assert status == 304
+        assert body == b""
+
+    @pytest.mark.parametrize("head", [b"GARBAGE\r\n\r\n", b"GET /api/v2/pokemon/1 HTTP/1.1\r\nContent-Length: many\r\n\r\n"])
+    def test_malformed_request_gets_400(self, stub_server, head: bytes):
+        """A malformed request head is answered with 400 and the connection is closed."""
+        address = urlsplit(stub_server.base_url)
+        with socket.create_connection((address.hostname, address.port), timeout=5) as sock:
+            sock.sendall(head)
+            received = b""
+            while chunk := sock.recv(4096):
+                received += chunk
+
+        assert received.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+        assert b"Connection: close" in received
+
+    def test_module_runs_without_warnings(self):
+        """python -m src.server.stub_server does not trip runpy's double-import warning."""
+        result = subprocess.run([sys.executable, "-W", "error::RuntimeWarning", "-m", "src.server.stub_server", "--help"], capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert "RuntimeWarning" not in result.stderr
+
+    def test_throttling_returns_retry_after(self):
+        """Requests beyond the burst are answered with 429 and Retry-After."""
+        faults = FaultProfile(rate_limit=0.5, burst=1)
+        with run_stub_server(Snapshot.synthetic(pokemon_count=3), faults=faults) as server:
+            first, _, _ = _get(f"{server.base_url}/pokemon/1")
+            second, headers, _ = _get(f"{server.base_url}/pokemon/1")
+
+        assert (first, second) == (200, 429)
+        assert int(headers["Retry-After"]) >= 1
+
+    def test_error_injection(self):
+        """An error rate of 1.0 fails every request with an injected 5xx."""
+        with run_stub_server(Snapshot.synthetic(pokemon_count=3), faults=FaultProfile(error_rate=1.0, seed=7)) as server:
+            status, _, _ = _get(f"{server.base_url}/pokemon/1")
+
+        assert status in (500, 503)
+
+    @pytest.mark.parametrize("spec, low, high", [("none", 0.0, 0.0), ("fixed:20", 0.02, 0.02), ("uniform:5:10", 0.005, 0.01)])
+    def test_latency_distributions(self, spec: str, low: float, high: float):
+        """Latency specs produce delays within their bounds (in seconds)."""
+        distribution = LatencyDistribution(spec)
+
+        assert all(low <= distribution.sample() <= high for _ in range(50))
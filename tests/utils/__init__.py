@@ -0,0 +1 @@
+# Utility test modules
@@ -0,0 +1,83 @@
+"""
+Tests for the queued and sampled logging setup.
+"""
+
+import logging
+import threading
+import pytest
+from src.utils.logger import QueueFilter, request_log_enabled, setup_logger, stop_log_listeners
+
+
+class ListHandler(logging.Handler):
+    """Collects formatted messages and the thread that emitted them."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def fresh_logger(request):
+    """A logger with a collecting handler and no propagation."""
+    logger = logging.getLogger(f"tests.logger.{request.node.name}")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.propagate = False
+    yield logger, handler
+    stop_log_listeners()
+    setup_logger(logger.name)
+    logger.handlers.clear()
+
+
+@pytest.mark.unit
+class TestLogger:
+    """Test class for setup_logger queue and sampling modes."""
+
+    def test_queue_mode_moves_handlers_to_listener(self, fresh_logger):
+        """Records reach the logger's handlers through the listener, formatted lazily."""
+        logger, handler = fresh_logger
+        adapter = setup_logger(logger.name, use_queue=True)
+
+        assert [type(f) for f in logger.filters] == [QueueFilter]
+        adapter.info("fetched %s in %d ms", "/pokemon/25", 12)
+        stop_log_listeners()
+
+        assert handler.messages == ["fetched /pokemon/25 in 12 ms"]
+        assert "MainThread" not in handler.threads and logger.filters == []
+
+    def test_queue_mode_propagates_from_listener(self, fresh_logger):
+        """A propagating logger's records reach the parent's handlers on the listener thread."""
+        parent, handler = fresh_logger
+        child = logging.getLogger(f"{parent.name}.client")
+        adapter = setup_logger(child.name, use_queue=True, stream=False)
+
+        adapter.info("fetched %s", "/pokemon/25")
+        stop_log_listeners()
+
+        assert child.propagate is True and child.handlers == []
+        assert handler.messages == ["fetched /pokemon/25"]
+        assert "MainThread" not in handler.threads
+
+    def test_request_sampling(self, fresh_logger):
+        """One request in N is logged; disabled levels are never logged."""
+        logger, _ = fresh_logger
+        setup_logger(logger.name, sample_every=10)
+
+        decisions = [request_log_enabled(logger) for _ in range(100)]
+        assert sum(decisions) == 10
+        assert not request_log_enabled(logger, logging.DEBUG)
+
+        setup_logger(logger.name)
+        assert all(request_log_enabled(logger) for _ in range(5))
+
+    def test_invalid_sampling_rate(self, fresh_logger):
+        """Non-positive sampling rates are rejected."""
+        logger, _ = fresh_logger
+
+        with pytest.raises(ValueError):
+            setup_logger(logger.name, sample_every=0)
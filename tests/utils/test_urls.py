@@ -0,0 +1,25 @@
+"""
+Tests for API URL helpers.
+"""
+
+import pytest
+from src.utils.urls import split_api_url
+
+
+@pytest.mark.unit
+class TestSplitApiUrl:
+    """Test class for turning absolute API links into endpoints."""
+
+    def test_link_on_another_host(self):
+        """Only the path below the API root and the query are kept."""
+        endpoint, params = split_api_url("https://pokeapi.co/api/v2/pokemon?offset=20&limit=20", "http://127.0.0.1:8000/api/v2")
+
+        assert (endpoint, params) == ("/pokemon", {"offset": "20", "limit": "20"})
+        assert split_api_url("http://127.0.0.1:8000/api/v2", "http://127.0.0.1:8000/api/v2/") == ("/", {})
+
+    def test_sibling_prefix_is_not_below_root(self):
+        """A path that merely starts with the root's characters is rejected."""
+        with pytest.raises(ValueError):
+            split_api_url("https://pokeapi.co/api/v20/pokemon", "https://pokeapi.co/api/v2")
+        with pytest.raises(ValueError):
+            split_api_url("https://pokeapi.co/api/v2-beta", "https://pokeapi.co/api/v2")